@@ -0,0 +1,54 @@
+"""Benchmark batched derivative evaluation against the per-point path.
+
+Usage:
+    uv run python benchmarks/bench_derivative_at_points.py
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from math_explorations.calculus.derivatives import (
+    derivative,
+    derivative_at_point,
+    derivative_at_points,
+)
+
+EXPRESSIONS = ["x**3 - 2*x", "sin(x)**2 * exp(-x/4)", "log(exp(x) + 1)"]
+PER_POINT_SAMPLES = 2_000
+BATCH_SIZES = [1_000, 100_000]
+
+
+def _time(func, repeat: int = 3) -> float:
+    """Best wall-clock time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"{'expression':<26} {'points':>8} {'per-point (s)':>14} {'batched (s)':>12} {'speedup':>9}")
+    for expr in EXPRESSIONS:
+        derivative(expr)  # warm the symbolic cache so only evaluation is timed
+        sample = np.linspace(-5, 5, PER_POINT_SAMPLES)
+        per_point = _time(lambda: [derivative_at_point(expr, "x", p) for p in sample], repeat=1)
+        per_point_rate = per_point / PER_POINT_SAMPLES
+
+        for n in BATCH_SIZES:
+            points = np.linspace(-5, 5, n)
+            batched = _time(lambda: derivative_at_points(expr, "x", points))
+            estimated = per_point_rate * n
+            print(f"{expr:<26} {n:>8} {estimated:>14.3f} {batched:>12.5f} {estimated / batched:>8.0f}x")
+
+    print(f"\nper-point times for more than {PER_POINT_SAMPLES} points are extrapolated")
+
+
+if __name__ == "__main__":
+    main()
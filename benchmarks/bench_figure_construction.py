@@ -0,0 +1,65 @@
+"""Benchmark per-figure construction with the registered dark template.
+
+Usage:
+    uv run python benchmarks/bench_figure_construction.py
+"""
+
+import math
+import time
+from pathlib import Path
+
+import numpy as np
+import plotly.graph_objects as go
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from math_explorations.visualization import (
+    DARK_THEME,
+    TEMPLATE_NAME,
+    plot_function,
+    plot_tangent_line,
+    create_secant_to_tangent,
+    animate_limit_process,
+)
+
+REPEAT = 30
+
+
+def _time(func, repeat: int = REPEAT) -> float:
+    """Mean wall-clock time per call after one warm-up, in milliseconds."""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def _curve_figure(**theme) -> go.Figure:
+    """A single 500-point curve with titles, themed via the given layout kwargs."""
+    x = np.linspace(-5, 5, 500)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x, y=np.sin(x), mode="lines", name="f(x)"))
+    fig.update_layout(**theme, title_text="f", xaxis_title_text="x", yaxis_title_text="y")
+    return fig
+
+
+def main() -> None:
+    before = _time(lambda: _curve_figure(**DARK_THEME))
+    after = _time(lambda: _curve_figure(template=TEMPLATE_NAME))
+    print(f"{'figure':<34} {'before (ms)':>12} {'after (ms)':>11} {'speedup':>8}")
+    print(f"{'curve + theme (update_layout)':<34} {before:>12.2f} {after:>11.2f} {before / after:>7.1f}x")
+
+    print(f"\n{'builder':<34} {'ms / figure':>12}")
+    builders = {
+        "plot_function": lambda: plot_function(np.sin),
+        "plot_tangent_line": lambda: plot_tangent_line(np.sin, np.cos, 1.0),
+        "create_secant_to_tangent": lambda: create_secant_to_tangent(np.sin, np.cos, 1.0),
+        "animate_limit_process": lambda: animate_limit_process(math.sin, math.cos, 1.0),
+    }
+    for name, build in builders.items():
+        print(f"{name:<34} {_time(build, repeat=5):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark serialized size of animations with and without frame deltas,
+the projectile animation with a growing vs shared trajectory, and the
+power-rule sweep precomputed vs evaluated client-side.
+
+Usage:
+    uv run python benchmarks/bench_frame_size.py
+"""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import plotly.io as pio
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from math_explorations.visualization import (
+    animate_limit_process,
+    animate_power_rule,
+    animate_projectile_motion,
+    create_secant_to_tangent,
+    create_tangent_line_plot,
+)
+from math_explorations.visualization.streaming import iter_json
+
+
+def _size(build, **kwargs) -> int:
+    """Length of the figure's JSON in bytes."""
+    return len(pio.to_json(build(output="dict", **kwargs)))
+
+
+def main() -> None:
+    builders = {
+        "animate_limit_process": lambda **kw: animate_limit_process(math.sin, math.cos, 1.0, **kw),
+        "create_secant_to_tangent": lambda **kw: create_secant_to_tangent(math.sin, math.cos, 1.0, **kw),
+        "create_tangent_line_plot": lambda **kw: create_tangent_line_plot(math.sin, math.cos, **kw),
+    }
+    print(f"{'builder':<28} {'full (KB)':>10} {'delta (KB)':>11} {'ratio':>7}")
+    for name, build in builders.items():
+        full = _size(build, delta_frames=False)
+        delta = _size(build)
+        print(f"{name:<28} {full / 1024:>10.1f} {delta / 1024:>11.1f} {full / delta:>6.1f}x")
+
+    print(f"\n{'projectile frames':<28} {'growing (KB)':>12} {'shared (KB)':>12}")
+    for num_frames in (50, 200, 1000):
+        growing = _size(animate_projectile_motion, num_frames=num_frames)
+        shared = _size(animate_projectile_motion, num_frames=num_frames, shared_trajectory=True)
+        print(f"{num_frames:<28} {growing / 1024:>12.1f} {shared / 1024:>12.1f}")
+
+    print(f"\n{'power rule steps':<28} {'python (KB)':>12} {'client (KB)':>12}")
+    for num_frames in (50, 200, 1000):
+        n_values = np.linspace(0.5, 5, num_frames)
+        python = _size(animate_power_rule, n_values=n_values)
+        client = len("".join(iter_json(animate_power_rule(n_values=n_values, client_side=True, output="spec"))))
+        print(f"{num_frames:<28} {python / 1024:>12.1f} {client / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
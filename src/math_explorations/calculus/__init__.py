@@ -1,27 +1,98 @@
 """Calculus module - derivatives, limits, and integrals."""
 
 from .derivatives import (
+    differentiate,
     derivative,
     nth_derivative,
+    DerivativeTower,
+    derivative_tower,
     partial_derivative,
     derivative_at_point,
+    derivative_at_points,
     symbolic_derivative_steps,
+    derivative_cache_info,
+    clear_derivative_cache,
 )
+from .batch import StepsResult, batch_derivative_steps
+from .compiled import CompiledFunctionRegistry, function_registry
+from .critical_points import CRITICAL_POINT_KINDS, CriticalPoint, find_critical_points
+from .integrals import RIEMANN_RULES, RiemannSums, riemann_sum, riemann_sums
 from .limits import (
+    LimitResult,
+    compute_limit,
+    limit_cache_info,
+    clear_limit_cache,
     limit,
     limit_definition_derivative,
     secant_slope,
     tangent_slope,
+    NumericDerivative,
+    richardson_slope,
+    secant_slopes_frame,
+    numerical_limit_frame,
 )
 
+from .multivariable import (
+    DerivativeKernel,
+    gradient,
+    jacobian,
+    hessian,
+    compile_kernel,
+    gradient_kernel,
+    jacobian_kernel,
+    hessian_kernel,
+)
+from .parsing import as_expr, as_symbol, parse_cache_info, clear_parse_cache
+from .simplification import SIMPLIFY_STRATEGIES, SimplifyResult, simplify_with_strategy
+
 __all__ = [
+    "differentiate",
     "derivative",
     "nth_derivative",
+    "DerivativeTower",
+    "derivative_tower",
     "partial_derivative",
     "derivative_at_point",
+    "derivative_at_points",
     "symbolic_derivative_steps",
+    "derivative_cache_info",
+    "clear_derivative_cache",
+    "DerivativeKernel",
+    "gradient",
+    "jacobian",
+    "hessian",
+    "compile_kernel",
+    "gradient_kernel",
+    "jacobian_kernel",
+    "hessian_kernel",
+    "StepsResult",
+    "batch_derivative_steps",
+    "as_expr",
+    "as_symbol",
+    "parse_cache_info",
+    "clear_parse_cache",
+    "SIMPLIFY_STRATEGIES",
+    "SimplifyResult",
+    "simplify_with_strategy",
+    "CompiledFunctionRegistry",
+    "function_registry",
+    "LimitResult",
+    "compute_limit",
+    "limit_cache_info",
+    "clear_limit_cache",
     "limit",
     "limit_definition_derivative",
     "secant_slope",
     "tangent_slope",
+    "NumericDerivative",
+    "richardson_slope",
+    "secant_slopes_frame",
+    "numerical_limit_frame",
+    "CRITICAL_POINT_KINDS",
+    "CriticalPoint",
+    "find_critical_points",
+    "RIEMANN_RULES",
+    "RiemannSums",
+    "riemann_sum",
+    "riemann_sums",
 ]
@@ -0,0 +1,121 @@
+"""Parallel step-by-step derivations for large batches of expressions."""
+
+import math
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Sequence
+
+from sympy import Symbol, Expr
+from .derivatives import symbolic_derivative_steps
+from .workers import time_limit
+
+# Default per-expression budget in seconds
+STEPS_TIMEOUT = 30.0
+
+
+@dataclass
+class StepsResult:
+    """Outcome of symbolic_derivative_steps for one input expression."""
+
+    index: int
+    expr: Expr | str
+    steps: list[dict] | None
+    error: str | None
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether the derivation completed."""
+        return self.error is None
+
+
+def _warm_up_worker() -> None:
+    """Pay SymPy's first-call setup cost before any per-item budget starts."""
+    symbolic_derivative_steps("x**2", "x")
+
+
+def _steps_for_chunk(
+    chunk: list[tuple[int, Expr | str]],
+    var: Symbol | str,
+    timeout: float | None,
+) -> list[StepsResult]:
+    """Worker entry point: derive each expression in a chunk independently."""
+    results = []
+    for index, expr in chunk:
+        start = time.perf_counter()
+        try:
+            with time_limit(timeout):
+                steps = symbolic_derivative_steps(expr, var)
+            error = None
+        except TimeoutError:
+            steps, error = None, f"timed out after {timeout}s"
+        except Exception as exc:
+            # Any failure is reported for this item only
+            steps, error = None, f"{type(exc).__name__}: {exc}"
+        results.append(StepsResult(index, expr, steps, error, time.perf_counter() - start))
+    return results
+
+
+def batch_derivative_steps(
+    exprs: Sequence[Expr | str],
+    var: Symbol | str = "x",
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+    timeout: float | None = STEPS_TIMEOUT,
+) -> list[StepsResult]:
+    """
+    Run symbolic_derivative_steps over many expressions in a process pool.
+
+    Expressions are split into chunks so each task amortizes pickling and
+    scheduling overhead. Each expression gets its own time budget, and an
+    expression that fails or times out is reported without affecting the
+    rest of its chunk.
+
+    Args:
+        exprs: Expressions (SymPy or strings) to differentiate
+        var: Variable to differentiate with respect to
+        max_workers: Number of worker processes (defaults to CPU count);
+            1 runs in the current process
+        chunksize: Expressions per task (defaults to ~4 tasks per worker)
+        timeout: Per-expression budget in seconds, or None for no limit
+
+    Returns:
+        One StepsResult per input, in input order
+    """
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive, or None for no limit")
+    items = list(enumerate(exprs))
+    if not items:
+        return []
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(items) / (max_workers * 4)))
+    chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+    results: list[StepsResult | None] = [None] * len(items)
+
+    if max_workers == 1:
+        for chunk in chunks:
+            for result in _steps_for_chunk(chunk, var, timeout):
+                results[result.index] = result
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_up_worker) as pool:
+        futures = {pool.submit(_steps_for_chunk, chunk, var, timeout): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                chunk_results = future.result()
+            except (BrokenProcessPool, pickle.PicklingError) as exc:
+                chunk_results = [
+                    StepsResult(index, expr, None, f"worker failed: {type(exc).__name__}: {exc}", 0.0)
+                    for index, expr in futures[future]
+                ]
+            for result in chunk_results:
+                results[result.index] = result
+
+    return results
@@ -0,0 +1,155 @@
+"""Registry of compiled (lambdified) NumPy callables for SymPy expressions."""
+
+import hashlib
+import inspect
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+import sympy as sp
+from sympy import Symbol, Expr, lambdify
+from .cache import CacheInfo, LRUCache
+
+# Name lambdify gives the function in its generated source
+_GENERATED_NAME = "_lambdifygenerated"
+
+
+@dataclass
+class CompiledFunction:
+    """A lambdified callable together with how it was produced."""
+
+    func: Callable
+    source: str
+    compile_time: float
+    from_disk: bool = False
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+
+class CompiledFunctionRegistry:
+    """
+    Cache of lambdified callables keyed on (expression, variables, modules).
+
+    Repeated requests for the same expression return the same callable
+    object. When ``cache_dir`` is set, the generated source is written to
+    disk so a fresh process can rebuild the callable without lambdify.
+
+    Args:
+        maxsize: Maximum number of callables kept in memory
+        cache_dir: Optional directory for persisting generated source
+    """
+
+    def __init__(self, maxsize: int = 256, cache_dir: Path | None = None):
+        self.cache_dir = cache_dir
+        self._cache = LRUCache(maxsize)
+        self._namespaces: dict[tuple[str, ...], dict] = {}
+
+    def get(
+        self,
+        expr: Expr | sp.MatrixBase,
+        vars: Symbol | Sequence[Symbol],
+        modules: Sequence[str] = ("numpy",),
+    ) -> CompiledFunction:
+        """
+        Return the compiled entry for an expression, compiling on a miss.
+
+        Args:
+            expr: SymPy expression (or matrix) to compile
+            vars: Argument symbol, or sequence of symbols in call order
+            modules: Modules passed to lambdify
+
+        Returns:
+            CompiledFunction holding the callable and its compile time
+        """
+        if isinstance(expr, sp.MatrixBase):
+            # Mutable matrices are unhashable; key on an immutable copy
+            expr = sp.ImmutableMatrix(expr)
+        args = (vars,) if isinstance(vars, Symbol) else tuple(vars)
+        modules = (modules,) if isinstance(modules, str) else tuple(modules)
+        key = (expr, args, modules)
+        return self._cache.get_or_compute(key, lambda: self._build(expr, args, modules))
+
+    def compile(
+        self,
+        expr: Expr | sp.MatrixBase,
+        vars: Symbol | Sequence[Symbol],
+        modules: Sequence[str] = ("numpy",),
+    ) -> Callable:
+        """Return the cached NumPy callable for an expression."""
+        return self.get(expr, vars, modules).func
+
+    def compile_times(self) -> dict[tuple, float]:
+        """Return compile time in seconds for each cached entry, keyed by (expr, args, modules)."""
+        return {key: entry.compile_time for key, entry in self._cache.items()}
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters and current size."""
+        return self._cache.info()
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (persisted source is kept)."""
+        self._cache.clear()
+
+    def _build(
+        self,
+        expr: Expr,
+        args: tuple[Symbol, ...],
+        modules: tuple[str, ...],
+    ) -> CompiledFunction:
+        path = self._source_path(expr, args, modules)
+        if path is not None and path.exists():
+            start = time.perf_counter()
+            source = path.read_text()
+            func = self._exec_source(source, modules)
+            return CompiledFunction(func, source, time.perf_counter() - start, from_disk=True)
+
+        start = time.perf_counter()
+        func = lambdify(args, expr, modules=list(modules))
+        elapsed = time.perf_counter() - start
+        source = inspect.getsource(func)
+
+        if path is not None and self._is_portable(func, args, modules):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source)
+
+        return CompiledFunction(func, source, elapsed)
+
+    def _source_path(
+        self,
+        expr: Expr,
+        args: tuple[Symbol, ...],
+        modules: tuple[str, ...],
+    ) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        key = f"{sp.srepr(expr)}|{sp.srepr(args)}|{','.join(modules)}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return Path(self.cache_dir) / f"{digest}.py"
+
+    def _namespace(self, modules: tuple[str, ...]) -> dict:
+        """Globals lambdify would use for these modules, built once per process."""
+        if modules not in self._namespaces:
+            self._namespaces[modules] = dict(lambdify((), 0, modules=list(modules)).__globals__)
+        return self._namespaces[modules]
+
+    def _is_portable(
+        self,
+        func: Callable,
+        args: tuple[Symbol, ...],
+        modules: tuple[str, ...],
+    ) -> bool:
+        """Check the generated code only relies on the plain module namespace."""
+        extra = set(func.__globals__) - set(self._namespace(modules))
+        return extra <= {str(arg) for arg in args}
+
+    def _exec_source(self, source: str, modules: tuple[str, ...]) -> Callable:
+        namespace = dict(self._namespace(modules))
+        local_vars: dict = {}
+        exec(compile(source, f"<{_GENERATED_NAME}>", "exec"), namespace, local_vars)
+        return local_vars[_GENERATED_NAME]
+
+
+# Shared registry used by create_function and create_derivative_function
+function_registry = CompiledFunctionRegistry()
@@ -0,0 +1,164 @@
+"""Locate and classify critical points of a function on an interval."""
+
+from typing import Callable, NamedTuple
+import numpy as np
+from scipy.optimize import brentq, newton
+from .limits import richardson_slope
+
+# Possible values of CriticalPoint.kind
+CRITICAL_POINT_KINDS = ("maximum", "minimum", "inflection")
+
+# Accept a root when |f'| is below this fraction of max |f'| on the grid
+ROOT_TOLERANCE = 1e-6
+
+# Roots closer than this fraction of the interval width are merged
+MERGE_TOLERANCE = 1e-7
+
+# |f''| below this fraction of max |f''| falls back to the first-derivative test
+# (double roots are only located to about sqrt(machine epsilon))
+CURVATURE_TOLERANCE = 1e-6
+
+
+class CriticalPoint(NamedTuple):
+    """A zero of f' with its value, curvature and classification."""
+
+    x: float
+    y: float
+    second_derivative: float
+    kind: str
+
+
+def _values(f: Callable[[np.ndarray], np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Evaluate a vectorized f, turning undefined results into NaN."""
+    with np.errstate(all="ignore"):
+        y = np.broadcast_to(np.asarray(f(x), dtype=float), np.shape(x))
+    return np.where(np.isfinite(y), y, np.nan)
+
+
+def _bracketed_roots(f_prime: Callable, x: np.ndarray, slope: np.ndarray) -> list[float]:
+    """Refine every sign change of f' on the grid with Brent's method."""
+    signs = np.sign(slope)
+    roots = list(x[signs == 0])
+    for i in np.flatnonzero(signs[:-1] * signs[1:] < 0):
+        roots.append(brentq(lambda v: float(_values(f_prime, v)), x[i], x[i + 1]))
+    return roots
+
+
+def _touching_roots(
+    f_prime: Callable,
+    f_double_prime: Callable | None,
+    x: np.ndarray,
+    slope: np.ndarray,
+) -> list[float]:
+    """
+    Find zeros where f' touches the axis without changing sign (double roots).
+
+    Local minima of |f'| whose neighbours share a sign are refined together
+    with a vectorized Newton iteration (secant when f'' is not given) and
+    kept if they stay between those neighbours.
+    """
+    magnitude = np.abs(slope)
+    inner = np.arange(1, len(x) - 1)
+    candidate = inner[
+        (magnitude[inner] < magnitude[inner - 1])
+        & (magnitude[inner] <= magnitude[inner + 1])
+        & (np.sign(slope[inner - 1]) == np.sign(slope[inner + 1]))
+        & (slope[inner] != 0)
+    ]
+    if candidate.size == 0:
+        return []
+
+    fprime = (lambda v: _values(f_double_prime, v)) if f_double_prime is not None else None
+    with np.errstate(all="ignore"):
+        result = newton(
+            lambda v: _values(f_prime, v),
+            x[candidate],
+            fprime=fprime,
+            maxiter=100,
+            full_output=True,
+            disp=False,
+        )
+    # A single starting point takes scipy's scalar path, which reports differently
+    if candidate.size == 1:
+        roots, converged = np.array([result[0]]), np.array([result[1].converged])
+    else:
+        roots, converged = result[0], result[1]
+    inside = (x[candidate - 1] <= roots) & (roots <= x[candidate + 1])
+    return list(roots[converged & inside])
+
+
+def _classify(second: float, left: float, right: float, curvature_scale: float) -> str:
+    """Second-derivative test, falling back to the signs of f' around the point."""
+    if abs(second) > CURVATURE_TOLERANCE * curvature_scale:
+        return "maximum" if second < 0 else "minimum"
+    if left > 0 > right:
+        return "maximum"
+    if left < 0 < right:
+        return "minimum"
+    return "inflection"
+
+
+def find_critical_points(
+    f: Callable[[np.ndarray], np.ndarray],
+    f_prime: Callable[[np.ndarray], np.ndarray],
+    f_double_prime: Callable[[np.ndarray], np.ndarray] | None = None,
+    x_range: tuple[float, float] = (-3, 3),
+    num_points: int = 300,
+) -> list[CriticalPoint]:
+    """
+    Find the critical points of f on an interval.
+
+    f' is evaluated once on a grid. Sign changes are refined with Brent's
+    method and points where f' touches zero without crossing (double roots
+    such as x = 0 for x**3) with Newton's method. Candidates where |f'| is
+    not actually small (poles of f') are discarded and near-duplicates
+    merged. Each point is classified by the sign of f'' and, where f'' is
+    zero, by the signs of f' on either side.
+
+    Args:
+        f: Vectorized function (accepts and returns NumPy arrays)
+        f_prime: Vectorized first derivative
+        f_double_prime: Vectorized second derivative (estimated from f' by
+            Richardson extrapolation if omitted)
+        x_range: Interval to search
+        num_points: Grid points used to bracket roots
+
+    Returns:
+        CriticalPoints sorted by x
+    """
+    a, b = x_range
+    x = np.linspace(a, b, num_points)
+    slope = _values(f_prime, x)
+    finite = np.isfinite(slope)
+    if not finite.any():
+        return []
+    slope_scale = float(np.max(np.abs(slope[finite])))
+    if slope_scale == 0:
+        # f is constant: every point is critical and none is isolated
+        return []
+
+    candidates = np.sort(np.array(
+        _bracketed_roots(f_prime, x, slope) + _touching_roots(f_prime, f_double_prime, x, slope)
+    ))
+    candidates = candidates[np.abs(_values(f_prime, candidates)) <= ROOT_TOLERANCE * slope_scale]
+    if candidates.size == 0:
+        return []
+    keep = np.concatenate(([True], np.diff(candidates) > MERGE_TOLERANCE * (b - a)))
+    roots = candidates[keep]
+
+    if f_double_prime is not None:
+        second = _values(f_double_prime, roots)
+    else:
+        second = np.asarray(richardson_slope(f_prime, roots).slope, dtype=float)
+    with np.errstate(all="ignore"):
+        curvature_scale = float(np.nanmax(np.abs(np.gradient(slope, x)), initial=0.0)) or 1.0
+
+    step = (b - a) / (num_points - 1) / 2
+    left = _values(f_prime, roots - step)
+    right = _values(f_prime, roots + step)
+    values = _values(f, roots)
+
+    return [
+        CriticalPoint(float(r), float(y), float(d2), _classify(d2, lo, hi, curvature_scale))
+        for r, y, d2, lo, hi in zip(roots, values, second, left, right)
+    ]
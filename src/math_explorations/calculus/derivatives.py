@@ -1,29 +1,263 @@
 """Symbolic derivative computations using SymPy."""
 
-from typing import Callable
+import time
+from dataclasses import replace
+from typing import Callable, Iterator, Sequence
+import mpmath
+import numpy as np
 import sympy as sp
-from sympy import Symbol, Expr, diff, simplify, latex, lambdify
+from sympy import Symbol, Expr, diff, latex
+from .cache import CacheInfo, LRUCache
+from .compiled import function_registry
+from .parsing import as_expr, as_symbol
+from .simplification import (
+    SIMPLIFY_STRATEGIES,
+    SIMPLIFY_TIMEOUT,
+    SimplifyResult,
+    simplify_with_strategy,
+)
+
+# Maximum number of simplified derivatives kept in memory
+DERIVATIVE_CACHE_SIZE = 512
+
+_derivative_cache = LRUCache(DERIVATIVE_CACHE_SIZE)
+
+
+def _variable_counts(vars: tuple[Symbol, ...]) -> tuple[tuple[Symbol, int], ...]:
+    """Collapse repeated consecutive variables into (variable, order) pairs."""
+    counts: list[list] = []
+    for var in vars:
+        if counts and counts[-1][0] == var:
+            counts[-1][1] += 1
+        else:
+            counts.append([var, 1])
+    return tuple((var, n) for var, n in counts)
+
+
+def _cached_derivative(
+    expr: Expr,
+    variable_counts: tuple[tuple[Symbol, int], ...],
+    strategy: str = "full",
+    timeout: float = SIMPLIFY_TIMEOUT,
+) -> SimplifyResult:
+    """
+    Differentiate and simplify, memoizing on the canonical expression.
+
+    SymPy expressions are stored in canonical form, so equivalent inputs
+    such as "1 + x**2" and "x**2 + 1" share a cache entry.
+    """
+    if len(variable_counts) == 1:
+        var, n = variable_counts[0]
+        return derivative_tower(expr, var, strategy, timeout).result(n)
+
+    def compute() -> SimplifyResult:
+        start = time.perf_counter()
+        raw = diff(expr, *variable_counts) if variable_counts else expr
+        result = simplify_with_strategy(raw, strategy, timeout)
+        return replace(result, elapsed=time.perf_counter() - start)
 
+    key = (expr, variable_counts, strategy, timeout if strategy == "timed" else None)
+    return _derivative_cache.get_or_compute(key, compute)
 
-def derivative(expr: Expr | str, var: Symbol | str = "x") -> Expr:
+
+class DerivativeTower:
+    """
+    Successive derivatives of an expression, computed one order at a time.
+
+    Order n+1 is obtained with a single ``diff`` of order n, and every order
+    is kept, so walking orders 1..n costs n differentiations in total rather
+    than 1 + 2 + ... + n. The chain holds raw ``diff`` results; a requested
+    order gets the same factor_terms/signsimp tidy-up that ``diff(expr, var,
+    n)`` applies, and then the requested strategy, once.
+
+    Args:
+        expr: SymPy expression (order 0)
+        var: Variable to differentiate with respect to
+        strategy: Simplification strategy applied to each requested order
+        timeout: Budget in seconds for the 'timed' strategy
+    """
+
+    def __init__(
+        self,
+        expr: Expr,
+        var: Symbol,
+        strategy: str = "full",
+        timeout: float = SIMPLIFY_TIMEOUT,
+    ):
+        if strategy not in SIMPLIFY_STRATEGIES:
+            raise ValueError(
+                f"Unknown simplify strategy {strategy!r}, expected one of {SIMPLIFY_STRATEGIES}"
+            )
+        self.expr = expr
+        self.var = var
+        self.strategy = strategy
+        self.timeout = timeout
+        # (unsimplified derivative, seconds spent since order 0) per order
+        self._chain: list[tuple[Expr, float]] = [(expr, 0.0)]
+        self._results: dict[int, SimplifyResult] = {0: SimplifyResult(expr, strategy, "none", 0.0)}
+
+    def __len__(self) -> int:
+        """Number of orders computed so far (including order 0)."""
+        return len(self._chain)
+
+    def __getitem__(self, n: int) -> Expr:
+        return self.result(n).expr
+
+    def __iter__(self) -> Iterator[Expr]:
+        return self.iter_orders()
+
+    def _raw(self, n: int) -> tuple[Expr, float]:
+        """Differentiate up to order n without simplifying."""
+        while len(self._chain) <= n:
+            previous, total = self._chain[-1]
+            start = time.perf_counter()
+            raw = diff(previous, self.var)
+            self._chain.append((raw, total + time.perf_counter() - start))
+        return self._chain[n]
+
+    def result(self, n: int) -> SimplifyResult:
+        """
+        Return the nth derivative with simplification metadata.
+
+        The elapsed time covers every differentiation from order 0 plus the
+        final simplification, including steps shared with lower orders.
+        """
+        if n < 0:
+            raise ValueError("Derivative order must be non-negative")
+        if n not in self._results:
+            raw, total = self._raw(n)
+            start = time.perf_counter()
+            if n > 1:
+                # What sympy.diff does after differentiating more than once
+                raw = sp.factor_terms(sp.signsimp(raw))
+            result = simplify_with_strategy(raw, self.strategy, self.timeout)
+            self._results[n] = replace(result, elapsed=total + time.perf_counter() - start)
+        return self._results[n]
+
+    def iter_orders(self, max_order: int | None = None) -> Iterator[Expr]:
+        """
+        Lazily yield f, f', f'', ... up to max_order (unbounded if None).
+
+        Orders are computed only as the generator is advanced.
+        """
+        n = 0
+        while max_order is None or n <= max_order:
+            yield self[n]
+            n += 1
+
+    def functions(self, max_order: int) -> list[Callable]:
+        """Return NumPy callables for orders 0..max_order."""
+        return [
+            function_registry.compile(self[n], self.var)
+            for n in range(max_order + 1)
+        ]
+
+    def evaluate(self, x: np.ndarray, max_order: int) -> np.ndarray:
+        """
+        Evaluate orders 0..max_order over an array of points.
+
+        Args:
+            x: Points at which to evaluate
+            max_order: Highest derivative order
+
+        Returns:
+            Array of shape (max_order + 1, *x.shape)
+        """
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all="ignore"):
+            rows = [np.broadcast_to(f(x), x.shape) for f in self.functions(max_order)]
+        return np.stack(rows)
+
+
+def derivative_tower(
+    expr: Expr | str,
+    var: Symbol | str = "x",
+    strategy: str = "full",
+    timeout: float = SIMPLIFY_TIMEOUT,
+) -> DerivativeTower:
+    """
+    Return the cached derivative tower for an expression.
+
+    Args:
+        expr: SymPy expression or string
+        var: Variable to differentiate with respect to
+        strategy: Simplification strategy applied to each order
+        timeout: Budget in seconds for the 'timed' strategy
+
+    Returns:
+        DerivativeTower shared by every caller with the same arguments
+    """
+    var = as_symbol(var)
+    expr = as_expr(expr)
+
+    key = ("tower", expr, var, strategy, timeout if strategy == "timed" else None)
+    return _derivative_cache.get_or_compute(
+        key, lambda: DerivativeTower(expr, var, strategy, timeout)
+    )
+
+
+def derivative_cache_info() -> CacheInfo:
+    """Return hit/miss counters and size of the derivative cache."""
+    return _derivative_cache.info()
+
+
+def clear_derivative_cache() -> None:
+    """Empty the derivative cache and reset its counters."""
+    _derivative_cache.clear()
+
+
+def differentiate(
+    expr: Expr | str,
+    *vars: Symbol | str,
+    strategy: str = "full",
+    timeout: float = SIMPLIFY_TIMEOUT,
+) -> SimplifyResult:
+    """
+    Differentiate and report how the result was simplified.
+
+    Args:
+        expr: SymPy expression or string
+        vars: Variables to differentiate with respect to (in order)
+        strategy: Simplification strategy ('none', 'cheap', 'full', 'timed')
+        timeout: Budget in seconds for the 'timed' strategy
+
+    Returns:
+        SimplifyResult with the derivative, the simplification method used
+        and the elapsed time of the original (uncached) computation
+    """
+    expr = as_expr(expr)
+
+    symbols = tuple(as_symbol(var) for var in vars)
+    return _cached_derivative(expr, _variable_counts(symbols), strategy, timeout)
+
+
+def derivative(
+    expr: Expr | str,
+    var: Symbol | str = "x",
+    strategy: str = "full",
+) -> Expr:
     """
     Compute the derivative of an expression.
 
     Args:
         expr: SymPy expression or string to differentiate
         var: Variable to differentiate with respect to
+        strategy: Simplification strategy ('none', 'cheap', 'full', 'timed')
 
     Returns:
         The derivative as a SymPy expression
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
-    return simplify(diff(expr, var))
+    var = as_symbol(var)
+    expr = as_expr(expr)
+    return _cached_derivative(expr, ((var, 1),), strategy).expr
 
 
-def nth_derivative(expr: Expr | str, var: Symbol | str = "x", n: int = 1) -> Expr:
+def nth_derivative(
+    expr: Expr | str,
+    var: Symbol | str = "x",
+    n: int = 1,
+    strategy: str = "full",
+) -> Expr:
     """
     Compute the nth derivative of an expression.
 
@@ -31,37 +265,33 @@ def nth_derivative(expr: Expr | str, var: Symbol | str = "x", n: int = 1) -> Exp
         expr: SymPy expression or string to differentiate
         var: Variable to differentiate with respect to
         n: Order of derivative
+        strategy: Simplification strategy ('none', 'cheap', 'full', 'timed')
 
     Returns:
         The nth derivative as a SymPy expression
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
-    return simplify(diff(expr, var, n))
+    var = as_symbol(var)
+    expr = as_expr(expr)
+    return _cached_derivative(expr, ((var, n),) if n else (), strategy).expr
 
 
-def partial_derivative(expr: Expr | str, *vars: Symbol | str) -> Expr:
+def partial_derivative(
+    expr: Expr | str,
+    *vars: Symbol | str,
+    strategy: str = "full",
+) -> Expr:
     """
     Compute partial derivatives with respect to multiple variables.
 
     Args:
         expr: SymPy expression or string
         vars: Variables to differentiate with respect to (in order)
+        strategy: Simplification strategy ('none', 'cheap', 'full', 'timed')
 
     Returns:
         The partial derivative as a SymPy expression
     """
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
-
-    result = expr
-    for var in vars:
-        if isinstance(var, str):
-            var = sp.Symbol(var)
-        result = diff(result, var)
-    return simplify(result)
+    return differentiate(expr, *vars, strategy=strategy).expr
 
 
 def derivative_at_point(
@@ -80,15 +310,60 @@ def derivative_at_point(
     Returns:
         Numerical value of the derivative at the point
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
+    var = as_symbol(var)
+    expr = as_expr(expr)
 
     deriv = derivative(expr, var)
     return float(deriv.subs(var, point))
 
 
+def derivative_at_points(
+    expr: Expr | str,
+    var: Symbol | str = "x",
+    points: np.ndarray | Sequence[float] = (),
+) -> np.ndarray:
+    """
+    Evaluate the derivative at many points in a single vectorized pass.
+
+    The derivative is compiled once through ``function_registry`` and
+    evaluated with NumPy. Only points where the float result is not finite
+    (e.g. intermediate overflow) are re-evaluated with mpmath.
+
+    Args:
+        expr: SymPy expression or string
+        var: Variable to differentiate with respect to
+        points: Array of points at which to evaluate
+
+    Returns:
+        Array of derivative values with the same shape as points
+    """
+    var = as_symbol(var)
+    expr = as_expr(expr)
+
+    points = np.asarray(points, dtype=float)
+    deriv = derivative(expr, var)
+    f = function_registry.compile(deriv, var)
+
+    with np.errstate(all="ignore"):
+        values = np.asarray(f(points))
+    if np.iscomplexobj(values):
+        values = np.where(values.imag == 0, values.real, np.nan)
+    values = np.array(np.broadcast_to(values, points.shape), dtype=float)
+
+    bad = np.flatnonzero(~np.isfinite(values))
+    if bad.size:
+        f_mp = function_registry.compile(deriv, var, ("mpmath",))
+        flat_points = points.reshape(-1)
+        flat_values = values.reshape(-1)
+        for i in bad:
+            try:
+                flat_values[i] = float(f_mp(mpmath.mpf(flat_points[i])))
+            except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+                pass
+
+    return values
+
+
 def symbolic_derivative_steps(expr: Expr | str, var: Symbol | str = "x") -> list[dict]:
     """
     Show step-by-step derivative computation.
@@ -100,10 +375,8 @@ def symbolic_derivative_steps(expr: Expr | str, var: Symbol | str = "x") -> list
     Returns:
         List of dictionaries with 'rule', 'expression', and 'latex' keys
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
+    var = as_symbol(var)
+    expr = as_expr(expr)
 
     steps = []
 
@@ -127,7 +400,7 @@ def symbolic_derivative_steps(expr: Expr | str, var: Symbol | str = "x") -> list
     })
 
     # Simplified form
-    simplified = simplify(deriv)
+    simplified = _cached_derivative(expr, ((var, 1),)).expr
     if simplified != deriv:
         steps.append({
             "rule": "Simplify",
@@ -181,40 +454,52 @@ def _identify_rule(expr: Expr, var: Symbol) -> str:
     return "Differentiation"
 
 
-def create_derivative_function(expr: Expr | str, var: Symbol | str = "x") -> Callable:
+def create_derivative_function(
+    expr: Expr | str,
+    var: Symbol | str = "x",
+    modules: Sequence[str] = ("numpy",),
+) -> Callable:
     """
     Create a numerical function for the derivative.
 
+    The callable is shared through ``function_registry``, so repeated calls
+    with the same expression return the same object without re-lambdifying.
+
     Args:
         expr: SymPy expression or string
         var: Variable
+        modules: Modules passed to lambdify
 
     Returns:
         Callable function that computes the derivative numerically
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
+    var = as_symbol(var)
+    expr = as_expr(expr)
 
     deriv = derivative(expr, var)
-    return lambdify(var, deriv, modules=["numpy"])
+    return function_registry.compile(deriv, var, modules)
 
 
-def create_function(expr: Expr | str, var: Symbol | str = "x") -> Callable:
+def create_function(
+    expr: Expr | str,
+    var: Symbol | str = "x",
+    modules: Sequence[str] = ("numpy",),
+) -> Callable:
     """
     Create a numerical function from a SymPy expression.
 
+    The callable is shared through ``function_registry``, so repeated calls
+    with the same expression return the same object without re-lambdifying.
+
     Args:
         expr: SymPy expression or string
         var: Variable
+        modules: Modules passed to lambdify
 
     Returns:
         Callable function for numerical evaluation
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
+    var = as_symbol(var)
+    expr = as_expr(expr)
 
-    return lambdify(var, expr, modules=["numpy"])
+    return function_registry.compile(expr, var, modules)
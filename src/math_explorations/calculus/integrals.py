@@ -0,0 +1,106 @@
+"""Riemann sums and composite quadrature rules, batched over partition sizes."""
+
+from typing import Callable, NamedTuple, Sequence
+import numpy as np
+
+# Supported values for the ``rule`` argument
+RIEMANN_RULES = ("left", "right", "midpoint", "trapezoid", "simpson")
+
+# Sample positions within a panel (in half-panel units) and their weights.
+# Simpson is applied per panel with its midpoint, so any n is allowed.
+_STENCILS = {
+    "left": (np.array([0]), np.array([1.0])),
+    "right": (np.array([2]), np.array([1.0])),
+    "midpoint": (np.array([1]), np.array([1.0])),
+    "trapezoid": (np.array([0, 2]), np.array([0.5, 0.5])),
+    "simpson": (np.array([0, 1, 2]), np.array([1.0, 4.0, 1.0]) / 6),
+}
+
+
+class RiemannSums(NamedTuple):
+    """Estimates of an integral for several partition sizes."""
+
+    counts: np.ndarray
+    sums: np.ndarray
+    heights: list[np.ndarray]
+    evaluations: int
+
+
+def riemann_sums(
+    f: Callable[[np.ndarray], np.ndarray],
+    a: float,
+    b: float,
+    counts: Sequence[int] | np.ndarray,
+    rule: str = "midpoint",
+) -> RiemannSums:
+    """
+    Approximate the integral of f over [a, b] for many panel counts at once.
+
+    Every sample point is a fraction m / (2n) of the interval; fractions are
+    reduced and deduplicated across all counts and stencil points, so f is
+    called once on the distinct points only (the midpoints of n are the
+    nodes of 2n, n and 2n share every node, and so on).
+
+    Args:
+        f: Vectorized function (accepts and returns NumPy arrays)
+        a: Lower bound
+        b: Upper bound
+        counts: Number of panels for each estimate
+        rule: One of RIEMANN_RULES
+
+    Returns:
+        RiemannSums with, per count, the estimate and the effective height of
+        each panel (estimate = sum(heights) * (b - a) / n), plus the number
+        of distinct points at which f was evaluated
+    """
+    if rule not in RIEMANN_RULES:
+        raise ValueError(f"Unknown rule {rule!r}, expected one of {RIEMANN_RULES}")
+    counts = np.asarray(counts, dtype=np.int64).reshape(-1)
+    if counts.size == 0:
+        return RiemannSums(counts, np.empty(0), [], 0)
+    if counts.min() < 1:
+        raise ValueError("Panel counts must be positive")
+
+    offsets, weights = _STENCILS[rule]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    panel = np.arange(counts.sum()) - np.repeat(starts, counts)
+    denominator = np.repeat(2 * counts, counts)[:, None]
+    numerator = 2 * panel[:, None] + offsets[None, :]
+
+    # Key each reduced fraction p / q as p * scale + q (q < scale)
+    divisor = np.gcd(numerator, denominator)
+    scale = 2 * counts.max() + 1
+    keys = (numerator // divisor) * scale + denominator // divisor
+    unique, inverse = np.unique(keys.reshape(-1), return_inverse=True)
+
+    x = a + (b - a) * (unique // scale) / (unique % scale)
+    with np.errstate(all="ignore"):
+        values = np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+    values = np.where(np.isfinite(values), values, np.nan)
+
+    heights = values[inverse].reshape(-1, len(offsets)) @ weights
+    sums = np.add.reduceat(heights, starts) * (b - a) / counts
+    return RiemannSums(counts, sums, np.split(heights, starts[1:]), len(unique))
+
+
+def riemann_sum(
+    f: Callable[[np.ndarray], np.ndarray],
+    a: float,
+    b: float,
+    n: int,
+    rule: str = "midpoint",
+) -> float:
+    """
+    Approximate the integral of f over [a, b] with n panels.
+
+    Args:
+        f: Vectorized function (accepts and returns NumPy arrays)
+        a: Lower bound
+        b: Upper bound
+        n: Number of panels
+        rule: One of RIEMANN_RULES
+
+    Returns:
+        The estimate
+    """
+    return float(riemann_sums(f, a, b, [n], rule).sums[0])
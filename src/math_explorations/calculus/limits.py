@@ -1,16 +1,172 @@
 """Limit calculations for derivative foundations."""
 
-from typing import Callable
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import Callable, NamedTuple
+import mpmath
 import numpy as np
+import polars as pl
 import sympy as sp
-from sympy import Symbol, Expr, limit as sp_limit, oo, latex
+from sympy import Symbol, Expr, limit as sp_limit, oo, latex, lambdify
+from .cache import CacheInfo, LRUCache
+from .parsing import as_expr, as_symbol
+from .workers import run_with_timeout, time_limit, time_limit_available
+
+# How many times richardson_slope may restart a point with a smaller step
+# (enough to bring the default step from 0.1 down to 1e-12)
+MAX_STEP_REDUCTIONS = 12
+
+# Relative error above which richardson_slope reports a point as unresolved
+# (NaN slope, infinite error) instead of returning a meaningless estimate
+UNRESOLVED_RTOL = 0.1
+
+# Ceiling on richardson_slope's default initial step, so large |x| does not
+# difference across many periods of an oscillating function
+MAX_INITIAL_STEP = 1.0
+
+# Default wall-clock budget (seconds) for a symbolic limit
+LIMIT_TIMEOUT = 10.0
+
+# Maximum number of limit results kept in memory
+LIMIT_CACHE_SIZE = 256
+
+# Working precision and accepted digits for the numeric limit fallback
+NUMERIC_LIMIT_DPS = 40
+NUMERIC_LIMIT_DIGITS = 15
+
+_limit_cache = LRUCache(LIMIT_CACHE_SIZE)
+_quotient_cache = LRUCache(LIMIT_CACHE_SIZE)
+
+
+@dataclass(frozen=True)
+class LimitResult:
+    """A limit value together with the path that produced it."""
+
+    value: Expr
+    method: str
+    elapsed: float
+    cached: bool = False
+
+
+def _numeric_limit(expr: Expr, var: Symbol, point: Expr, direction: str) -> Expr:
+    """
+    Estimate a limit with mpmath's Richardson extrapolation.
+
+    The extrapolation is run with both linear and exponential sampling and
+    only accepted when the two agree; two-sided limits also require the
+    left and right estimates to agree. Otherwise NaN is returned.
+    """
+    f = lambdify(var, expr, modules="mpmath")
+    with mpmath.workdps(NUMERIC_LIMIT_DPS):
+        target = mpmath.inf if point == oo else -mpmath.inf if point == -oo else mpmath.mpf(point)
+        tolerance = mpmath.mpf(10) ** (-NUMERIC_LIMIT_DIGITS)
+
+        def close(a, b) -> bool:
+            return abs(a - b) <= tolerance * max(1, abs(a), abs(b))
+
+        def one_side(sign: int):
+            try:
+                linear = mpmath.limit(f, target, direction=sign)
+                exponential = mpmath.limit(f, target, direction=sign, exp=True)
+            except (ArithmeticError, ValueError, TypeError):
+                return None
+            if mpmath.isfinite(linear) and close(linear, exponential):
+                return linear
+            return None
+
+        if mpmath.isinf(target):
+            sides = [one_side(1)]
+        else:
+            sides = [one_side(1 if side == "+" else -1) for side in direction]
+
+        if any(value is None for value in sides) or not all(close(v, sides[0]) for v in sides):
+            return sp.nan
+        return sp.Float(sides[0], NUMERIC_LIMIT_DIGITS)
+
+
+def compute_limit(
+    expr: Expr | str,
+    var: Symbol | str,
+    point: float | Expr,
+    direction: str = "+-",
+    timeout: float | None = LIMIT_TIMEOUT,
+    isolate: bool = False,
+) -> LimitResult:
+    """
+    Compute a limit with a time budget, a cache and a numeric fallback.
+
+    sympy.limit runs in the current process, interrupted after timeout
+    seconds by a timer alarm. Where alarms are unavailable (outside the main
+    thread) or when isolate is set, it runs in a worker process that is
+    killed instead. If it does not finish, the limit is estimated
+    numerically with high-precision extrapolation (only possible when var
+    is the only free symbol). Results are cached on (expr, var, point,
+    direction), except numeric estimates that could not be determined.
+
+    Args:
+        expr: SymPy expression or string
+        var: Variable approaching the limit
+        point: Value being approached (can be oo for infinity)
+        direction: '+' for right, '-' for left, '+-' for both
+        timeout: Wall-clock budget in seconds, or None for no budget
+        isolate: Always run sympy.limit in a worker process
+
+    Returns:
+        LimitResult with the value, 'symbolic' or 'numeric' as the method,
+        the elapsed time and whether it came from the cache
+
+    Raises:
+        TimeoutError: If the budget runs out and no numeric fallback applies
+    """
+    var = as_symbol(var)
+    expr = as_expr(expr)
+    point = sp.sympify(point)
+
+    key = (expr, var, point, direction)
+    cached = _limit_cache.get(key)
+    if cached is not None:
+        return replace(cached, cached=True)
+
+    start = time.perf_counter()
+    if timeout is None:
+        value, method = sp_limit(expr, var, point, direction), "symbolic"
+    else:
+        try:
+            if isolate or not time_limit_available():
+                value = run_with_timeout(sp_limit, (expr, var, point, direction), timeout)
+            else:
+                with time_limit(timeout):
+                    value = sp_limit(expr, var, point, direction)
+            method = "symbolic"
+        except TimeoutError:
+            if expr.free_symbols - {var}:
+                raise
+            value, method = _numeric_limit(expr, var, point, direction), "numeric"
+
+    result = LimitResult(value, method, time.perf_counter() - start)
+    if value is not sp.nan:
+        _limit_cache.put(key, result)
+    return result
+
+
+def limit_cache_info() -> CacheInfo:
+    """Return hit/miss counters and size of the limit cache."""
+    return _limit_cache.info()
+
+
+def clear_limit_cache() -> None:
+    """Empty the limit cache and reset its counters."""
+    _limit_cache.clear()
 
 
 def limit(
     expr: Expr | str,
     var: Symbol | str,
     point: float | Expr,
-    direction: str = "+-"
+    direction: str = "+-",
+    timeout: float | None = LIMIT_TIMEOUT,
 ) -> Expr:
     """
     Compute the limit of an expression.
@@ -20,22 +176,20 @@ def limit(
         var: Variable approaching the limit
         point: Value being approached (can be oo for infinity)
         direction: '+' for right, '-' for left, '+-' for both
+        timeout: Budget in seconds before falling back to a numeric
+            estimate (see compute_limit)
 
     Returns:
         The limit as a SymPy expression
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
-
-    return sp_limit(expr, var, point, direction)
+    return compute_limit(expr, var, point, direction, timeout).value
 
 
 def limit_definition_derivative(
     expr: Expr | str,
     var: Symbol | str = "x",
-    point: Symbol | str | float | None = None
+    point: Symbol | str | float | None = None,
+    timeout: float | None = LIMIT_TIMEOUT,
 ) -> Expr:
     """
     Compute derivative using limit definition: lim[h→0] (f(x+h) - f(x))/h
@@ -44,16 +198,15 @@ def limit_definition_derivative(
         expr: SymPy expression or string
         var: Variable
         point: Optional point to evaluate at (returns expression if None)
+        timeout: Budget in seconds for the symbolic limit (see compute_limit)
 
     Returns:
         The derivative computed via limit definition
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
+    var = as_symbol(var)
+    expr = as_expr(expr)
 
-    h = sp.Symbol("h")
+    h = as_symbol("h")
 
     # f(x+h)
     f_plus_h = expr.subs(var, var + h)
@@ -61,12 +214,12 @@ def limit_definition_derivative(
     # Difference quotient
     diff_quotient = (f_plus_h - expr) / h
 
-    # Take limit as h → 0
-    deriv = sp_limit(diff_quotient, h, 0)
-
+    # At a point h is the only free symbol, so the numeric fallback applies
     if point is not None:
-        return deriv.subs(var, point)
-    return deriv
+        diff_quotient = diff_quotient.subs(var, point)
+
+    # Take limit as h → 0
+    return compute_limit(diff_quotient, h, 0, "+", timeout).value
 
 
 def secant_slope(
@@ -109,6 +262,137 @@ def tangent_slope(
     return (f(x + h) - f(x - h)) / (2 * h)
 
 
+class NumericDerivative(NamedTuple):
+    """Numerical derivative estimate with its error estimate."""
+
+    slope: np.ndarray | float
+    error: np.ndarray | float
+
+
+def _ridders_tableau(
+    f: Callable[[np.ndarray], np.ndarray],
+    x: np.ndarray,
+    step: np.ndarray,
+    max_iterations: int,
+    step_ratio: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run one Ridders extrapolation tableau for 1-D arrays of points and steps.
+
+    Steps are rounded to be exactly representable around x, so the stencil
+    stays symmetric, and the extrapolation uses the ratios of the rounded
+    steps. Every error estimate is at least the rounding error of f divided
+    by the step.
+    """
+    eps = np.finfo(float).eps
+
+    def central(step: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        with np.errstate(all="ignore"):
+            step = (x + step) - x
+            f_upper, f_lower = np.asarray(f(x + step)), np.asarray(f(x - step))
+            slope = (f_upper - f_lower) / (2 * step)
+            rounding = eps * (np.abs(f_upper) + np.abs(f_lower)) / np.abs(2 * step)
+        return slope, rounding, step
+
+    best = np.full(x.shape, np.nan)
+    error = np.full(x.shape, np.inf)
+    active = np.ones(x.shape, dtype=bool)
+    estimate, _, actual = central(step)
+    previous = [estimate]
+    steps = [actual]
+
+    for i in range(1, max_iterations + 1):
+        step = step / step_ratio
+        estimate, rounding, actual = central(step)
+        steps.append(actual)
+        row = [estimate]
+        for j in range(1, i + 1):
+            with np.errstate(all="ignore"):
+                factor = (steps[i - j] / steps[i]) ** 2
+                row.append(row[j - 1] + (row[j - 1] - previous[j - 1]) / (factor - 1))
+            candidate = np.maximum(np.abs(row[j] - row[j - 1]), np.abs(row[j] - previous[j - 1]))
+            candidate = np.maximum(candidate, rounding)
+            improved = active & (candidate <= error)
+            error = np.where(improved, candidate, error)
+            best = np.where(improved, row[j], best)
+
+        # Higher-order estimates diverging means round-off has taken over
+        active &= ~(np.abs(row[i] - previous[i - 1]) >= 2 * error)
+        previous = row
+        if not active.any():
+            break
+
+    return best, error
+
+
+def richardson_slope(
+    f: Callable[[np.ndarray], np.ndarray],
+    x: np.ndarray | float,
+    h: np.ndarray | float | None = None,
+    rtol: float = 1e-10,
+    max_iterations: int = 10,
+    step_ratio: float = 1.4,
+) -> NumericDerivative:
+    """
+    Approximate the derivative with Richardson extrapolation (Ridders' method).
+
+    Central differences are taken with a shrinking step and extrapolated
+    towards h → 0 in a Neville tableau; each point keeps the estimate with
+    the smallest error. Points whose error estimate is still above rtol
+    (e.g. near a singularity or the edge of the domain) are retried with a
+    ten times smaller starting step, so the step adapts per point; a retry
+    replaces the earlier estimate when its relative error is smaller.
+    Points that end with a relative error above UNRESOLVED_RTOL (such as a
+    pole closer than every step tried) get a NaN slope and infinite error.
+
+    Args:
+        f: Vectorized function (accepts and returns NumPy arrays)
+        x: Point or array of points
+        h: Initial step (defaults to 0.1 * max(|x|, 1), at most
+            MAX_INITIAL_STEP)
+        rtol: Relative error below which a point is accepted
+        max_iterations: Maximum number of step reductions per tableau
+        step_ratio: Factor by which the step shrinks within a tableau
+
+    Returns:
+        NumericDerivative with the slope and error estimate at each point
+    """
+    x_arr = np.asarray(x, dtype=float)
+    flat_x = x_arr.reshape(-1)
+    if h is None:
+        step = np.minimum(0.1 * np.maximum(np.abs(flat_x), 1.0), MAX_INITIAL_STEP)
+    else:
+        step = np.array(np.broadcast_to(h, x_arr.shape), dtype=float).reshape(-1)
+
+    slope = np.full(flat_x.shape, np.nan)
+    error = np.full(flat_x.shape, np.inf)
+    pending = np.arange(flat_x.size)
+
+    def relative(slope: np.ndarray, error: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore"):
+            return error / np.fmax(np.abs(slope), 1.0)
+
+    for _ in range(MAX_STEP_REDUCTIONS):
+        best, err = _ridders_tableau(f, flat_x[pending], step[pending], max_iterations, step_ratio)
+        # A step straddling a pole gives a small slope with a large relative error
+        improved = relative(best, err) < relative(slope[pending], error[pending])
+        slope[pending[improved]] = best[improved]
+        error[pending[improved]] = err[improved]
+
+        pending = pending[~(relative(slope[pending], error[pending]) <= rtol)]
+        if pending.size == 0:
+            break
+        step[pending] /= 10
+
+    unresolved = ~(relative(slope, error) <= UNRESOLVED_RTOL)
+    slope[unresolved] = np.nan
+    error[unresolved] = np.inf
+
+    if x_arr.ndim == 0:
+        return NumericDerivative(float(slope[0]), float(error[0]))
+    return NumericDerivative(slope.reshape(x_arr.shape), error.reshape(x_arr.shape))
+
+
 def secant_slopes_sequence(
     f: Callable[[float], float],
     x: float,
@@ -148,37 +432,128 @@ def secant_slopes_sequence(
     return results
 
 
-def difference_quotient_expression(expr: Expr | str, var: Symbol | str = "x") -> dict:
+def _evaluate_masked(f: Callable[[np.ndarray], np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Evaluate a vectorized f once, turning undefined results into NaN."""
+    with np.errstate(all="ignore"):
+        y = np.asarray(f(x), dtype=float)
+    y = np.broadcast_to(y, x.shape)
+    return np.where(np.isfinite(y), y, np.nan)
+
+
+def secant_slopes_frame(
+    f: Callable[[np.ndarray], np.ndarray],
+    x: float,
+    h_values: np.ndarray | list[float] | None = None,
+) -> pl.DataFrame:
+    """
+    Vectorized secant_slopes_sequence returning a polars DataFrame.
+
+    f is called once on x followed by all x + h values, so very fine h
+    grids are cheap. Points where f is undefined (NaN, ±inf, or h = 0)
+    appear as nulls instead of raising.
+
+    Args:
+        f: Vectorized function (accepts and returns NumPy arrays)
+        x: Base x-coordinate
+        h_values: Array of h values (defaults to the same decreasing sequence)
+
+    Returns:
+        DataFrame with 'h', 'slope', 'x1', 'x2', 'y1', 'y2' columns
+    """
+    if h_values is None:
+        h_values = [1.0, 0.5, 0.25, 0.1, 0.05, 0.01, 0.001, 0.0001]
+    h = np.asarray(h_values, dtype=float)
+
+    x2 = x + h
+    values = _evaluate_masked(f, np.concatenate(([x], x2)))
+    y1, y2 = values[0], values[1:]
+    with np.errstate(all="ignore"):
+        slope = (y2 - y1) / h
+    slope = np.where(np.isfinite(slope), slope, np.nan)
+
+    return pl.DataFrame({
+        "h": h,
+        "slope": pl.Series(slope, nan_to_null=True),
+        "x1": np.full_like(h, x),
+        "x2": x2,
+        "y1": pl.Series(np.full_like(h, y1), nan_to_null=True),
+        "y2": pl.Series(y2, nan_to_null=True),
+    })
+
+
+class DifferenceQuotient(Mapping):
+    """
+    Difference quotient (f(x+h) - f(x)) / h with lazily computed fields.
+
+    Each field is computed on first access and memoized, so reading only
+    'latex_full' never runs simplify, and 'simplified' is simplified once
+    even when 'latex_simplified' is read too. Supports dict-style access
+    with the keys listed in FIELDS.
+    """
+
+    FIELDS = ("numerator", "denominator", "full", "simplified", "latex_full", "latex_simplified")
+
+    def __init__(self, expr: Expr, var: Symbol):
+        self.expr = expr
+        self.var = var
+
+    @cached_property
+    def denominator(self) -> Symbol:
+        return as_symbol("h")
+
+    @cached_property
+    def numerator(self) -> Expr:
+        return self.expr.subs(self.var, self.var + self.denominator) - self.expr
+
+    @cached_property
+    def full(self) -> Expr:
+        return self.numerator / self.denominator
+
+    @cached_property
+    def simplified(self) -> Expr:
+        return sp.simplify(self.full)
+
+    @cached_property
+    def latex_full(self) -> str:
+        return latex(self.full)
+
+    @cached_property
+    def latex_simplified(self) -> str:
+        return latex(self.simplified)
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+
+def difference_quotient_expression(expr: Expr | str, var: Symbol | str = "x") -> DifferenceQuotient:
     """
     Create the difference quotient expression for display.
 
+    The result is shared through a cache, so repeated calls with the same
+    expression reuse fields that were already computed.
+
     Args:
         expr: SymPy expression
         var: Variable
 
     Returns:
-        Dict with 'numerator', 'denominator', 'full', and 'latex' keys
+        DifferenceQuotient with 'numerator', 'denominator', 'full',
+        'simplified', 'latex_full' and 'latex_simplified' keys
     """
-    if isinstance(var, str):
-        var = sp.Symbol(var)
-    if isinstance(expr, str):
-        expr = sp.sympify(expr)
-
-    h = sp.Symbol("h")
-    f_plus_h = expr.subs(var, var + h)
+    var = as_symbol(var)
+    expr = as_expr(expr)
 
-    numerator = f_plus_h - expr
-    denominator = h
-    full = numerator / denominator
-
-    return {
-        "numerator": numerator,
-        "denominator": denominator,
-        "full": full,
-        "simplified": sp.simplify(full),
-        "latex_full": latex(full),
-        "latex_simplified": latex(sp.simplify(full)),
-    }
+    return _quotient_cache.get_or_compute(
+        (expr, var), lambda: DifferenceQuotient(expr, var)
+    )
 
 
 def numerical_limit_table(
@@ -219,3 +594,48 @@ def numerical_limit_table(
                 results.append({"x": xi, "f(x)": "undefined", "direction": "right"})
 
     return results
+
+
+def numerical_limit_frame(
+    f: Callable[[np.ndarray], np.ndarray],
+    x: float,
+    approaching: str = "both",
+    offsets: np.ndarray | list[float] | None = None,
+) -> pl.DataFrame:
+    """
+    Vectorized numerical_limit_table returning a polars DataFrame.
+
+    All sample points are evaluated in a single call to f. Undefined values
+    are stored as nulls in 'f(x)' rather than caught one at a time.
+
+    Args:
+        f: Vectorized function (accepts and returns NumPy arrays)
+        x: Point being approached
+        approaching: 'left', 'right', or 'both'
+        offsets: Distances from x (defaults to the same sequence as the table)
+
+    Returns:
+        DataFrame with 'x', 'f(x)' and 'direction' columns
+    """
+    if offsets is None:
+        offsets = [1, 0.5, 0.1, 0.05, 0.01, 0.005, 0.001, 0.0001]
+    offsets = np.asarray(offsets, dtype=float)
+
+    parts_x = []
+    parts_direction = []
+    if approaching in ("left", "both"):
+        parts_x.append(x - offsets[::-1])
+        parts_direction.append(np.full(offsets.size, "left"))
+    if approaching in ("right", "both"):
+        parts_x.append(x + offsets)
+        parts_direction.append(np.full(offsets.size, "right"))
+
+    xs = np.concatenate(parts_x) if parts_x else np.empty(0)
+    directions = np.concatenate(parts_direction) if parts_direction else np.empty(0, dtype=str)
+    ys = _evaluate_masked(f, xs)
+
+    return pl.DataFrame({
+        "x": xs,
+        "f(x)": pl.Series(ys, nan_to_null=True),
+        "direction": pl.Series(directions, dtype=pl.String),
+    })
@@ -0,0 +1,229 @@
+"""Gradients, Jacobians and Hessians compiled into fused NumPy kernels."""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+import sympy as sp
+from sympy import Symbol, Expr, diff, lambdify
+from .cache import LRUCache
+from .parsing import as_expr, as_symbol
+from .simplification import SIMPLIFY_TIMEOUT, simplify_with_strategy
+from .workers import run_with_timeout
+
+# Maximum number of compiled kernels kept in memory
+KERNEL_CACHE_SIZE = 64
+
+_kernel_cache = LRUCache(KERNEL_CACHE_SIZE)
+
+
+@dataclass
+class DerivativeKernel:
+    """
+    A matrix of derivatives evaluated by a single generated NumPy function.
+
+    Common subexpressions across all components are computed once per call.
+    Calling the kernel returns an array of shape ``(*matrix.shape, *s)``
+    where ``s`` is the broadcast shape of the arguments.
+    """
+
+    matrix: sp.ImmutableMatrix
+    vars: tuple[Symbol, ...]
+    func: Callable
+    num_subexpressions: int
+    compile_time: float
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the derivative matrix (without the evaluation axes)."""
+        rows, cols = self.matrix.shape
+        return (rows,) if cols == 1 else (rows, cols)
+
+    def __call__(self, *args) -> np.ndarray:
+        if len(args) != len(self.vars):
+            raise TypeError(f"Expected {len(self.vars)} arguments, got {len(args)}")
+        arrays = [np.asarray(a, dtype=float) for a in args]
+        point_shape = np.broadcast_shapes(*(a.shape for a in arrays))
+        with np.errstate(all="ignore"):
+            values = self.func(*arrays)
+        out = np.empty((len(values), *point_shape))
+        for i, value in enumerate(values):
+            out[i] = np.broadcast_to(value, point_shape)
+        return out.reshape(*self.shape, *point_shape)
+
+
+def _as_symbols(vars: Sequence[Symbol | str]) -> tuple[Symbol, ...]:
+    return tuple(as_symbol(v) for v in vars)
+
+
+def _simplify_all(pieces: list[Expr]) -> list[Expr]:
+    """Worker entry point: sympy.simplify every piece."""
+    return [sp.simplify(piece) for piece in pieces]
+
+
+def _simplified_matrix(entries: list[list[Expr]], strategy: str) -> sp.ImmutableMatrix:
+    """
+    Simplify the entries of a derivative matrix together.
+
+    ``sympy.cse`` splits all entries into shared subexpressions, each piece
+    is simplified once, and the pieces are substituted back. The 'timed'
+    strategy simplifies all pieces in a single worker process.
+    """
+    matrix = sp.ImmutableMatrix(entries)
+    if strategy == "none":
+        return matrix
+    replacements, reduced = sp.cse(list(matrix), symbols=sp.numbered_symbols(cls=sp.Dummy))
+    pieces = [value for _, value in replacements] + reduced
+
+    if strategy == "timed":
+        try:
+            pieces = run_with_timeout(_simplify_all, (pieces,), SIMPLIFY_TIMEOUT)
+        except TimeoutError:
+            pieces = [simplify_with_strategy(piece, "cheap").expr for piece in pieces]
+    else:
+        pieces = [simplify_with_strategy(piece, strategy).expr for piece in pieces]
+
+    substitutions: dict[Symbol, Expr] = {}
+    for (symbol, _), piece in zip(replacements, pieces):
+        substitutions[symbol] = piece.xreplace(substitutions)
+    values = [piece.xreplace(substitutions) for piece in pieces[len(replacements):]]
+    return sp.ImmutableMatrix(*matrix.shape, values)
+
+
+def gradient(
+    expr: Expr | str,
+    vars: Sequence[Symbol | str],
+    strategy: str = "cheap",
+) -> sp.ImmutableMatrix:
+    """
+    Compute the gradient of a scalar expression.
+
+    Args:
+        expr: SymPy expression or string
+        vars: Variables, in the order of the gradient components
+        strategy: Simplification strategy, applied once across all components
+
+    Returns:
+        Column matrix of first partial derivatives
+    """
+    expr = as_expr(expr)
+    symbols = _as_symbols(vars)
+    return _simplified_matrix([[diff(expr, v)] for v in symbols], strategy)
+
+
+def jacobian(
+    exprs: Sequence[Expr | str],
+    vars: Sequence[Symbol | str],
+    strategy: str = "cheap",
+) -> sp.ImmutableMatrix:
+    """
+    Compute the Jacobian of a vector-valued expression.
+
+    Args:
+        exprs: Component expressions (one row each)
+        vars: Variables (one column each)
+        strategy: Simplification strategy, applied once across all entries
+
+    Returns:
+        Matrix J with J[i, j] = d exprs[i] / d vars[j]
+    """
+    symbols = _as_symbols(vars)
+    return _simplified_matrix(
+        [[diff(as_expr(e), v) for v in symbols] for e in exprs], strategy
+    )
+
+
+def hessian(
+    expr: Expr | str,
+    vars: Sequence[Symbol | str],
+    strategy: str = "cheap",
+) -> sp.ImmutableMatrix:
+    """
+    Compute the Hessian of a scalar expression.
+
+    Second partials are taken from the (unsimplified) gradient components
+    and only the upper triangle is differentiated; the lower triangle is
+    mirrored. The whole matrix is then simplified once.
+
+    Args:
+        expr: SymPy expression or string
+        vars: Variables (rows and columns of the Hessian)
+        strategy: Simplification strategy, applied once across all entries
+
+    Returns:
+        Symmetric matrix of second partial derivatives
+    """
+    expr = as_expr(expr)
+    symbols = _as_symbols(vars)
+    grad = [diff(expr, v) for v in symbols]
+    n = len(symbols)
+    entries = [[sp.S.Zero] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i, n):
+            entries[i][j] = diff(grad[i], symbols[j])
+            entries[j][i] = entries[i][j]
+    return _simplified_matrix(entries, strategy)
+
+
+def compile_kernel(
+    matrix: sp.Matrix,
+    vars: Sequence[Symbol | str],
+) -> DerivativeKernel:
+    """
+    Compile every component of a matrix into one NumPy function.
+
+    ``sympy.cse`` runs over all components together, so subexpressions
+    shared between partials are evaluated once per call.
+
+    Args:
+        matrix: Matrix of SymPy expressions
+        vars: Argument symbols, in call order
+
+    Returns:
+        DerivativeKernel returning all components in a single call
+    """
+    matrix = sp.ImmutableMatrix(matrix)
+    symbols = _as_symbols(vars)
+
+    def build() -> DerivativeKernel:
+        start = time.perf_counter()
+        replacements, reduced = sp.cse(list(matrix))
+        func = lambdify(
+            symbols,
+            list(matrix),
+            modules="numpy",
+            cse=lambda _exprs: (replacements, reduced),
+        )
+        return DerivativeKernel(
+            matrix, symbols, func, len(replacements), time.perf_counter() - start
+        )
+
+    return _kernel_cache.get_or_compute((matrix, symbols), build)
+
+
+def gradient_kernel(
+    expr: Expr | str,
+    vars: Sequence[Symbol | str],
+    strategy: str = "cheap",
+) -> DerivativeKernel:
+    """Compile the gradient of expr into a fused kernel (see compile_kernel)."""
+    return compile_kernel(gradient(expr, vars, strategy), vars)
+
+
+def jacobian_kernel(
+    exprs: Sequence[Expr | str],
+    vars: Sequence[Symbol | str],
+    strategy: str = "cheap",
+) -> DerivativeKernel:
+    """Compile the Jacobian of exprs into a fused kernel (see compile_kernel)."""
+    return compile_kernel(jacobian(exprs, vars, strategy), vars)
+
+
+def hessian_kernel(
+    expr: Expr | str,
+    vars: Sequence[Symbol | str],
+    strategy: str = "cheap",
+) -> DerivativeKernel:
+    """Compile the Hessian of expr into a fused kernel (see compile_kernel)."""
+    return compile_kernel(hessian(expr, vars, strategy), vars)
@@ -0,0 +1,55 @@
+"""Shared parsing of string inputs into interned SymPy objects."""
+
+import sympy as sp
+from sympy import Symbol, Expr
+from .cache import CacheInfo, LRUCache
+
+# Maximum number of distinct strings kept in each interning table
+PARSE_CACHE_SIZE = 1024
+
+_expr_cache = LRUCache(PARSE_CACHE_SIZE)
+_symbol_cache = LRUCache(PARSE_CACHE_SIZE)
+
+
+def as_expr(expr: Expr | str) -> Expr:
+    """
+    Return a SymPy expression, parsing strings at most once.
+
+    Parsed strings are interned, so repeated calls with the same text skip
+    the sympify parser and return the identical expression object.
+
+    Args:
+        expr: SymPy expression or string
+
+    Returns:
+        The SymPy expression (non-string inputs are returned unchanged)
+    """
+    if not isinstance(expr, str):
+        return expr
+    return _expr_cache.get_or_compute(expr, lambda: sp.sympify(expr))
+
+
+def as_symbol(var: Symbol | str) -> Symbol:
+    """
+    Return a SymPy Symbol, reusing a single instance per name.
+
+    Args:
+        var: Symbol or symbol name
+
+    Returns:
+        The Symbol (non-string inputs are returned unchanged)
+    """
+    if not isinstance(var, str):
+        return var
+    return _symbol_cache.get_or_compute(var, lambda: sp.Symbol(var))
+
+
+def parse_cache_info() -> CacheInfo:
+    """Return hit/miss counters and size of the expression interning table."""
+    return _expr_cache.info()
+
+
+def clear_parse_cache() -> None:
+    """Empty both interning tables and reset their counters."""
+    _expr_cache.clear()
+    _symbol_cache.clear()
@@ -0,0 +1,106 @@
+"""Configurable simplification strategies for symbolic results."""
+
+import time
+from dataclasses import dataclass
+
+import sympy as sp
+from sympy import Expr
+from sympy.functions.elementary.trigonometric import TrigonometricFunction
+from .workers import run_with_timeout
+
+# Supported values for the ``strategy`` argument
+SIMPLIFY_STRATEGIES = ("none", "cheap", "full", "timed")
+
+# Default budget (seconds) for the "timed" strategy
+SIMPLIFY_TIMEOUT = 2.0
+
+# Above this operation count trigsimp is no longer considered cheap
+CHEAP_TRIGSIMP_MAX_OPS = 40
+
+
+@dataclass(frozen=True)
+class SimplifyResult:
+    """A simplified expression with metadata about how it was produced."""
+
+    expr: Expr
+    strategy: str
+    method: str
+    elapsed: float
+    timed_out: bool = False
+
+
+def cheap_simplify(expr: Expr) -> tuple[Expr, str]:
+    """
+    Apply one inexpensive rewrite chosen by the shape of the expression.
+
+    Rational functions are cancelled, small trigonometric expressions go
+    through trigsimp, and everything else is expanded. The input is kept
+    if the rewrite does not reduce the operation count.
+
+    Args:
+        expr: SymPy expression
+
+    Returns:
+        Tuple of (expression, name of the rewrite applied)
+    """
+    if not isinstance(expr, sp.Basic) or expr.is_Atom:
+        return expr, "none"
+
+    ops = sp.count_ops(expr)
+    if expr.is_rational_function():
+        method, result = "cancel", sp.cancel(expr)
+    elif expr.has(TrigonometricFunction) and ops <= CHEAP_TRIGSIMP_MAX_OPS:
+        method, result = "trigsimp", sp.trigsimp(expr)
+    else:
+        method, result = "expand", sp.expand(expr)
+
+    if sp.count_ops(result) > ops:
+        return expr, "none"
+    return result, method
+
+
+def simplify_with_strategy(
+    expr: Expr,
+    strategy: str = "full",
+    timeout: float = SIMPLIFY_TIMEOUT,
+) -> SimplifyResult:
+    """
+    Simplify an expression using the requested strategy.
+
+    Strategies:
+        none: return the expression unchanged
+        cheap: one rewrite chosen by cheap_simplify
+        full: sympy.simplify
+        timed: sympy.simplify in a worker process, falling back to the
+            cheap result if it does not finish within timeout seconds
+
+    Args:
+        expr: SymPy expression
+        strategy: One of SIMPLIFY_STRATEGIES
+        timeout: Budget in seconds for the "timed" strategy
+
+    Returns:
+        SimplifyResult with the expression, method used and elapsed time
+    """
+    if strategy not in SIMPLIFY_STRATEGIES:
+        raise ValueError(
+            f"Unknown simplify strategy {strategy!r}, expected one of {SIMPLIFY_STRATEGIES}"
+        )
+
+    start = time.perf_counter()
+    timed_out = False
+
+    if strategy == "none":
+        result, method = expr, "none"
+    elif strategy == "cheap":
+        result, method = cheap_simplify(expr)
+    elif strategy == "full":
+        result, method = sp.simplify(expr), "simplify"
+    else:
+        try:
+            result, method = run_with_timeout(sp.simplify, (expr,), timeout), "simplify"
+        except TimeoutError:
+            result, method = cheap_simplify(expr)
+            timed_out = True
+
+    return SimplifyResult(result, strategy, method, time.perf_counter() - start, timed_out)
@@ -0,0 +1,120 @@
+"""Run CPU-bound SymPy work under a wall-clock budget."""
+
+import multiprocessing
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+# Smallest delay used when re-arming an enclosing timer (0 would disarm it)
+MIN_REARM_DELAY = 1e-6
+
+
+def _call_and_send(conn, func: Callable, args: tuple) -> None:
+    """Worker entry point: run func and send (ok, value) back to the parent."""
+    try:
+        conn.send((True, func(*args)))
+    except BaseException as exc:
+        # Forwarded to the parent, which re-raises it
+        conn.send((False, exc))
+    finally:
+        conn.close()
+
+
+def run_with_timeout(func: Callable, args: tuple = (), timeout: float = 5.0) -> Any:
+    """
+    Call func(*args) in a separate process, killing it after timeout seconds.
+
+    SymPy routines such as simplify and limit cannot be interrupted from a
+    thread, so the work runs in a child process that is terminated when the
+    budget runs out. func, args and the return value must be picklable.
+
+    Args:
+        func: Module-level callable to run
+        args: Positional arguments for func
+        timeout: Wall-clock budget in seconds
+
+    Returns:
+        The value returned by func
+
+    Raises:
+        TimeoutError: If func does not finish within the budget
+        Exception: Any exception raised by func is re-raised in the caller
+    """
+    ctx = multiprocessing.get_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_call_and_send, args=(sender, func, args), daemon=True)
+    process.start()
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout):
+            raise TimeoutError(f"{getattr(func, '__name__', func)} exceeded {timeout}s budget")
+        try:
+            ok, value = receiver.recv()
+        except EOFError:
+            raise RuntimeError(
+                f"worker for {getattr(func, '__name__', func)} exited with code {process.exitcode}"
+            ) from None
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+    if not ok:
+        raise value
+    return value
+
+
+def time_limit_available() -> bool:
+    """Check whether time_limit can interrupt code running in this thread."""
+    return hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def time_limit(seconds: float | None) -> Iterator[None]:
+    """
+    Raise TimeoutError in the current thread if the block runs too long.
+
+    Uses SIGALRM, so the limit only applies in the main thread of a process
+    on platforms that support it (e.g. inside process-pool workers). Elsewhere
+    the block runs without a limit.
+
+    An interval timer that is already armed (an enclosing time_limit, or a
+    test runner's timeout) is preserved: if it expires first it fires as
+    usual, otherwise it is re-armed with its remaining time on exit.
+
+    Args:
+        seconds: Budget for the block, or None for no limit
+
+    Raises:
+        ValueError: If seconds is not positive
+    """
+    if seconds is not None and seconds <= 0:
+        raise ValueError("seconds must be positive, or None for no limit")
+    if seconds is None or not time_limit_available():
+        yield
+        return
+
+    outer_remaining, outer_interval = signal.getitimer(signal.ITIMER_REAL)
+    if 0 < outer_remaining <= seconds:
+        # The enclosing timer expires first and already bounds the block
+        yield
+        return
+
+    def _raise_timeout(signum, frame):
+        raise TimeoutError(f"exceeded {seconds}s budget")
+
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    start = time.monotonic()
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        if outer_remaining > 0:
+            remaining = outer_remaining - (time.monotonic() - start)
+            signal.setitimer(signal.ITIMER_REAL, max(remaining, MIN_REARM_DELAY), outer_interval)
@@ -4,20 +4,31 @@ Notebook export utilities.
 This module provides functions to:
 - Discover notebooks in the notebooks directory
 - Extract metadata (title, description, tags) from notebooks
-- Export notebooks to HTML
+- Export notebooks to HTML (in parallel, slowest notebooks first)
 - Generate the index.html page dynamically
 """
 
+import json
+import os
 import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 NOTEBOOKS_DIR = PROJECT_ROOT / "notebooks"
 DOCS_DIR = PROJECT_ROOT / "docs"
 
+# Runtimes (seconds) of the last export per notebook, used to schedule the slowest first
+TIMINGS_FILE = PROJECT_ROOT / ".export_timings.json"
+
+# Default number of notebooks exported concurrently (each export is a separate process)
+EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+
 
 @dataclass
 class NotebookMetadata:
@@ -187,6 +198,97 @@ def export_notebook(notebook_path: Path, output_dir: Path, include_code: bool =
     return output_path
 
 
+@dataclass
+class ExportResult:
+    """Outcome of exporting a single notebook."""
+
+    notebook: Path
+    output_path: Path | None
+    elapsed: float
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class NotebookExportError(RuntimeError):
+    """Raised by export_all after all other notebooks were exported."""
+
+    def __init__(self, failures: list[ExportResult]):
+        self.failures = failures
+        names = ", ".join(result.notebook.stem for result in failures)
+        super().__init__(f"{len(failures)} notebook(s) failed to export: {names}")
+
+
+def load_export_timings(path: Path = TIMINGS_FILE) -> dict[str, float]:
+    """Load previous export runtimes by notebook stem (empty if unavailable)."""
+    try:
+        timings = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {stem: float(seconds) for stem, seconds in timings.items()} if isinstance(timings, dict) else {}
+
+
+def save_export_timings(results: list[ExportResult], path: Path = TIMINGS_FILE) -> None:
+    """Record the runtime of each export, keeping entries for other notebooks."""
+    timings = load_export_timings(path)
+    timings.update({result.notebook.stem: round(result.elapsed, 3) for result in results})
+    path.write_text(json.dumps(dict(sorted(timings.items())), indent=2) + "\n")
+
+
+def schedule_exports(notebooks: list[Path], timings: dict[str, float]) -> list[Path]:
+    """Order notebooks longest-job-first.
+
+    Notebooks without a recorded runtime go first, since they may be the
+    slowest; the rest follow by decreasing previous runtime.
+    """
+    unknown = [nb for nb in notebooks if nb.stem not in timings]
+    known = sorted(
+        (nb for nb in notebooks if nb.stem in timings),
+        key=lambda nb: timings[nb.stem],
+        reverse=True,
+    )
+    return unknown + known
+
+
+def _timed_export(notebook_path: Path, output_dir: Path, include_code: bool) -> ExportResult:
+    """Export one notebook, capturing its runtime and any error instead of raising."""
+    start = time.perf_counter()
+    try:
+        output_path = export_notebook(notebook_path, output_dir, include_code)
+    except Exception as error:
+        return ExportResult(notebook_path, None, time.perf_counter() - start, error)
+    return ExportResult(notebook_path, output_path, time.perf_counter() - start)
+
+
+def export_notebooks(
+    notebooks: list[Path],
+    output_dir: Path,
+    include_code: bool = False,
+    max_workers: int = EXPORT_WORKERS,
+    timings: dict[str, float] | None = None,
+) -> Iterator[ExportResult]:
+    """Export notebooks concurrently, yielding each result as it finishes.
+
+    Args:
+        notebooks: Notebook files to export
+        output_dir: Directory to write the HTML files
+        include_code: Whether to include source code in output
+        max_workers: Maximum number of exports running at once
+        timings: Previous runtimes by notebook stem, for longest-job-first order
+
+    Returns:
+        Iterator of ExportResult in completion order; a failing notebook
+        yields a result with its error and does not affect the others
+    """
+    ordered = schedule_exports(notebooks, timings or {})
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [pool.submit(_timed_export, nb, output_dir, include_code) for nb in ordered]
+        for future in as_completed(futures):
+            yield future.result()
+
+
 def generate_index_html(notebooks: list[NotebookMetadata], output_dir: Path) -> Path:
     """Generate the index.html page from notebook metadata.
 
@@ -430,41 +532,73 @@ def _generate_card(nb: NotebookMetadata) -> str:
             </a>'''
 
 
-def export_all(output_dir: Path | None = None, include_code: bool = False) -> list[Path]:
+def export_all(
+    output_dir: Path | None = None,
+    include_code: bool = False,
+    max_workers: int = EXPORT_WORKERS,
+    timings_path: Path = TIMINGS_FILE,
+) -> list[Path]:
     """Export all notebooks and generate index.html.
 
+    Notebooks are exported concurrently, slowest first according to the
+    runtimes recorded in timings_path, and progress is printed as each one
+    finishes. A failing notebook does not stop the others: the index is
+    still written (without it) and NotebookExportError is raised at the end.
+
     Args:
         output_dir: Directory to write files (defaults to PROJECT_ROOT/docs)
         include_code: Whether to include source code in notebook exports
+        max_workers: Maximum number of notebooks exported at once
+        timings_path: JSON file with previous runtimes, updated after the run
 
     Returns:
         List of all generated file paths
+
+    Raises:
+        NotebookExportError: If any notebook failed to export
     """
     if output_dir is None:
         output_dir = DOCS_DIR
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    generated_files = []
 
     # Get all notebooks and extract metadata
     notebooks = get_all_notebooks()
     metadata_list = [extract_metadata(nb) for nb in notebooks]
 
-    # Export each notebook
-    print("Exporting marimo notebooks...")
-    for meta in metadata_list:
-        print(f"  Exporting {meta.stem}...")
-        output_path = export_notebook(meta.path, output_dir, include_code)
-        generated_files.append(output_path)
+    # Export notebooks in parallel, reporting each as it completes
+    print(f"Exporting {len(notebooks)} marimo notebooks ({max_workers} workers)...")
+    start = time.perf_counter()
+    results: dict[Path, ExportResult] = {}
+    exports = export_notebooks(notebooks, output_dir, include_code, max_workers, load_export_timings(timings_path))
+    for done, result in enumerate(exports, start=1):
+        results[result.notebook] = result
+        status = "ok" if result.ok else f"FAILED: {result.error}"
+        print(f"  [{done}/{len(notebooks)}] {result.notebook.stem} ({result.elapsed:.1f}s) {status}")
+    print(f"Exported in {time.perf_counter() - start:.1f}s")
+    save_export_timings(list(results.values()), timings_path)
+
+    exported = [meta for meta in metadata_list if results[meta.path].ok]
+    generated_files = [results[meta.path].output_path for meta in exported]
 
     # Generate index.html
     print("Generating index.html...")
-    index_path = generate_index_html(metadata_list, output_dir)
+    index_path = generate_index_html(exported, output_dir)
     generated_files.append(index_path)
 
+    failures = [results[nb] for nb in notebooks if not results[nb].ok]
+    if failures:
+        raise NotebookExportError(failures)
+
     print(f"Done! Output in {output_dir}/")
     return generated_files
 
 
 if __name__ == "__main__":
-    export_all()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export marimo notebooks and generate index.html")
+    parser.add_argument("--workers", type=int, default=EXPORT_WORKERS, help="notebooks exported at once")
+    parser.add_argument("--include-code", action="store_true", help="include source code in exports")
+    args = parser.parse_args()
+    export_all(include_code=args.include_code, max_workers=args.workers)
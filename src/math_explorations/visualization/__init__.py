@@ -1,6 +1,14 @@
 """Visualization module - Plotly animations and function plots."""
 
-from .styles import DARK_THEME, apply_dark_theme, get_color_palette
+from .styles import DARK_THEME, TEMPLATE_NAME, apply_dark_theme, get_color_palette
+from .client import PARAMETRIC_SCRIPT, parametric_meta
+from .decimation import decimate, resample
+from .encoding import encode_array, encode_figure
+from .evaluation import evaluate, supports_broadcasting
+from .figure_spec import FigureSpec, set_figure_validation
+from .frames import FrameSource, compile_frames, compile_steps
+from .sampling import adaptive_sample
+from .streaming import iter_json, write_html, write_json
 from .function_plots import (
     plot_function,
     plot_derivative_comparison,
@@ -20,8 +28,26 @@ from .animations import (
 
 __all__ = [
     "DARK_THEME",
+    "TEMPLATE_NAME",
     "apply_dark_theme",
     "get_color_palette",
+    "PARAMETRIC_SCRIPT",
+    "parametric_meta",
+    "decimate",
+    "resample",
+    "encode_array",
+    "encode_figure",
+    "evaluate",
+    "FigureSpec",
+    "set_figure_validation",
+    "FrameSource",
+    "compile_frames",
+    "compile_steps",
+    "supports_broadcasting",
+    "adaptive_sample",
+    "iter_json",
+    "write_json",
+    "write_html",
     "plot_function",
     "plot_derivative_comparison",
     "plot_tangent_line",
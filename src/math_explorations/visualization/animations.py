@@ -3,7 +3,17 @@
 from typing import Callable
 import numpy as np
 import plotly.graph_objects as go
-from .styles import DARK_THEME, COLORS, ANIMATION_SETTINGS
+from ..calculus.critical_points import find_critical_points
+from ..calculus.integrals import riemann_sums
+from .client import parametric_meta
+from .evaluation import evaluate
+from .figure_spec import FigureSpec, bar_spec, frame_spec, scatter_spec
+from .frames import FrameSource, compile_frames, compile_steps
+from .styles import TEMPLATE_NAME, COLORS, ANIMATION_SETTINGS
+
+# Rectangle counts of the area animation's refinement, as fractions of
+# max_rectangles (5, 8, 12, 18, 25, 35, 50 bars for the default 50)
+AREA_REFINEMENT = np.array([5, 8, 12, 18, 25, 35, 50]) / 50
 
 
 def create_secant_to_tangent(
@@ -13,7 +23,10 @@ def create_secant_to_tangent(
     x_range: tuple[float, float] = (-3, 3),
     h_values: list[float] | None = None,
     num_points: int = 300,
-) -> go.Figure:
+    delta_frames: bool = True,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Create interactive visualization showing secant line approaching tangent.
 
@@ -24,6 +37,10 @@ def create_secant_to_tangent(
         x_range: Range for x-axis
         h_values: Values of h for slider (decreasing toward 0)
         num_points: Points for function curve
+        delta_frames: Send only the traces that change in each slider step
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure with slider
@@ -32,14 +49,14 @@ def create_secant_to_tangent(
         h_values = [2.0, 1.5, 1.0, 0.75, 0.5, 0.3, 0.2, 0.1, 0.05, 0.01]
 
     x = np.linspace(x_range[0], x_range[1], num_points)
-    y = np.array([f(xi) for xi in x])
+    y = evaluate(f, x)
     y0 = f(x0)
     true_slope = f_prime(x0)
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Function curve (static)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
@@ -49,7 +66,7 @@ def create_secant_to_tangent(
     # Tangent line (static reference)
     x_tan = np.array([x_range[0], x_range[1]])
     y_tan = y0 + true_slope * (x_tan - x0)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_tan, y=y_tan,
         mode="lines",
         line={"color": COLORS["tertiary"], "width": 2, "dash": "dash"},
@@ -66,7 +83,7 @@ def create_secant_to_tangent(
     x_sec = np.array([x_range[0], x_range[1]])
     y_sec = y0 + secant_slope * (x_sec - x0)
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_sec, y=y_sec,
         mode="lines",
         line={"color": COLORS["quaternary"], "width": 2},
@@ -74,14 +91,14 @@ def create_secant_to_tangent(
     ))
 
     # Points
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x0], y=[y0],
         mode="markers",
         marker={"color": COLORS["secondary"], "size": 12},
         name="Fixed point",
     ))
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x1], y=[y1],
         mode="markers",
         marker={"color": COLORS["quaternary"], "size": 10},
@@ -90,9 +107,8 @@ def create_secant_to_tangent(
 
     # Create slider steps
     steps = []
-    for h in h_values:
-        x1 = x0 + h
-        y1 = f(x1)
+    x1_values = x0 + np.asarray(h_values, dtype=float)
+    for h, x1, y1 in zip(h_values, x1_values, evaluate(f, x1_values)):
         slope = (y1 - y0) / h
         y_sec = y0 + slope * (x_sec - x0)
 
@@ -109,6 +125,9 @@ def create_secant_to_tangent(
         }
         steps.append(step)
 
+    if delta_frames:
+        steps = compile_steps(fig.data, steps)
+
     sliders = [{
         "active": 0,
         "currentvalue": {"prefix": "h = ", "visible": True, "xanchor": "center"},
@@ -123,15 +142,15 @@ def create_secant_to_tangent(
     }]
 
     fig.update_layout(
-        **DARK_THEME,
-        title=f"Secant → Tangent at x = {x0}",
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=f"Secant → Tangent at x = {x0}",
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         sliders=sliders,
         showlegend=True,
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def animate_limit_process(
@@ -141,7 +160,10 @@ def animate_limit_process(
     x_range: tuple[float, float] = (-3, 3),
     num_frames: int = 60,
     num_points: int = 300,
-) -> go.Figure:
+    delta_frames: bool = True,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict | FigureSpec:
     """
     Create animated visualization of the limit process (h → 0).
 
@@ -152,22 +174,28 @@ def animate_limit_process(
         x_range: Range for x-axis
         num_frames: Number of animation frames
         num_points: Points for function curve
+        delta_frames: Send only the traces that change in each frame
+        output: "figure" for a go.Figure, "dict" for the raw figure spec, or
+            "spec" for a FigureSpec whose frames are generated only while
+            streaming it (see streaming.write_html)
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure with play/pause animation
     """
     x = np.linspace(x_range[0], x_range[1], num_points)
-    y = np.array([f(xi) for xi in x])
+    y = evaluate(f, x)
     y0 = f(x0)
     true_slope = f_prime(x0)
 
     # h values decreasing exponentially
     h_values = np.exp(np.linspace(np.log(2), np.log(0.01), num_frames))
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Static function curve
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
@@ -177,7 +205,7 @@ def animate_limit_process(
     # Tangent line (target)
     x_line = np.array([x_range[0], x_range[1]])
     y_tan = y0 + true_slope * (x_line - x0)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_line, y=y_tan,
         mode="lines",
         line={"color": COLORS["tertiary"], "width": 2, "dash": "dash"},
@@ -188,7 +216,7 @@ def animate_limit_process(
     h = h_values[0]
     slope = (f(x0 + h) - y0) / h
     y_sec = y0 + slope * (x_line - x0)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_line, y=y_sec,
         mode="lines",
         line={"color": COLORS["quaternary"], "width": 3},
@@ -196,7 +224,7 @@ def animate_limit_process(
     ))
 
     # Fixed point
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x0], y=[y0],
         mode="markers",
         marker={"color": COLORS["secondary"], "size": 14},
@@ -204,7 +232,7 @@ def animate_limit_process(
     ))
 
     # Moving point
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x0 + h], y=[f(x0 + h)],
         mode="markers",
         marker={"color": COLORS["quaternary"], "size": 10},
@@ -212,34 +240,35 @@ def animate_limit_process(
     ))
 
     # Create frames
-    frames = []
-    for i, h in enumerate(h_values):
-        x1 = x0 + h
-        y1 = f(x1)
-        slope = (y1 - y0) / h
-        y_sec = y0 + slope * (x_line - x0)
-
-        frame = go.Frame(
-            data=[
-                go.Scatter(x=x, y=y),  # Function (unchanged)
-                go.Scatter(x=x_line, y=y_tan),  # Tangent (unchanged)
-                go.Scatter(x=x_line, y=y_sec),  # Secant (animated)
-                go.Scatter(x=[x0], y=[y0]),  # Fixed point
-                go.Scatter(x=[x1], y=[y1]),  # Moving point
-            ],
-            name=str(i),
-            layout={"title": f"h = {h:.4f} | Slope = {slope:.4f} → {true_slope:.4f}"}
-        )
-        frames.append(frame)
-
-    fig.frames = frames
+    x1_values = x0 + h_values
+    y1_values = evaluate(f, x1_values)
+
+    def frames():
+        for i, (h, x1, y1) in enumerate(zip(h_values, x1_values, y1_values)):
+            slope = (y1 - y0) / h
+            y_sec = y0 + slope * (x_line - x0)
+
+            yield frame_spec(
+                data=[
+                    scatter_spec(x=x, y=y),  # Function (unchanged)
+                    scatter_spec(x=x_line, y=y_tan),  # Tangent (unchanged)
+                    scatter_spec(x=x_line, y=y_sec),  # Secant (animated)
+                    scatter_spec(x=[x0], y=[y0]),  # Fixed point
+                    scatter_spec(x=[x1], y=[y1]),  # Moving point
+                ],
+                name=str(i),
+                layout={"title": f"h = {h:.4f} | Slope = {slope:.4f} → {true_slope:.4f}"}
+            )
+
+    frames = FrameSource(frames, num_frames)
+    fig.frames = compile_frames(fig.data, frames) if delta_frames else frames
 
     # Animation controls
     fig.update_layout(
-        **DARK_THEME,
-        title=f"The Limit Process: h → 0 at x = {x0}",
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=f"The Limit Process: h → 0 at x = {x0}",
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         updatemenus=[{
             "type": "buttons",
             "showactive": False,
@@ -304,7 +333,7 @@ def animate_limit_process(
         }]
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def create_tangent_line_plot(
@@ -313,7 +342,10 @@ def create_tangent_line_plot(
     x_range: tuple[float, float] = (-3, 3),
     initial_x: float = 0,
     num_points: int = 300,
-) -> go.Figure:
+    delta_frames: bool = True,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Create interactive plot with draggable tangent point.
 
@@ -323,20 +355,24 @@ def create_tangent_line_plot(
         x_range: Range for x-axis
         initial_x: Initial x position for tangent
         num_points: Points for function curve
+        delta_frames: Send only the traces that change in each slider step
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure with slider for tangent point
     """
     x = np.linspace(x_range[0], x_range[1], num_points)
-    y = np.array([f(xi) for xi in x])
+    y = evaluate(f, x)
 
     # Create slider positions
     x_positions = np.linspace(x_range[0] + 0.5, x_range[1] - 0.5, 30)
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Function curve
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
@@ -350,14 +386,14 @@ def create_tangent_line_plot(
     x_tan = np.array([x_range[0], x_range[1]])
     y_tan = y0 + slope * (x_tan - x0)
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_tan, y=y_tan,
         mode="lines",
         line={"color": COLORS["tertiary"], "width": 2, "dash": "dash"},
         name=f"Tangent (slope={slope:.3f})",
     ))
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x0], y=[y0],
         mode="markers",
         marker={"color": COLORS["quaternary"], "size": 14, "symbol": "circle"},
@@ -366,9 +402,7 @@ def create_tangent_line_plot(
 
     # Create slider steps
     steps = []
-    for x0 in x_positions:
-        y0 = f(x0)
-        slope = f_prime(x0)
+    for x0, y0, slope in zip(x_positions, evaluate(f, x_positions), evaluate(f_prime, x_positions)):
         y_tan = y0 + slope * (x_tan - x0)
 
         step = {
@@ -381,11 +415,14 @@ def create_tangent_line_plot(
         }
         steps.append(step)
 
+    if delta_frames:
+        steps = compile_steps(fig.data, steps)
+
     fig.update_layout(
-        **DARK_THEME,
-        title=f"Tangent at x = {initial_x:.2f} | Slope = {f_prime(initial_x):.3f}",
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=f"Tangent at x = {initial_x:.2f} | Slope = {f_prime(initial_x):.3f}",
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         sliders=[{
             "active": len(x_positions) // 2,
             "currentvalue": {"prefix": "x = ", "visible": True},
@@ -396,84 +433,128 @@ def create_tangent_line_plot(
         }],
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def animate_power_rule(
     max_n: int = 5,
     x_range: tuple[float, float] = (-2, 2),
     num_points: int = 200,
-) -> go.Figure:
+    n_values: list[float] | np.ndarray | None = None,
+    client_side: bool = False,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict | FigureSpec:
     """
     Animate the power rule showing f(x) = x^n and f'(x) = nx^(n-1).
 
+    With client_side the x grid is sent once and frames carry only n; the
+    browser recomputes both curves from JavaScript expressions, so the
+    output is O(num_points + len(n_values)) instead of their product. This
+    needs client.PARAMETRIC_SCRIPT as the post_script of the HTML page, so
+    it requires output="spec" written with streaming.write_html (which adds
+    the script automatically); a go.Figure or dict shown directly would
+    move the slider without redrawing the curves.
+
     Args:
         max_n: Maximum power to show
         x_range: Range for x-axis
         num_points: Points for curves
+        n_values: Powers to step through (defaults to 1, 2, ..., max_n);
+            fractional values give a smooth sweep
+        client_side: Evaluate the curves in the browser for each frame
+            (requires output="spec")
+        output: "figure" for a go.Figure, "dict" for the raw figure spec, or
+            "spec" for a FigureSpec whose frames are generated only while
+            streaming it (see streaming.write_html)
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure with animation
+
+    Raises:
+        ValueError: If client_side is used with an output other than "spec"
     """
+    if client_side and output != "spec":
+        raise ValueError(
+            "client_side=True needs output='spec' written with streaming.write_html, "
+            "which attaches client.PARAMETRIC_SCRIPT"
+        )
     x = np.linspace(x_range[0], x_range[1], num_points)
+    if n_values is None:
+        n_values = range(1, max_n + 1)
+    n_values = [float(n) for n in n_values]
 
-    fig = go.Figure()
+    def curves(n: float) -> tuple[np.ndarray, np.ndarray]:
+        with np.errstate(all="ignore"):
+            y_f = x ** n
+            y_fp = n * x ** (n - 1) if n != 0 else np.zeros_like(x)
 
-    # Initial traces (n=1)
-    y_f = x ** 1
-    y_fp = np.ones_like(x)
+        # Clip for display
+        return np.clip(y_f, -20, 20), np.clip(y_fp, -20, 20)
+
+    fig = FigureSpec()
+
+    # Initial traces (first n)
+    y_f, y_fp = curves(n_values[0])
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y_f,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
         name="f(x) = x^n",
     ))
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y_fp,
         mode="lines",
         line={"color": COLORS["secondary"], "width": 3},
         name="f'(x) = nx^(n-1)",
     ))
 
-    # Create frames for each n
-    frames = []
-    for n in range(1, max_n + 1):
-        y_f = x ** n
-        y_fp = n * x ** (n - 1) if n > 0 else np.zeros_like(x)
-
-        # Clip for display
-        y_f = np.clip(y_f, -20, 20)
-        y_fp = np.clip(y_fp, -20, 20)
+    if client_side:
+        fig.update_layout(meta=parametric_meta(
+            [0, 1], ["Math.pow(x, n)", "n === 0 ? 0 : n * Math.pow(x, n - 1)"], clip=20,
+        ))
 
-        frame = go.Frame(
-            data=[
-                go.Scatter(x=x, y=y_f),
-                go.Scatter(x=x, y=y_fp),
-            ],
-            name=str(n),
-            layout={"title": f"Power Rule: f(x) = x^{n}, f'(x) = {n}x^{n-1}"}
-        )
-        frames.append(frame)
+    def title(n: float) -> str:
+        return f"Power Rule: f(x) = x^{n:g}, f'(x) = {n:g}x^{n - 1:g}"
 
-    fig.frames = frames
+    # Create frames for each n
+    def frames():
+        for n in n_values:
+            if client_side:
+                yield frame_spec(data=[], name=f"{n:g}", layout={"title": title(n)}, traces=[])
+                continue
+
+            y_f, y_fp = curves(n)
+            yield frame_spec(
+                data=[
+                    scatter_spec(x=x, y=y_f),
+                    scatter_spec(x=x, y=y_fp),
+                ],
+                name=f"{n:g}",
+                layout={"title": title(n)}
+            )
+
+    fig.frames = FrameSource(frames, len(n_values))
 
     # Create slider
     steps = []
-    for n in range(1, max_n + 1):
+    for n in n_values:
         step = {
-            "args": [[str(n)], {"frame": {"duration": 300, "redraw": True}, "mode": "immediate"}],
-            "label": str(n),
+            "args": [[f"{n:g}"], {"frame": {"duration": 300, "redraw": True}, "mode": "immediate"}],
+            "label": f"{n:g}",
             "method": "animate",
         }
         steps.append(step)
 
     fig.update_layout(
-        **DARK_THEME,
-        title="Power Rule: f(x) = x^1, f'(x) = 1",
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=title(n_values[0]),
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         yaxis_range=[-10, 10],
         sliders=[{
             "active": 0,
@@ -501,7 +582,7 @@ def animate_power_rule(
         }],
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def animate_chain_rule(
@@ -512,7 +593,9 @@ def animate_chain_rule(
     x_range: tuple[float, float] = (-2, 2),
     num_points: int = 200,
     title: str = "Chain Rule: (f∘g)'(x) = f'(g(x)) · g'(x)",
-) -> go.Figure:
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Visualize the chain rule with composite functions.
 
@@ -524,6 +607,9 @@ def animate_chain_rule(
         x_range: Range for x-axis
         num_points: Points for curves
         title: Plot title
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure showing composition and derivative
@@ -531,18 +617,18 @@ def animate_chain_rule(
     x = np.linspace(x_range[0], x_range[1], num_points)
 
     # Compute functions
-    g_x = inner(x)
-    f_g_x = outer(g_x)  # Composite: f(g(x))
-    chain_deriv = outer_prime(g_x) * inner_prime(x)  # f'(g(x)) * g'(x)
+    g_x = evaluate(inner, x)
+    f_g_x = evaluate(outer, g_x)  # Composite: f(g(x))
+    chain_deriv = evaluate(outer_prime, g_x) * evaluate(inner_prime, x)  # f'(g(x)) * g'(x)
 
     # Clip extreme values
     f_g_x = np.clip(f_g_x, -20, 20)
     chain_deriv = np.clip(chain_deriv, -20, 20)
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Inner function g(x)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=np.clip(g_x, -20, 20),
         mode="lines",
         line={"color": COLORS["accent1"], "width": 2},
@@ -550,7 +636,7 @@ def animate_chain_rule(
     ))
 
     # Composite f(g(x))
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=f_g_x,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
@@ -558,7 +644,7 @@ def animate_chain_rule(
     ))
 
     # Derivative of composite
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=chain_deriv,
         mode="lines",
         line={"color": COLORS["secondary"], "width": 3},
@@ -566,15 +652,15 @@ def animate_chain_rule(
     ))
 
     fig.update_layout(
-        **DARK_THEME,
-        title=title,
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=title,
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         yaxis_range=[-10, 10],
         showlegend=True,
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def animate_projectile_motion(
@@ -582,15 +668,29 @@ def animate_projectile_motion(
     angle: float = 45.0,
     g: float = 9.8,
     num_frames: int = 50,
-) -> go.Figure:
+    shared_trajectory: bool = False,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict | FigureSpec:
     """
     Animate projectile motion showing position, velocity, and acceleration.
 
+    By default every frame redraws the path travelled so far, so the output
+    grows quadratically with num_frames. With shared_trajectory the full
+    path is sent once and frames only move the position marker and the
+    velocity vector, which keeps the output linear (1000+ frames are fine).
+
     Args:
         v0: Initial velocity (m/s)
         angle: Launch angle (degrees)
         g: Gravitational acceleration (m/s^2)
         num_frames: Number of animation frames
+        shared_trajectory: Draw the whole trajectory once instead of growing it
+        output: "figure" for a go.Figure, "dict" for the raw figure spec, or
+            "spec" for a FigureSpec whose frames are generated only while
+            streaming it (see streaming.write_html)
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure with animation
@@ -611,10 +711,10 @@ def animate_projectile_motion(
     vx_t = np.full_like(t, vx)
     vy_t = vy - g * t
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Trajectory
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y,
         mode="lines",
         line={"color": COLORS["primary"], "width": 2, "dash": "dot"},
@@ -622,7 +722,7 @@ def animate_projectile_motion(
     ))
 
     # Current position
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x[0]], y=[y[0]],
         mode="markers",
         marker={"color": COLORS["quaternary"], "size": 15},
@@ -631,7 +731,7 @@ def animate_projectile_motion(
 
     # Velocity vector (scaled)
     scale = 0.3
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x[0], x[0] + scale * vx_t[0]],
         y=[y[0], y[0] + scale * vy_t[0]],
         mode="lines+markers",
@@ -641,29 +741,31 @@ def animate_projectile_motion(
     ))
 
     # Create frames
-    frames = []
-    for i in range(len(t)):
-        frame = go.Frame(
-            data=[
-                go.Scatter(x=x[:i+1], y=y[:i+1]),  # Trajectory up to current point
-                go.Scatter(x=[x[i]], y=[y[i]]),  # Position
-                go.Scatter(
+    def frames():
+        for i in range(len(t)):
+            data = [
+                scatter_spec(x=[x[i]], y=[y[i]]),  # Position
+                scatter_spec(
                     x=[x[i], x[i] + scale * vx_t[i]],
                     y=[y[i], y[i] + scale * vy_t[i]]
                 ),  # Velocity vector
-            ],
-            name=str(i),
-            layout={"title": f"t = {t[i]:.2f}s | v = ({vx_t[i]:.1f}, {vy_t[i]:.1f}) m/s"}
-        )
-        frames.append(frame)
-
-    fig.frames = frames
+            ]
+            if not shared_trajectory:
+                data.insert(0, scatter_spec(x=x[:i+1], y=y[:i+1]))  # Trajectory up to current point
+            yield frame_spec(
+                data=data,
+                name=str(i),
+                layout={"title": f"t = {t[i]:.2f}s | v = ({vx_t[i]:.1f}, {vy_t[i]:.1f}) m/s"},
+                traces=[1, 2] if shared_trajectory else None,
+            )
+
+    fig.frames = FrameSource(frames, len(t))
 
     fig.update_layout(
-        **DARK_THEME,
-        title=f"Projectile Motion: v₀ = {v0} m/s, θ = {angle}°",
-        xaxis_title="x (m)",
-        yaxis_title="y (m)",
+        template=TEMPLATE_NAME,
+        title_text=f"Projectile Motion: v₀ = {v0} m/s, θ = {angle}°",
+        xaxis_title_text="x (m)",
+        yaxis_title_text="y (m)",
         yaxis_scaleanchor="x",
         yaxis_scaleratio=1,
         xaxis_range=[-1, max(x) * 1.1],
@@ -691,7 +793,7 @@ def animate_projectile_motion(
         }],
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def create_optimization_plot(
@@ -700,7 +802,9 @@ def create_optimization_plot(
     f_double_prime: Callable[[float], float],
     x_range: tuple[float, float] = (-3, 3),
     num_points: int = 300,
-) -> go.Figure:
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Create visualization for finding maxima/minima with second derivative test.
 
@@ -710,30 +814,31 @@ def create_optimization_plot(
         f_double_prime: Second derivative
         x_range: Range for x-axis
         num_points: Points for curves
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure showing function, critical points, and concavity
     """
     x = np.linspace(x_range[0], x_range[1], num_points)
-    y = np.array([f(xi) for xi in x])
-    y_prime = np.array([f_prime(xi) for xi in x])
-    y_double_prime = np.array([f_double_prime(xi) for xi in x])
-
-    # Find critical points (where f'(x) ≈ 0)
-    critical_points = []
-    for i in range(1, len(x)):
-        if y_prime[i-1] * y_prime[i] < 0:  # Sign change
-            # Linear interpolation to find zero
-            x_crit = x[i-1] - y_prime[i-1] * (x[i] - x[i-1]) / (y_prime[i] - y_prime[i-1])
-            y_crit = f(x_crit)
-            d2 = f_double_prime(x_crit)
-            point_type = "Maximum" if d2 < 0 else "Minimum" if d2 > 0 else "Inflection"
-            critical_points.append((x_crit, y_crit, d2, point_type))
-
-    fig = go.Figure()
+    y = evaluate(f, x)
+    y_prime = evaluate(f_prime, x)
+    y_double_prime = evaluate(f_double_prime, x)
+
+    # Find critical points (where f'(x) = 0), including double roots of f'
+    critical_points = find_critical_points(
+        lambda v: evaluate(f, v),
+        lambda v: evaluate(f_prime, v),
+        lambda v: evaluate(f_double_prime, v),
+        x_range,
+        num_points,
+    )
+
+    fig = FigureSpec()
 
     # Function
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
@@ -741,7 +846,7 @@ def create_optimization_plot(
     ))
 
     # First derivative
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y_prime,
         mode="lines",
         line={"color": COLORS["secondary"], "width": 2},
@@ -749,7 +854,7 @@ def create_optimization_plot(
     ))
 
     # Second derivative
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x, y=y_double_prime,
         mode="lines",
         line={"color": COLORS["tertiary"], "width": 2, "dash": "dash"},
@@ -757,9 +862,10 @@ def create_optimization_plot(
     ))
 
     # Critical points
-    for x_c, y_c, d2, ptype in critical_points:
+    for x_c, y_c, d2, kind in critical_points:
+        ptype = kind.title()
         color = COLORS["accent2"] if ptype == "Maximum" else COLORS["accent1"] if ptype == "Minimum" else COLORS["quaternary"]
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter_spec(
             x=[x_c], y=[y_c],
             mode="markers+text",
             marker={"color": color, "size": 14, "symbol": "star"},
@@ -774,40 +880,75 @@ def create_optimization_plot(
     fig.add_hline(y=0, line_dash="dot", line_color=COLORS["text_secondary"], opacity=0.5)
 
     fig.update_layout(
-        **DARK_THEME,
-        title="Optimization: Finding Extrema with Derivatives",
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text="Optimization: Finding Extrema with Derivatives",
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         showlegend=True,
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def animate_area_accumulation(
     f: Callable[[float], float],
     x_range: tuple[float, float] = (0, 3),
     max_rectangles: int = 50,
-) -> go.Figure:
+    rule: str = "midpoint",
+    num_frames: int = 7,
+    delta_frames: bool = True,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict | FigureSpec:
     """
     Animate Riemann sum showing area accumulation (teaser for integration).
 
+    All frames come from one batched riemann_sums call, so f is evaluated
+    once, vectorized, on the distinct sample points of every frame.
+
     Args:
         f: Function to integrate
         x_range: Integration bounds
         max_rectangles: Maximum number of rectangles in animation
+        rule: Height rule, one of calculus.integrals.RIEMANN_RULES (for
+            trapezoid and simpson the bar height is the panel's average)
+        num_frames: Number of refinement steps, following AREA_REFINEMENT
+            scaled to max_rectangles
+        delta_frames: Send only the rectangles in each frame, not the curve
+        output: "figure" for a go.Figure, "dict" for the raw figure spec, or
+            "spec" for a FigureSpec whose frames are generated only while
+            streaming it (see streaming.write_html)
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure with animation
     """
     a, b = x_range
     x_curve = np.linspace(a, b, 200)
-    y_curve = np.array([f(xi) for xi in x_curve])
+    y_curve = evaluate(f, x_curve)
 
-    fig = go.Figure()
+    fractions = np.interp(
+        np.linspace(0, 1, num_frames), np.linspace(0, 1, len(AREA_REFINEMENT)), AREA_REFINEMENT
+    )
+    rect_counts = np.unique(np.maximum(1, np.round(fractions * max_rectangles)).astype(int))
+    riemann = riemann_sums(lambda x: evaluate(f, x), a, b, rect_counts, rule)
+
+    def bars(n: int, heights: np.ndarray, **props) -> dict:
+        dx = (b - a) / n
+        return bar_spec(
+            x=a + (np.arange(n) + 0.5) * dx,
+            y=heights,
+            width=dx * 0.95,
+            marker_color=COLORS["tertiary"],
+            opacity=0.6,
+            **props,
+        )
+
+    fig = FigureSpec()
 
     # Function curve
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_curve, y=y_curve,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
@@ -817,47 +958,22 @@ def animate_area_accumulation(
     ))
 
     # Initial rectangles
-    n = 5
-    dx = (b - a) / n
-    x_bars = [a + i * dx for i in range(n)]
-    heights = [f(xi + dx/2) for xi in x_bars]  # Midpoint rule
-
-    fig.add_trace(go.Bar(
-        x=[xi + dx/2 for xi in x_bars],
-        y=heights,
-        width=dx * 0.95,
-        marker_color=COLORS["tertiary"],
-        opacity=0.6,
-        name="Riemann sum",
-    ))
+    fig.add_trace(bars(rect_counts[0], riemann.heights[0], name="Riemann sum"))
 
     # Create frames with increasing number of rectangles
-    rect_counts = [5, 8, 12, 18, 25, 35, 50]
-    frames = []
-
-    for n in rect_counts:
-        dx = (b - a) / n
-        x_bars = [a + i * dx for i in range(n)]
-        heights = [f(xi + dx/2) for xi in x_bars]
-        area = sum(h * dx for h in heights)
-
-        frame = go.Frame(
-            data=[
-                go.Scatter(x=x_curve, y=y_curve, fill="tozeroy", fillcolor="rgba(0, 212, 255, 0.1)"),
-                go.Bar(
-                    x=[xi + dx/2 for xi in x_bars],
-                    y=heights,
-                    width=dx * 0.95,
-                    marker_color=COLORS["tertiary"],
-                    opacity=0.6,
-                ),
-            ],
-            name=str(n),
-            layout={"title": f"Riemann Sum: n = {n} rectangles, Area ≈ {area:.4f}"}
-        )
-        frames.append(frame)
-
-    fig.frames = frames
+    def frames():
+        for n, heights, area in zip(rect_counts, riemann.heights, riemann.sums):
+            yield frame_spec(
+                data=[
+                    scatter_spec(x=x_curve, y=y_curve, fill="tozeroy", fillcolor="rgba(0, 212, 255, 0.1)"),
+                    bars(n, heights),
+                ],
+                name=str(n),
+                layout={"title": f"Riemann Sum: n = {n} rectangles, Area ≈ {area:.4f}"}
+            )
+
+    frames = FrameSource(frames, len(rect_counts))
+    fig.frames = compile_frames(fig.data, frames) if delta_frames else frames
 
     # Slider
     steps = [
@@ -867,10 +983,10 @@ def animate_area_accumulation(
     ]
 
     fig.update_layout(
-        **DARK_THEME,
-        title=f"Riemann Sum: n = 5 rectangles",
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=f"Riemann Sum: n = {rect_counts[0]} rectangles",
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         barmode="overlay",
         sliders=[{
             "active": 0,
@@ -898,4 +1014,4 @@ def animate_area_accumulation(
         }],
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
@@ -0,0 +1,52 @@
+"""Parametric animations evaluated in the browser instead of in Python."""
+
+from typing import Any
+
+# post_script for plotly's write_html: on every animation frame, re-evaluate
+# the traces listed in layout.meta.parametric at n = float(frame name)
+PARAMETRIC_SCRIPT = """
+var gd = document.getElementById('{plot_id}');
+var spec = gd.layout.meta && gd.layout.meta.parametric;
+if (spec) {
+    var curves = spec.y.map(function (expr) {
+        return new Function('x', 'n', 'return ' + expr + ';');
+    });
+    var clip = function (y) {
+        if (isNaN(y)) { return null; }
+        return spec.clip === null ? y : Math.max(-spec.clip, Math.min(spec.clip, y));
+    };
+    gd.on('plotly_animatingframe', function (event) {
+        var n = parseFloat(event.name);
+        var ys = spec.traces.map(function (trace, i) {
+            return Array.from(gd.data[trace].x, function (x) { return clip(curves[i](x, n)); });
+        });
+        Plotly.restyle(gd, {y: ys}, spec.traces);
+    });
+}
+"""
+
+
+def parametric_meta(
+    traces: list[int],
+    y_expressions: list[str],
+    clip: float | None = None,
+) -> dict[str, Any]:
+    """
+    Describe traces whose y values PARAMETRIC_SCRIPT recomputes per frame.
+
+    Args:
+        traces: Indices of the traces to update
+        y_expressions: JavaScript expressions in x and n, one per trace
+            (e.g. "Math.pow(x, n)")
+        clip: Clip |y| to this value, like np.clip(y, -clip, clip)
+
+    Returns:
+        Dict to store as layout.meta
+    """
+    return {"parametric": {"traces": traces, "y": y_expressions, "clip": clip}}
+
+
+def has_parametric_meta(layout: dict[str, Any]) -> bool:
+    """Check whether a layout dict carries parametric trace expressions."""
+    meta = layout.get("meta")
+    return isinstance(meta, dict) and "parametric" in meta
@@ -0,0 +1,206 @@
+"""Shape-preserving downsampling of large line traces."""
+
+from typing import Any
+from weakref import finalize
+import numpy as np
+
+# Supported values for the ``method`` argument
+DECIMATION_METHODS = ("minmax", "lttb")
+
+# Points kept per horizontal pixel of the target plot
+POINTS_PER_PIXEL = 2
+
+# Plot width assumed when resampling without an explicit pixel width
+DEFAULT_PIXEL_WIDTH = 1000
+
+# Full-resolution samples by id(figure), then by trace index (figures are unhashable)
+_full_resolution: dict[int, dict[int, tuple[np.ndarray, np.ndarray]]] = {}
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Keep the minimum and maximum of each of n_buckets equal-width x buckets.
+
+    Buckets span equal x intervals, so they line up with pixel columns even
+    when the samples are unevenly spaced; empty buckets are skipped. The
+    endpoints are always kept and points stay in x order, so the vertical
+    extent drawn in every pixel column is unchanged.
+
+    Args:
+        x: Sorted x values (finite)
+        y: y values (finite)
+        n_buckets: Number of buckets (usually the pixel width)
+
+    Returns:
+        Tuple of decimated (x, y)
+    """
+    n = len(x)
+    if n_buckets < 1 or 2 * n_buckets + 2 >= n:
+        return x, y
+
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)[:-1]
+    # First index of every non-empty bucket
+    starts = np.unique(np.searchsorted(x, edges, side="left"))
+    bucket = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    keep = [np.array([0, n - 1])]
+    for reduce in (np.minimum, np.maximum):
+        extreme = reduce.reduceat(y, starts)
+        hits = np.flatnonzero(y == extreme[bucket])
+        _, first = np.unique(bucket[hits], return_index=True)
+        keep.append(hits[first])
+
+    index = np.unique(np.concatenate(keep))
+    return x[index], y[index]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Interior points are split into n_out - 2 buckets; from each bucket the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket is kept.
+
+    Args:
+        x: Sorted x values (finite)
+        y: y values (finite)
+        n_out: Number of points to return (including both endpoints)
+
+    Returns:
+        Tuple of decimated (x, y)
+    """
+    n = len(x)
+    if n_out < 3 or n_out >= n:
+        return x, y
+
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(int), n)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_x = x[stop:edges[i + 2]].mean()
+        next_y = y[stop:edges[i + 2]].mean()
+        area = np.abs(
+            (x[a] - next_x) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (next_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+
+def _finite_runs(y: np.ndarray) -> list[tuple[int, int]]:
+    """Return (start, stop) index pairs of consecutive finite values."""
+    finite = np.concatenate(([False], np.isfinite(y), [False]))
+    changes = np.flatnonzero(np.diff(finite.astype(np.int8)))
+    return list(zip(changes[::2], changes[1::2]))
+
+
+def decimate(
+    x: np.ndarray,
+    y: np.ndarray,
+    pixel_width: int,
+    method: str = "minmax",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a line trace to about POINTS_PER_PIXEL points per pixel column.
+
+    Gaps (NaN or inf) are preserved: every finite run is decimated on its
+    own with a share of the budget proportional to its length, and one
+    non-finite point is kept between runs to break the line.
+
+    Args:
+        x: Sorted x values
+        y: y values
+        pixel_width: Width of the plot area in pixels
+        method: One of DECIMATION_METHODS
+
+    Returns:
+        Tuple of (x, y), unchanged if already within budget
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"Unknown decimation method {method!r}, expected one of {DECIMATION_METHODS}")
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    target = POINTS_PER_PIXEL * pixel_width
+    if len(x) <= target:
+        return x, y
+
+    runs = _finite_runs(y)
+    n_finite = sum(stop - start for start, stop in runs)
+    parts_x, parts_y = [], []
+    for start, stop in runs:
+        budget = max(2, round(target * (stop - start) / n_finite))
+        if method == "minmax":
+            run_x, run_y = minmax_decimate(x[start:stop], y[start:stop], budget // 2)
+        else:
+            run_x, run_y = lttb(x[start:stop], y[start:stop], budget)
+        parts_x.append(run_x)
+        parts_y.append(run_y)
+        if stop < len(x):
+            parts_x.append(x[stop:stop + 1])
+            parts_y.append(np.array([np.nan]))
+
+    if not parts_x:
+        return x[:0], y[:0]
+    return np.concatenate(parts_x), np.concatenate(parts_y)
+
+
+def store_full_resolution(fig: Any, trace_index: int, x: np.ndarray, y: np.ndarray) -> None:
+    """
+    Keep the undecimated samples of a trace alongside the figure.
+
+    The buffer lives outside the figure, so it is never serialized, and is
+    dropped when the figure is garbage collected.
+
+    Args:
+        fig: Plotly figure owning the trace
+        trace_index: Index of the trace in fig.data
+        x: Full-resolution x values
+        y: Full-resolution y values
+    """
+    key = id(fig)
+    if key not in _full_resolution:
+        _full_resolution[key] = {}
+        finalize(fig, _full_resolution.pop, key, None)
+    _full_resolution[key][trace_index] = (np.asarray(x), np.asarray(y))
+
+
+def full_resolution(fig: Any) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """Return the stored full-resolution samples of a figure by trace index."""
+    return dict(_full_resolution.get(id(fig), {}))
+
+
+def resample(
+    fig: Any,
+    x_range: tuple[float, float] | None = None,
+    pixel_width: int = DEFAULT_PIXEL_WIDTH,
+    method: str = "minmax",
+) -> Any:
+    """
+    Re-decimate buffered traces for a new visible x range.
+
+    Intended for zoom callbacks (e.g. FigureWidget.layout.xaxis.on_change):
+    the zoomed window is rebuilt from the full-resolution buffer so detail
+    reappears as the view narrows.
+
+    Args:
+        fig: Figure whose traces were stored with store_full_resolution
+        x_range: Visible (min, max), or None for the whole buffer
+        pixel_width: Width of the plot area in pixels
+        method: One of DECIMATION_METHODS
+
+    Returns:
+        The same figure, updated in place
+    """
+    for trace_index, (x, y) in full_resolution(fig).items():
+        if x_range is not None:
+            # Keep one point beyond each edge so the line reaches the border
+            lo = max(int(np.searchsorted(x, x_range[0])) - 1, 0)
+            hi = int(np.searchsorted(x, x_range[1], side="right")) + 1
+            x, y = x[lo:hi], y[lo:hi]
+        x_out, y_out = decimate(x, y, pixel_width, method)
+        fig.data[trace_index].update(x=x_out, y=y_out)
+    return fig
@@ -0,0 +1,112 @@
+"""Encode trace coordinates as Plotly base64 typed arrays (``bdata``)."""
+
+import base64
+from typing import Any
+import numpy as np
+
+# Supported values for the ``encoding`` argument of the builders
+ENCODINGS = ("array", "binary")
+
+# Trace properties holding coordinate arrays
+ENCODED_KEYS = ("x", "y", "z")
+
+# Largest float32 rounding error allowed, as a fraction of the data span
+FLOAT32_TOLERANCE = 1e-6
+
+# Shorter arrays stay as JSON lists (base64 overhead outweighs the savings)
+BINARY_MIN_LENGTH = 8
+
+# Integer dtypes understood by plotly.js, smallest first
+_INTEGER_DTYPES = (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32)
+
+
+def _fits_float32(values: np.ndarray) -> bool:
+    """Check whether float32 keeps values within FLOAT32_TOLERANCE of their span."""
+    with np.errstate(over="ignore", invalid="ignore"):
+        narrowed = values.astype(np.float32)
+    finite = np.isfinite(values)
+    if not np.array_equal(finite, np.isfinite(narrowed)):
+        return False
+    if not finite.any():
+        return True
+    exact = values[finite]
+    span = float(exact.max() - exact.min()) or float(np.abs(exact).max())
+    error = float(np.abs(narrowed[finite].astype(np.float64) - exact).max())
+    return error <= FLOAT32_TOLERANCE * span
+
+
+def _narrow(values: np.ndarray) -> np.ndarray:
+    """Return values in the smallest dtype plotly.js can decode without visible loss."""
+    if values.dtype.kind == "b":
+        return values.astype(np.uint8)
+    if values.dtype.kind in "iu":
+        low, high = values.min(), values.max()
+        for dtype in _INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return values.astype(dtype)
+        return values.astype(np.float64)
+    values = values.astype(np.float64)
+    return values.astype(np.float32) if _fits_float32(values) else values
+
+
+def encode_array(values: Any) -> Any:
+    """
+    Encode a numeric array as a Plotly typed-array spec.
+
+    Floats are sent as float32 when the rounding error stays below
+    FLOAT32_TOLERANCE of the data span, otherwise as float64. Integers use
+    the smallest integer type that holds them.
+
+    Args:
+        values: Array-like of numbers
+
+    Returns:
+        Dict with "dtype" and "bdata" (and "shape" for 2-D data), or values
+        unchanged if they are not numeric or shorter than BINARY_MIN_LENGTH
+    """
+    if isinstance(values, dict):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind not in "biuf" or array.size < BINARY_MIN_LENGTH:
+        return values
+
+    array = np.ascontiguousarray(_narrow(array))
+    array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+    spec = {
+        "dtype": f"{array.dtype.kind}{array.dtype.itemsize}",
+        "bdata": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+    if array.ndim > 1:
+        spec["shape"] = str(array.shape)[1:-1]
+    return spec
+
+
+def encode_trace(trace: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a trace dict with its x/y/z arrays encoded."""
+    return {
+        key: encode_array(value) if key in ENCODED_KEYS else value
+        for key, value in trace.items()
+    }
+
+
+def encode_frame(frame: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a frame dict with the x/y/z arrays of its traces encoded."""
+    return {**frame, "data": [encode_trace(trace) for trace in frame.get("data", [])]}
+
+
+def encode_figure(spec: dict[str, Any]) -> dict[str, Any]:
+    """
+    Encode the coordinates of every trace and frame trace in a figure dict.
+
+    Args:
+        spec: Figure dict with "data" and optionally "frames"
+
+    Returns:
+        New figure dict; the input is not modified
+    """
+    encoded = dict(spec)
+    encoded["data"] = [encode_trace(trace) for trace in spec.get("data", [])]
+    if "frames" in spec:
+        encoded["frames"] = [encode_frame(frame) for frame in spec["frames"]]
+    return encoded
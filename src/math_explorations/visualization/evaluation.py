@@ -0,0 +1,99 @@
+"""Evaluate plotted callables over arrays with as few Python calls as possible."""
+
+from typing import Callable
+from weakref import WeakKeyDictionary
+import numpy as np
+
+# Sample inputs used to check whether a callable broadcasts over arrays
+PROBE_POINTS = np.array([0.3, 0.7, 1.3])
+
+# Probe results, keyed weakly so notebook lambdas can be garbage collected
+_probe_cache: WeakKeyDictionary = WeakKeyDictionary()
+
+# Fallback for callables that do not support weak references (e.g. builtins)
+_probe_cache_strong: dict[Callable, bool] = {}
+
+
+def _scalar_or_nan(f: Callable, value: float) -> float:
+    """Call f on a single float, mapping math domain errors to NaN."""
+    try:
+        return float(f(value))
+    except (ArithmeticError, ValueError):
+        return np.nan
+
+
+def _probe(f: Callable) -> bool:
+    """Check whether one array call of f agrees with per-point calls."""
+    with np.errstate(all="ignore"):
+        try:
+            output = np.asarray(f(PROBE_POINTS), dtype=float)
+            vector = np.broadcast_to(output, PROBE_POINTS.shape)
+        except Exception:
+            # Any failure means "not vectorized"
+            return False
+        try:
+            scalars = np.array([float(f(float(p))) for p in PROBE_POINTS])
+        except Exception:
+            # Array-only callables are trusted if they map element-wise
+            return output.shape == PROBE_POINTS.shape
+    return bool(np.allclose(vector, scalars, equal_nan=True))
+
+
+def supports_broadcasting(f: Callable) -> bool:
+    """
+    Return whether f can be evaluated on a whole array in one call.
+
+    The answer is probed once per callable and cached. A callable counts as
+    broadcasting when an array call succeeds and matches per-point calls, or,
+    if it only accepts arrays, returns one value per input point. Either
+    check rules out functions that reduce their input (e.g. built-in max).
+
+    Args:
+        f: Callable taking a float or an array
+
+    Returns:
+        True if f(x) can be called with an ndarray
+    """
+    try:
+        return _probe_cache[f]
+    except TypeError:
+        try:
+            cached = _probe_cache_strong.get(f)
+        except TypeError:
+            return _probe(f)
+        if cached is None:
+            cached = _probe_cache_strong[f] = _probe(f)
+        return cached
+    except KeyError:
+        result = _probe_cache[f] = _probe(f)
+        return result
+
+
+def evaluate(f: Callable, x: np.ndarray | float) -> np.ndarray:
+    """
+    Evaluate f at every point of x.
+
+    Broadcasting callables get a single call; everything else is mapped with
+    np.vectorize, with math domain errors (e.g. math.log(0)) turned into NaN.
+
+    Args:
+        f: Function to evaluate
+        x: Points (any shape)
+
+    Returns:
+        Float array with the same shape as x
+    """
+    x = np.asarray(x, dtype=float)
+    with np.errstate(all="ignore"):
+        if supports_broadcasting(f):
+            y = np.asarray(f(x), dtype=float)
+            return y if y.shape == x.shape else np.array(np.broadcast_to(y, x.shape))
+        if x.size == 0:
+            return np.empty(x.shape)
+        return np.vectorize(lambda v: _scalar_or_nan(f, v), otypes=[float])(x)
+
+
+def clear_evaluation_cache() -> None:
+    """Forget all cached broadcasting probes."""
+    _probe_cache.clear()
+    _probe_cache_strong.clear()
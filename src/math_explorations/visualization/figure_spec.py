@@ -0,0 +1,221 @@
+"""Build figures as plain dicts, skipping Plotly graph-object validation."""
+
+from typing import Any
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from .decimation import store_full_resolution
+from .encoding import ENCODINGS, encode_figure
+from .frames import FrameSource
+
+# Supported values for the ``output`` argument of the builders
+OUTPUT_FORMATS = ("figure", "dict", "spec")
+
+# Validate every built spec by constructing a checked go.Figure (for tests)
+VALIDATE_FIGURES = False
+
+# Property names that contain an underscore themselves (the same list
+# plotly keeps in BaseFigure._valid_underscore_properties)
+UNDERSCORE_PROPERTIES = frozenset({
+    "error_x", "error_y", "error_z",
+    "copy_xstyle", "copy_ystyle", "copy_zstyle",
+    "paper_bgcolor", "plot_bgcolor",
+})
+
+
+def set_figure_validation(enabled: bool) -> None:
+    """Turn validation of built figure specs on or off globally."""
+    global VALIDATE_FIGURES
+    VALIDATE_FIGURES = enabled
+
+
+def _merge(target: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge updates into target, like Figure.update_layout."""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def _split_path(key: str) -> list[str]:
+    """Split a magic-underscore key into property names."""
+    parts = key.split("_")
+    path: list[str] = []
+    i = 0
+    while i < len(parts):
+        pair = "_".join(parts[i:i + 2])
+        if pair in UNDERSCORE_PROPERTIES:
+            path.append(pair)
+            i += 2
+        else:
+            path.append(parts[i])
+            i += 1
+    return path
+
+
+def expand_properties(props: dict[str, Any]) -> dict[str, Any]:
+    """
+    Expand Plotly "magic underscore" keys into nested dicts.
+
+    ``xaxis_title_text`` becomes ``{"xaxis": {"title": {"text": ...}}}``.
+    Names listed in UNDERSCORE_PROPERTIES are kept whole, so
+    ``error_y_array`` becomes ``{"error_y": {"array": ...}}``.
+
+    Args:
+        props: Keyword properties as passed to a graph-object constructor
+
+    Returns:
+        Nested property dict
+    """
+    result: dict[str, Any] = {}
+    for key, value in props.items():
+        *path, leaf = _split_path(key)
+        node: dict[str, Any] = {leaf: value}
+        for part in reversed(path):
+            node = {part: node}
+        _merge(result, node)
+    return result
+
+
+def scatter_spec(**props) -> dict[str, Any]:
+    """Scatter trace spec (the dict form of go.Scatter)."""
+    return {"type": "scatter", **expand_properties(props)}
+
+
+def bar_spec(**props) -> dict[str, Any]:
+    """Bar trace spec (the dict form of go.Bar)."""
+    return {"type": "bar", **expand_properties(props)}
+
+
+def frame_spec(
+    data: list[dict[str, Any]],
+    name: str,
+    layout: dict[str, Any] | None = None,
+    traces: list[int] | None = None,
+) -> dict[str, Any]:
+    """Animation frame spec (the dict form of go.Frame)."""
+    spec: dict[str, Any] = {"data": data, "name": name}
+    if layout is not None:
+        spec["layout"] = layout
+    if traces is not None:
+        spec["traces"] = traces
+    return spec
+
+
+def resolve_template(layout: dict[str, Any]) -> dict[str, Any]:
+    """Return the layout with a template name replaced by the registered template."""
+    if not isinstance(layout.get("template"), str):
+        return layout
+    return {**layout, "template": pio.templates[layout["template"]].to_plotly_json()}
+
+
+class FigureSpec:
+    """
+    Mutable figure description with the subset of the go.Figure API used by
+    the builders.
+
+    Traces, layout and frames are stored as plain dicts and only turned
+    into graph objects (if at all) by build(). Frames may be a FrameSource,
+    which stays lazy until the figure is built or streamed to a file.
+    """
+
+    def __init__(self):
+        self.data: list[dict[str, Any]] = []
+        self.layout: dict[str, Any] = {}
+        self.frames: list[dict[str, Any]] | FrameSource = []
+        self.encoding = "array"
+        self._full_resolution: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    def add_trace(self, trace: dict[str, Any]) -> "FigureSpec":
+        """Append a trace spec."""
+        self.data.append(trace)
+        return self
+
+    def update_layout(self, **props) -> "FigureSpec":
+        """Merge layout properties (magic underscores allowed)."""
+        _merge(self.layout, expand_properties(props))
+        return self
+
+    def add_hline(self, y: float, **line) -> "FigureSpec":
+        """Add a horizontal line across the plot, like go.Figure.add_hline."""
+        opacity = line.pop("opacity", None)
+        shape = {
+            "type": "line",
+            "xref": "x domain",
+            "x0": 0,
+            "x1": 1,
+            "yref": "y",
+            "y0": y,
+            "y1": y,
+            **expand_properties(line),
+        }
+        if opacity is not None:
+            shape["opacity"] = opacity
+        self.layout.setdefault("shapes", []).append(shape)
+        return self
+
+    def keep_full_resolution(self, trace_index: int, x: np.ndarray, y: np.ndarray) -> None:
+        """Attach undecimated samples to be stored with the built figure."""
+        self._full_resolution[trace_index] = (x, y)
+
+    def to_dict(self, include_frames: bool = True) -> dict[str, Any]:
+        """
+        Return the figure as a plain dict.
+
+        A template is kept as its registered name; go.Figure and the
+        validating plotly.io functions resolve it (see resolve_template for
+        writers that skip validation).
+        """
+        spec: dict[str, Any] = {"data": self.data, "layout": self.layout}
+        frames = list(self.frames) if include_frames else []
+        if frames:
+            spec["frames"] = frames
+        return spec
+
+    def build(
+        self,
+        output: str = "figure",
+        validate: bool | None = None,
+        encoding: str = "array",
+    ) -> "go.Figure | dict[str, Any] | FigureSpec":
+        """
+        Produce the final figure.
+
+        Args:
+            output: "figure" for a go.Figure, "dict" for the raw spec, or
+                "spec" for this FigureSpec unbuilt (frames stay lazy; write
+                it with streaming.write_json / streaming.write_html)
+            validate: Check every property with Plotly's validators
+                (defaults to VALIDATE_FIGURES)
+            encoding: "array" keeps NumPy arrays, "binary" stores x/y/z as
+                base64 typed arrays (see encoding.encode_array)
+
+        Returns:
+            go.Figure, figure dict or FigureSpec, depending on output
+        """
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output {output!r}, expected one of {OUTPUT_FORMATS}")
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown encoding {encoding!r}, expected one of {ENCODINGS}")
+        if validate is None:
+            validate = VALIDATE_FIGURES
+        if output == "spec":
+            self.encoding = encoding
+            return self
+
+        spec = self.to_dict()
+        if encoding == "binary":
+            spec = encode_figure(spec)
+        if output == "dict":
+            if self._full_resolution:
+                raise ValueError("keep_full_resolution requires output='figure'")
+            if validate:
+                go.Figure(spec)
+            return spec
+
+        fig = go.Figure({**spec, "layout": resolve_template(spec["layout"])}, _validate=validate)
+        for trace_index, (x, y) in self._full_resolution.items():
+            store_full_resolution(fig, trace_index, x, y)
+        return fig
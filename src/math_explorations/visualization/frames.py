@@ -0,0 +1,196 @@
+"""Lazily generated animation frames, and compiling frames and slider steps
+down to the traces that change."""
+
+from typing import Any, Callable, Iterable, Iterator
+import numpy as np
+
+# Slider/button methods whose first argument is a per-trace data update
+_RESTYLE_METHODS = {"restyle": 1, "update": 2}
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Compare two property values, treating arrays and lists by content."""
+    if a is b:
+        return True
+    if isinstance(a, dict) or isinstance(b, dict):
+        return (
+            isinstance(a, dict) and isinstance(b, dict)
+            and a.keys() == b.keys()
+            and all(_same(a[k], b[k]) for k in a)
+        )
+    if isinstance(a, str) or isinstance(b, str) or a is None or b is None:
+        return a == b
+    a_arr, b_arr = np.asarray(a), np.asarray(b)
+    if a_arr.shape != b_arr.shape:
+        return False
+    try:
+        return bool(np.array_equal(a_arr, b_arr, equal_nan=True))
+    except TypeError:
+        return bool(np.array_equal(a_arr, b_arr))
+
+
+class FrameSource:
+    """
+    Animation frames produced on demand by a generator function.
+
+    Every iteration calls the factory again, so the frames can be walked
+    several times (e.g. once by compile_frames, once by a streaming writer)
+    without ever being held in memory together.
+    """
+
+    def __init__(self, factory: Callable[[], Iterable[dict[str, Any]]], length: int | None = None):
+        self._factory = factory
+        self._length = length
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._factory())
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
+
+    def map(self, func: Callable[[dict[str, Any]], dict[str, Any]]) -> "FrameSource":
+        """Return a new source applying func to every frame as it is produced."""
+        return FrameSource(lambda: (func(frame) for frame in self), self._length)
+
+
+def _frame_state(frame: dict[str, Any]) -> dict[int, dict[str, Any]]:
+    """Map trace index to trace update for a positional or indexed frame."""
+    return dict(zip(frame.get("traces", range(len(frame["data"]))), frame["data"]))
+
+
+def _animated_properties(
+    base_data: list[dict[str, Any]],
+    frames: Iterable[dict[str, Any]],
+) -> dict[int, list[str]]:
+    """Find, per trace index, the properties some frame sets away from the base."""
+    keys: dict[int, dict[str, None]] = {}
+    varying: dict[int, set[str]] = {}
+    for frame in frames:
+        for index, trace in _frame_state(frame).items():
+            base = base_data[index]
+            seen = keys.setdefault(index, {})
+            changed = varying.setdefault(index, set())
+            for key, value in trace.items():
+                if key == "type":
+                    continue
+                seen[key] = None
+                if key not in changed and not _same(value, base.get(key)):
+                    changed.add(key)
+    return {
+        index: [key for key in keys[index] if key in varying[index]]
+        for index in sorted(keys)
+        if varying[index]
+    }
+
+
+def _compile_frame(
+    frame: dict[str, Any],
+    base_data: list[dict[str, Any]],
+    animated: dict[int, list[str]],
+) -> dict[str, Any]:
+    """Restrict one frame to the animated traces and properties."""
+    state = _frame_state(frame)
+    indices = [i for i in animated if i in state]
+    data = []
+    for i in indices:
+        trace = {"type": state[i]["type"]} if "type" in state[i] else {}
+        for key in animated[i]:
+            value = state[i].get(key, base_data[i].get(key))
+            if value is not None:
+                trace[key] = value
+        data.append(trace)
+    return {
+        **{k: v for k, v in frame.items() if k not in ("data", "traces")},
+        "data": data,
+        "traces": indices,
+    }
+
+
+def compile_frames(
+    base_data: list[dict[str, Any]],
+    frames: list[dict[str, Any]] | FrameSource,
+) -> list[dict[str, Any]] | FrameSource:
+    """
+    Strip frames down to the traces and properties that actually animate.
+
+    A property is kept only if some frame gives it a value different from
+    the base trace; it is then sent in every frame, so jumping straight to
+    any frame still shows the right state. Traces with no such property
+    are dropped and each frame lists the remaining ones in ``traces``.
+
+    Args:
+        base_data: Trace dicts of the figure (fig.data)
+        frames: Frame dicts whose data is positional (trace i = data[i]) or
+            indexed by an existing ``traces`` list, or a FrameSource of them
+
+    Returns:
+        New frame dicts with ``traces`` indices and only the animated values
+        (a FrameSource compiling each frame lazily if frames was one)
+    """
+    animated = _animated_properties(base_data, frames)
+    if isinstance(frames, FrameSource):
+        return frames.map(lambda frame: _compile_frame(frame, base_data, animated))
+    return [_compile_frame(frame, base_data, animated) for frame in frames]
+
+
+def compile_steps(
+    base_data: list[dict[str, Any]],
+    steps: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """
+    Restrict "update"/"restyle" slider steps to the traces that change.
+
+    Steps whose data update lists a value for every trace are rewritten to
+    send only the animated traces, passing their indices as the trace
+    argument. Other steps are returned unchanged.
+
+    Args:
+        base_data: Trace dicts of the figure (fig.data)
+        steps: Slider or button step dicts
+
+    Returns:
+        New step dicts
+    """
+    compilable = [
+        step for step in steps
+        if step.get("method") in _RESTYLE_METHODS
+        and len(step["args"]) <= _RESTYLE_METHODS[step["method"]]
+        and all(len(v) == len(base_data) for v in step["args"][0].values())
+    ]
+    if not compilable:
+        return steps
+
+    keys = dict.fromkeys(k for step in compilable for k in step["args"][0])
+    dynamic = sorted({
+        index
+        for key in keys
+        for index, base in enumerate(base_data)
+        if any(
+            key in step["args"][0] and not _same(step["args"][0][key][index], base.get(key))
+            for step in compilable
+        )
+    })
+    varying = [
+        key for key in keys
+        if any(
+            key in step["args"][0] and not _same(step["args"][0][key][i], base_data[i].get(key))
+            for step in compilable for i in dynamic
+        )
+    ]
+
+    compiled = []
+    for step in steps:
+        if not any(step is c for c in compilable):
+            compiled.append(step)
+            continue
+        update = {
+            key: [step["args"][0][key][i] for i in dynamic]
+            for key in varying if key in step["args"][0]
+        }
+        args = [update, *step["args"][1:], dynamic]
+        if step["method"] == "update" and len(args) == 2:
+            args.insert(1, {})
+        compiled.append({**step, "args": args})
+    return compiled
@@ -3,7 +3,45 @@
 from typing import Callable
 import numpy as np
 import plotly.graph_objects as go
-from .styles import DARK_THEME, COLORS, get_trace_style
+from .decimation import decimate
+from .evaluation import evaluate
+from .figure_spec import FigureSpec, scatter_spec
+from .sampling import adaptive_sample
+from .styles import TEMPLATE_NAME, COLORS, get_trace_style
+
+
+def _sample_curve(
+    f: Callable,
+    x_range: tuple[float, float],
+    num_points: int,
+    adaptive: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sample f on a uniform or adaptive grid, masking overflow as NaN."""
+    # Handle potential discontinuities
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if adaptive:
+            x, y = adaptive_sample(f, x_range, num_points)
+        else:
+            x = np.linspace(x_range[0], x_range[1], num_points)
+            y = evaluate(f, x)
+        y = np.where(np.abs(y) > 1e10, np.nan, y)
+    return x, y
+
+
+def _add_curve(
+    fig: FigureSpec,
+    x: np.ndarray,
+    y: np.ndarray,
+    pixel_width: int | None,
+    keep_full_resolution: bool,
+    **trace,
+) -> None:
+    """Add a line trace, decimating it first when pixel_width is given."""
+    if keep_full_resolution:
+        fig.keep_full_resolution(len(fig.data), x, y)
+    if pixel_width is not None:
+        x, y = decimate(x, y, pixel_width)
+    fig.add_trace(scatter_spec(x=x, y=y, **trace))
 
 
 def plot_function(
@@ -15,7 +53,12 @@ def plot_function(
     y_label: str = "y",
     name: str = "f(x)",
     show_grid: bool = True,
-) -> go.Figure:
+    adaptive: bool = False,
+    pixel_width: int | None = None,
+    keep_full_resolution: bool = False,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Create a plot of a single function.
 
@@ -28,43 +71,45 @@ def plot_function(
         y_label: Label for y-axis
         name: Name for legend
         show_grid: Whether to show grid lines
+        adaptive: Refine by curvature within a budget of num_points instead of
+            sampling a uniform grid
+        pixel_width: Decimate curves to about this many pixel columns before
+            building the traces (None keeps every sample)
+        keep_full_resolution: Keep the undecimated samples in a side buffer
+            for zoom re-sampling (see decimation.resample)
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure object
     """
-    x = np.linspace(x_range[0], x_range[1], num_points)
+    x, y = _sample_curve(f, x_range, num_points, adaptive)
 
-    # Handle potential discontinuities
-    with np.errstate(divide="ignore", invalid="ignore"):
-        y = f(x)
-        y = np.where(np.abs(y) > 1e10, np.nan, y)
-
-    fig = go.Figure()
+    fig = FigureSpec()
 
     style = get_trace_style("function")
-    fig.add_trace(go.Scatter(
-        x=x,
-        y=y,
+    _add_curve(
+        fig, x, y, pixel_width, keep_full_resolution,
         mode=style["mode"],
         line=style["line"],
         name=name,
         hovertemplate=f"{name}: (%{{x:.3f}}, %{{y:.3f}})<extra></extra>",
-    ))
+    )
 
     fig.update_layout(
-        **DARK_THEME,
-        title=title,
-        xaxis_title=x_label,
-        yaxis_title=y_label,
+        template=TEMPLATE_NAME,
+        title_text=title,
+        xaxis_title_text=x_label,
+        yaxis_title_text=y_label,
         showlegend=True,
         hovermode="closest",
     )
 
     if not show_grid:
-        fig.update_xaxes(showgrid=False)
-        fig.update_yaxes(showgrid=False)
+        fig.update_layout(xaxis_showgrid=False, yaxis_showgrid=False)
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def plot_derivative_comparison(
@@ -75,7 +120,12 @@ def plot_derivative_comparison(
     title: str = "Function and Its Derivative",
     f_name: str = "f(x)",
     f_prime_name: str = "f'(x)",
-) -> go.Figure:
+    adaptive: bool = False,
+    pixel_width: int | None = None,
+    keep_full_resolution: bool = False,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Plot a function alongside its derivative.
 
@@ -87,50 +137,52 @@ def plot_derivative_comparison(
         title: Plot title
         f_name: Name for function in legend
         f_prime_name: Name for derivative in legend
+        adaptive: Refine by curvature within a budget of num_points instead of
+            sampling a uniform grid
+        pixel_width: Decimate curves to about this many pixel columns before
+            building the traces (None keeps every sample)
+        keep_full_resolution: Keep the undecimated samples in a side buffer
+            for zoom re-sampling (see decimation.resample)
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure object
     """
-    x = np.linspace(x_range[0], x_range[1], num_points)
+    x, y = _sample_curve(f, x_range, num_points, adaptive)
+    x_prime, y_prime = _sample_curve(f_prime, x_range, num_points, adaptive)
 
-    with np.errstate(divide="ignore", invalid="ignore"):
-        y = f(x)
-        y_prime = f_prime(x)
-        y = np.where(np.abs(y) > 1e10, np.nan, y)
-        y_prime = np.where(np.abs(y_prime) > 1e10, np.nan, y_prime)
-
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Original function
-    fig.add_trace(go.Scatter(
-        x=x,
-        y=y,
+    _add_curve(
+        fig, x, y, pixel_width, keep_full_resolution,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
         name=f_name,
         hovertemplate=f"{f_name}: (%{{x:.3f}}, %{{y:.3f}})<extra></extra>",
-    ))
+    )
 
     # Derivative
-    fig.add_trace(go.Scatter(
-        x=x,
-        y=y_prime,
+    _add_curve(
+        fig, x_prime, y_prime, pixel_width, keep_full_resolution,
         mode="lines",
         line={"color": COLORS["secondary"], "width": 3},
         name=f_prime_name,
         hovertemplate=f"{f_prime_name}: (%{{x:.3f}}, %{{y:.3f}})<extra></extra>",
-    ))
+    )
 
     fig.update_layout(
-        **DARK_THEME,
-        title=title,
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=title,
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         showlegend=True,
         hovermode="x unified",
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def plot_tangent_line(
@@ -141,7 +193,12 @@ def plot_tangent_line(
     num_points: int = 500,
     title: str = "",
     tangent_extent: float = 2.0,
-) -> go.Figure:
+    adaptive: bool = False,
+    pixel_width: int | None = None,
+    keep_full_resolution: bool = False,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Plot a function with a tangent line at a specific point.
 
@@ -153,15 +210,20 @@ def plot_tangent_line(
         num_points: Number of points
         title: Plot title
         tangent_extent: How far tangent line extends from point
+        adaptive: Refine by curvature within a budget of num_points instead of
+            sampling a uniform grid
+        pixel_width: Decimate curves to about this many pixel columns before
+            building the traces (None keeps every sample)
+        keep_full_resolution: Keep the undecimated samples in a side buffer
+            for zoom re-sampling (see decimation.resample)
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure object
     """
-    x = np.linspace(x_range[0], x_range[1], num_points)
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        y = np.array([f(xi) for xi in x])
-        y = np.where(np.abs(y) > 1e10, np.nan, y)
+    x, y = _sample_curve(f, x_range, num_points, adaptive)
 
     y0 = f(x0)
     slope = f_prime(x0)
@@ -170,19 +232,18 @@ def plot_tangent_line(
     x_tangent = np.array([x0 - tangent_extent, x0 + tangent_extent])
     y_tangent = y0 + slope * (x_tangent - x0)
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Function
-    fig.add_trace(go.Scatter(
-        x=x,
-        y=y,
+    _add_curve(
+        fig, x, y, pixel_width, keep_full_resolution,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
         name="f(x)",
-    ))
+    )
 
     # Tangent line
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_tangent,
         y=y_tangent,
         mode="lines",
@@ -191,7 +252,7 @@ def plot_tangent_line(
     ))
 
     # Point of tangency
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x0],
         y=[y0],
         mode="markers",
@@ -204,14 +265,14 @@ def plot_tangent_line(
         title = f"Tangent Line at x = {x0} (slope = {slope:.3f})"
 
     fig.update_layout(
-        **DARK_THEME,
-        title=title,
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=title,
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         showlegend=True,
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def plot_secant_line(
@@ -221,7 +282,12 @@ def plot_secant_line(
     x_range: tuple[float, float] = (-5, 5),
     num_points: int = 500,
     title: str = "",
-) -> go.Figure:
+    adaptive: bool = False,
+    pixel_width: int | None = None,
+    keep_full_resolution: bool = False,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Plot a function with a secant line between two points.
 
@@ -232,15 +298,20 @@ def plot_secant_line(
         x_range: (min, max) for x-axis
         num_points: Number of points
         title: Plot title
+        adaptive: Refine by curvature within a budget of num_points instead of
+            sampling a uniform grid
+        pixel_width: Decimate curves to about this many pixel columns before
+            building the traces (None keeps every sample)
+        keep_full_resolution: Keep the undecimated samples in a side buffer
+            for zoom re-sampling (see decimation.resample)
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure object
     """
-    x = np.linspace(x_range[0], x_range[1], num_points)
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        y = np.array([f(xi) for xi in x])
-        y = np.where(np.abs(y) > 1e10, np.nan, y)
+    x, y = _sample_curve(f, x_range, num_points, adaptive)
 
     y0, y1 = f(x0), f(x1)
     slope = (y1 - y0) / (x1 - x0) if x1 != x0 else 0
@@ -250,19 +321,18 @@ def plot_secant_line(
     x_secant = np.array([x0 - padding, x1 + padding])
     y_secant = y0 + slope * (x_secant - x0)
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     # Function
-    fig.add_trace(go.Scatter(
-        x=x,
-        y=y,
+    _add_curve(
+        fig, x, y, pixel_width, keep_full_resolution,
         mode="lines",
         line={"color": COLORS["primary"], "width": 3},
         name="f(x)",
-    ))
+    )
 
     # Secant line
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=x_secant,
         y=y_secant,
         mode="lines",
@@ -271,7 +341,7 @@ def plot_secant_line(
     ))
 
     # Points
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_spec(
         x=[x0, x1],
         y=[y0, y1],
         mode="markers",
@@ -284,14 +354,14 @@ def plot_secant_line(
         title = f"Secant Line: slope = {slope:.4f}"
 
     fig.update_layout(
-        **DARK_THEME,
-        title=title,
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=title,
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         showlegend=True,
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
 
 
 def plot_multiple_functions(
@@ -299,7 +369,12 @@ def plot_multiple_functions(
     x_range: tuple[float, float] = (-5, 5),
     num_points: int = 500,
     title: str = "",
-) -> go.Figure:
+    adaptive: bool = False,
+    pixel_width: int | None = None,
+    keep_full_resolution: bool = False,
+    output: str = "figure",
+    encoding: str = "array",
+) -> go.Figure | dict:
     """
     Plot multiple functions on the same axes.
 
@@ -308,37 +383,41 @@ def plot_multiple_functions(
         x_range: (min, max) for x-axis
         num_points: Number of points
         title: Plot title
+        adaptive: Refine by curvature within a budget of num_points per
+            function instead of sampling a uniform grid
+        pixel_width: Decimate curves to about this many pixel columns before
+            building the traces (None keeps every sample)
+        keep_full_resolution: Keep the undecimated samples in a side buffer
+            for zoom re-sampling (see decimation.resample)
+        output: "figure" for a go.Figure or "dict" for the raw figure spec
+        encoding: "binary" to store x/y/z as base64 typed arrays (float32 when
+            precise enough) instead of NumPy arrays
 
     Returns:
         Plotly Figure object
     """
-    x = np.linspace(x_range[0], x_range[1], num_points)
     colors = [
         COLORS["primary"], COLORS["secondary"], COLORS["tertiary"],
         COLORS["quaternary"], COLORS["accent1"], COLORS["accent2"],
     ]
 
-    fig = go.Figure()
+    fig = FigureSpec()
 
     for i, (f, name) in enumerate(functions):
-        with np.errstate(divide="ignore", invalid="ignore"):
-            y = np.array([f(xi) for xi in x])
-            y = np.where(np.abs(y) > 1e10, np.nan, y)
-
-        fig.add_trace(go.Scatter(
-            x=x,
-            y=y,
+        x, y = _sample_curve(f, x_range, num_points, adaptive)
+        _add_curve(
+            fig, x, y, pixel_width, keep_full_resolution,
             mode="lines",
             line={"color": colors[i % len(colors)], "width": 3},
             name=name,
-        ))
+        )
 
     fig.update_layout(
-        **DARK_THEME,
-        title=title,
-        xaxis_title="x",
-        yaxis_title="y",
+        template=TEMPLATE_NAME,
+        title_text=title,
+        xaxis_title_text="x",
+        yaxis_title_text="y",
         showlegend=True,
     )
 
-    return fig
+    return fig.build(output, encoding=encoding)
@@ -0,0 +1,188 @@
+"""Adaptive sampling of functions for plotting."""
+
+from typing import Callable
+import numpy as np
+from .evaluation import evaluate
+
+# Points in the uniform grid the adaptive sampler starts from
+ADAPTIVE_INITIAL_POINTS = 33
+
+# Maximum midpoint deviation from the chord, as a fraction of the view height
+ADAPTIVE_TOLERANCE = 1e-3
+
+# Maximum number of times an initial interval is bisected
+ADAPTIVE_MAX_DEPTH = 12
+
+# Fraction of the sampled y extent added above and below the view window
+VIEW_PADDING = 0.25
+
+# Jump (fraction of the view height) across a fully refined interval treated as a break
+DISCONTINUITY_JUMP = 0.05
+
+
+def _view_window(y: np.ndarray) -> tuple[float, float]:
+    """Robust vertical window of the samples, ignoring asymptote tails."""
+    finite = y[np.isfinite(y)]
+    if finite.size == 0:
+        return -1.0, 1.0
+    low, high = np.percentile(finite, [2, 98])
+    if high <= low:
+        half = float(np.max(np.abs(finite))) or 1.0
+        low, high = low - half, high + half
+    pad = VIEW_PADDING * (high - low)
+    return float(low - pad), float(high + pad)
+
+
+def _flattest_removed(x: np.ndarray, y: np.ndarray, jumps: np.ndarray, count: int) -> np.ndarray:
+    """Mask keeping all but the count interior points closest to their neighbours' chord."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = (x[1:-1] - x[:-2]) / (x[2:] - x[:-2])
+        deviation = np.abs(y[1:-1] - (y[:-2] + t * (y[2:] - y[:-2])))
+    deviation = np.where(np.isfinite(deviation), deviation, np.inf)
+    # Alternate points only, so no two neighbours are removed together
+    deviation[1::2] = np.inf
+    protected = np.concatenate((jumps, jumps + 1)) - 1
+    deviation[protected[(protected >= 0) & (protected < deviation.size)]] = np.inf
+
+    keep = np.ones(len(x), dtype=bool)
+    drop = np.argsort(deviation, kind="stable")[:count]
+    keep[1 + drop[np.isfinite(deviation[drop])]] = False
+    return keep
+
+
+def _locate_jumps(
+    f: Callable[[np.ndarray], np.ndarray],
+    x_left: np.ndarray,
+    x_right: np.ndarray,
+    y_left: np.ndarray,
+    y_right: np.ndarray,
+    levels: np.ndarray,
+    low: float,
+    high: float,
+    scale: float,
+) -> np.ndarray:
+    """
+    Bisect intervals towards their largest on-screen jump.
+
+    Each interval is halved levels times, keeping the half with the larger
+    clipped jump; these evaluations do not add points to the curve. A jump
+    that still exceeds DISCONTINUITY_JUMP at the end is a discontinuity
+    (pole or step), a continuous steep stretch shrinks below it.
+
+    Returns:
+        x position of each break (the final midpoint), NaN where the
+        interval turned out to be continuous
+    """
+    x_left, x_right = x_left.astype(float), x_right.astype(float)
+    y_left, y_right = np.clip(y_left, low, high), np.clip(y_right, low, high)
+    for level in range(int(levels.max(initial=0))):
+        active = level < levels
+        x_mid = 0.5 * (x_left + x_right)
+        y_mid = np.clip(evaluate(f, x_mid), low, high)
+        with np.errstate(invalid="ignore"):
+            go_left = np.abs(y_mid - y_left) >= np.abs(y_right - y_mid)
+        right_half = active & ~go_left
+        left_half = active & go_left
+        x_left, y_left = np.where(right_half, x_mid, x_left), np.where(right_half, y_mid, y_left)
+        x_right, y_right = np.where(left_half, x_mid, x_right), np.where(left_half, y_mid, y_right)
+
+    with np.errstate(invalid="ignore"):
+        broken = np.abs(y_right - y_left) > DISCONTINUITY_JUMP * scale
+    return np.where(broken, 0.5 * (x_left + x_right), np.nan)
+
+
+def adaptive_sample(
+    f: Callable[[np.ndarray], np.ndarray],
+    x_range: tuple[float, float] = (-5, 5),
+    max_points: int = 500,
+    initial_points: int = ADAPTIVE_INITIAL_POINTS,
+    tolerance: float = ADAPTIVE_TOLERANCE,
+    max_depth: int = ADAPTIVE_MAX_DEPTH,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sample a function densely where it bends and sparsely where it is flat.
+
+    Starting from a uniform grid, each interval is bisected while its
+    midpoint deviates from the straight chord by more than tolerance times
+    the height of the view window, so refinement follows the local
+    curvature. Values are clipped to a robust window around the initial
+    samples first, so asymptote tails do not consume the budget. The worst
+    intervals are refined first when the point budget runs short.
+    Unresolved intervals that still jump across the view window are bisected
+    further (without adding points) and, where the jump persists down to
+    max_depth, treated as discontinuities: a NaN is inserted so the line is
+    broken there, dropping the flattest points if the budget is exhausted.
+
+    Args:
+        f: Function to sample (vectorized or scalar)
+        x_range: (min, max) for x
+        max_points: Point budget, including inserted NaN separators
+        initial_points: Size of the starting uniform grid
+        tolerance: Allowed chord deviation as a fraction of the view height
+        max_depth: Maximum bisections of an initial interval
+
+    Returns:
+        Tuple of (x, y) arrays sorted by x
+    """
+    initial_points = max(2, min(initial_points, (max_points + 1) // 2))
+    x = np.linspace(x_range[0], x_range[1], initial_points)
+    y = evaluate(f, x)
+    low, high = _view_window(y)
+    scale = high - low
+
+    # Per-interval state: bisection depth and the error that motivated it
+    depth = np.zeros(len(x) - 1, dtype=int)
+    priority = np.full(len(x) - 1, np.inf)
+
+    while True:
+        candidates = np.flatnonzero((priority > tolerance) & (depth < max_depth))
+        budget = max_points - len(x)
+        if candidates.size == 0 or budget <= 0:
+            break
+        if candidates.size > budget:
+            worst = np.argsort(-priority[candidates], kind="stable")[:budget]
+            candidates = np.sort(candidates[worst])
+
+        x_mid = 0.5 * (x[candidates] + x[candidates + 1])
+        y_mid = evaluate(f, x_mid)
+        # Measure the error on screen: points clipped to the window agree
+        y_left, y_right = np.clip(y[candidates], low, high), np.clip(y[candidates + 1], low, high)
+        with np.errstate(invalid="ignore"):
+            error = np.abs(np.clip(y_mid, low, high) - 0.5 * (y_left + y_right)) / scale
+
+        # Refine towards the edge of the domain; ignore intervals outside it
+        finite = np.isfinite(np.stack([y[candidates], y_mid, y[candidates + 1]]))
+        error = np.where(finite.all(axis=0), error, np.where(finite.any(axis=0), np.inf, 0.0))
+
+        x = np.insert(x, candidates + 1, x_mid)
+        y = np.insert(y, candidates + 1, y_mid)
+        depth = np.insert(depth, candidates + 1, 0)
+        priority = np.insert(priority, candidates + 1, 0.0)
+        left = candidates + np.arange(candidates.size)
+        child_depth = depth[left] + 1
+        depth[left] = depth[left + 1] = child_depth
+        priority[left] = priority[left + 1] = error
+
+    # Break the line across unresolved jumps, locating each one first when
+    # the budget ran out before its interval reached max_depth
+    with np.errstate(invalid="ignore"):
+        jumps = np.flatnonzero(
+            (priority > tolerance)
+            & (np.abs(np.diff(np.clip(y, low, high))) > DISCONTINUITY_JUMP * scale)
+        )
+    position = _locate_jumps(f, x[jumps], x[jumps + 1], y[jumps], y[jumps + 1],
+                             max_depth - depth[jumps], low, high, scale)
+    found = np.isfinite(position)
+    jumps, position = jumps[found], position[found]
+    # Separators count towards the budget: make room by dropping flat points
+    overflow = len(x) + jumps.size - max_points
+    if overflow > 0:
+        keep = _flattest_removed(x, np.clip(y, low, high), jumps, overflow)
+        jumps = np.cumsum(keep)[jumps] - 1
+        x, y = x[keep], y[keep]
+        jumps, position = jumps[: max_points - len(x)], position[: max_points - len(x)]
+    if jumps.size:
+        x = np.insert(x, jumps + 1, position)
+        y = np.insert(y, jumps + 1, np.nan)
+
+    return x, y
@@ -0,0 +1,109 @@
+"""Serialize figures frame by frame, so lazily generated frames never pile up in memory."""
+
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+from .client import PARAMETRIC_SCRIPT, has_parametric_meta
+from .encoding import encode_figure, encode_frame
+from .figure_spec import FigureSpec, resolve_template
+
+
+@contextmanager
+def _open(file: str | Path | IO[str]) -> Iterator[IO[str]]:
+    """Yield a writable text stream for a path or an already open file."""
+    if hasattr(file, "write"):
+        yield file
+    else:
+        with open(file, "w", encoding="utf-8") as stream:
+            yield stream
+
+
+def _head(spec: FigureSpec, encoding: str) -> dict[str, Any]:
+    """The figure dict without frames, template embedded and encoded as requested."""
+    head = spec.to_dict(include_frames=False)
+    head = {**head, "layout": resolve_template(head["layout"])}
+    return encode_figure(head) if encoding == "binary" else head
+
+
+def _iter_frames(spec: FigureSpec, encoding: str) -> Iterator[str]:
+    """Yield the JSON of each frame, comma separated, as it is generated."""
+    for i, frame in enumerate(spec.frames):
+        if encoding == "binary":
+            frame = encode_frame(frame)
+        yield ("," if i else "") + to_json_plotly(frame)
+
+
+def iter_json(spec: FigureSpec, encoding: str | None = None) -> Iterator[str]:
+    """
+    Yield the figure's JSON in chunks: data and layout first, then one frame at a time.
+
+    Args:
+        spec: Figure description (e.g. a builder called with output="spec")
+        encoding: "array" or "binary" (defaults to spec.encoding)
+
+    Returns:
+        Iterator of JSON text chunks that concatenate to a figure dict
+    """
+    encoding = encoding or spec.encoding
+    head = _head(spec, encoding)
+    yield '{"data":' + to_json_plotly(head["data"]) + ',"layout":' + to_json_plotly(head["layout"])
+    yield ',"frames":['
+    yield from _iter_frames(spec, encoding)
+    yield "]}"
+
+
+def write_json(spec: FigureSpec, file: str | Path | IO[str], encoding: str | None = None) -> None:
+    """
+    Write a figure as JSON, serializing frames one at a time.
+
+    Args:
+        spec: Figure description (e.g. a builder called with output="spec")
+        file: Path or writable text file
+        encoding: "array" or "binary" (defaults to spec.encoding)
+    """
+    with _open(file) as stream:
+        for chunk in iter_json(spec, encoding):
+            stream.write(chunk)
+
+
+def write_html(
+    spec: FigureSpec,
+    file: str | Path | IO[str],
+    encoding: str | None = None,
+    **html_options,
+) -> None:
+    """
+    Write a figure as a standalone HTML page, serializing frames one at a time.
+
+    The page is produced by plotly.io.to_html (so every option such as
+    include_plotlyjs, auto_play or post_script behaves as usual) with a
+    placeholder frame that is replaced by the streamed frames. Figures
+    with client-side parametric traces get client.PARAMETRIC_SCRIPT added
+    to their post_script.
+
+    Args:
+        spec: Figure description (e.g. a builder called with output="spec")
+        file: Path or writable text file
+        encoding: "array" or "binary" (defaults to spec.encoding)
+        **html_options: Keyword arguments for plotly.io.to_html
+    """
+    encoding = encoding or spec.encoding
+    if has_parametric_meta(spec.layout):
+        post_script = html_options.get("post_script") or []
+        if isinstance(post_script, str):
+            post_script = [post_script]
+        html_options["post_script"] = [*post_script, PARAMETRIC_SCRIPT]
+    placeholder = {"name": f"streamed-frames-{uuid.uuid4()}"}
+    page = pio.to_html({**_head(spec, encoding), "frames": [placeholder]}, validate=False, **html_options)
+    before, after = page.split(to_json_plotly([placeholder]), 1)
+
+    with _open(file) as stream:
+        stream.write(before)
+        stream.write("[")
+        for chunk in _iter_frames(spec, encoding):
+            stream.write(chunk)
+        stream.write("]")
+        stream.write(after)
@@ -1,6 +1,8 @@
 """Consistent dark theme styling for all visualizations."""
 
 from typing import Any
+import plotly.graph_objects as go
+import plotly.io as pio
 
 # Dark theme color palette
 COLORS = {
@@ -42,7 +44,7 @@ DARK_THEME: dict[str, Any] = {
         "zerolinecolor": COLORS["text_secondary"],
         "zerolinewidth": 2,
         "tickfont": {"color": COLORS["text_secondary"]},
-        "titlefont": {"color": COLORS["text"]},
+        "title": {"font": {"color": COLORS["text"]}},
     },
     "yaxis": {
         "gridcolor": COLORS["grid"],
@@ -50,7 +52,7 @@ DARK_THEME: dict[str, Any] = {
         "zerolinecolor": COLORS["text_secondary"],
         "zerolinewidth": 2,
         "tickfont": {"color": COLORS["text_secondary"]},
-        "titlefont": {"color": COLORS["text"]},
+        "title": {"font": {"color": COLORS["text"]}},
     },
     "legend": {
         "bgcolor": "rgba(22, 33, 62, 0.8)",
@@ -71,6 +73,9 @@ DARK_THEME: dict[str, Any] = {
     },
 }
 
+# Name under which DARK_THEME is registered in plotly.io.templates
+TEMPLATE_NAME = "math_dark"
+
 # Animation settings
 ANIMATION_SETTINGS: dict[str, Any] = {
     "frame_duration": 50,
@@ -89,9 +94,29 @@ SLIDER_STYLE: dict[str, Any] = {
 }
 
 
+def register_dark_template() -> str:
+    """
+    Register DARK_THEME as a named Plotly template.
+
+    The theme is layered on a copy of Plotly's default "plotly" template, so
+    figures keep its axis automargin, colorway, trace defaults and so on,
+    exactly as when DARK_THEME was applied on top of the default layout.
+    Builders reference the template by name, so the theme is validated once
+    here instead of on every figure. Registering again is a no-op.
+
+    Returns:
+        The template name (TEMPLATE_NAME)
+    """
+    if TEMPLATE_NAME not in pio.templates:
+        template = go.layout.Template(pio.templates["plotly"])
+        template.layout.update(DARK_THEME)
+        pio.templates[TEMPLATE_NAME] = template
+    return TEMPLATE_NAME
+
+
 def apply_dark_theme(fig: Any) -> Any:
     """Apply the dark theme to a Plotly figure."""
-    fig.update_layout(**DARK_THEME)
+    fig.update_layout(template=register_dark_template())
     return fig
 
 
@@ -138,3 +163,6 @@ def get_trace_style(trace_type: str = "function") -> dict[str, Any]:
         },
     }
     return styles.get(trace_type, styles["function"])
+
+
+register_dark_template()
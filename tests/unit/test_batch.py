@@ -0,0 +1,102 @@
+"""Unit tests for batched step-by-step derivations."""
+
+from pathlib import Path
+
+import signal
+import time
+
+import pytest
+import sympy as sp
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus.batch import batch_derivative_steps
+from math_explorations.calculus.derivatives import symbolic_derivative_steps
+from math_explorations.calculus.workers import time_limit
+
+# Large enough that simplify cannot finish within a tiny budget
+SLOW = "(" + " + ".join(f"{i + 1}*x**{i}" for i in range(31)) + ")*sin(x)*exp(cos(x))"
+
+
+class TestBatchDerivativeSteps:
+    """Test the process-pool batch API."""
+
+    def test_results_in_input_order(self):
+        """Verify results line up with inputs across chunks."""
+        exprs = [f"x**{n}" for n in range(2, 10)]
+        results = batch_derivative_steps(exprs, max_workers=2, chunksize=3)
+        assert [r.index for r in results] == list(range(len(exprs)))
+        assert [r.steps[-1]["expression"] for r in results] == [
+            sp.sympify(f"{n}*x**{n - 1}") for n in range(2, 10)
+        ]
+
+    def test_matches_serial_steps(self):
+        """Verify parallel output equals the serial function."""
+        result = batch_derivative_steps(["sin(x)*x"], max_workers=2)[0]
+        assert result.steps == symbolic_derivative_steps("sin(x)*x")
+
+    def test_failures_are_isolated(self):
+        """Verify a bad expression does not drop the rest of its chunk."""
+        results = batch_derivative_steps(["x**2", "(", "cos(x)"], max_workers=2, chunksize=3)
+        assert [r.ok for r in results] == [True, False, True]
+        assert "SympifyError" in results[1].error
+
+    def test_per_item_timeout(self):
+        """Verify a slow item times out while its neighbours complete."""
+        results = batch_derivative_steps([SLOW, "x**3"], max_workers=2, chunksize=2, timeout=0.2)
+        assert not results[0].ok
+        assert "timed out" in results[0].error
+        assert results[1].ok
+
+    def test_reports_timing(self):
+        """Verify every item records its elapsed time."""
+        results = batch_derivative_steps(["x**2", "exp(x)"], max_workers=1)
+        assert all(r.elapsed >= 0 for r in results)
+
+    def test_no_timeout(self):
+        """Verify timeout=None runs every item without a budget."""
+        results = batch_derivative_steps(["x**2", "sin(x)"], max_workers=1, timeout=None)
+        assert all(r.ok for r in results)
+
+    @pytest.mark.parametrize("timeout", [0, -1.0])
+    def test_non_positive_timeout_rejected(self, timeout):
+        """Verify a zero or negative budget raises instead of meaning unlimited."""
+        with pytest.raises(ValueError):
+            batch_derivative_steps(["x**2"], max_workers=1, timeout=timeout)
+
+
+class TestTimeLimit:
+    """Test the in-process SIGALRM budget."""
+
+    def test_none_means_no_limit(self):
+        """Verify None runs the block without a budget."""
+        with time_limit(None):
+            value = sum(range(10))
+        assert value == 45
+
+    @pytest.mark.parametrize("seconds", [0, -0.5])
+    def test_non_positive_rejected(self, seconds):
+        """Verify zero or negative budgets raise ValueError."""
+        with pytest.raises(ValueError):
+            with time_limit(seconds):
+                pass
+
+    def test_enclosing_limit_survives_inner_block(self):
+        """Verify an outer budget is re-armed after a shorter inner one."""
+        with pytest.raises(TimeoutError):
+            with time_limit(0.3):
+                with time_limit(5.0):
+                    pass
+                remaining, _ = signal.getitimer(signal.ITIMER_REAL)
+                assert 0 < remaining <= 0.3
+                time.sleep(1.0)
+
+    def test_shorter_enclosing_limit_fires_first(self):
+        """Verify an inner budget longer than the outer one does not extend it."""
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            with time_limit(0.1):
+                with time_limit(5.0):
+                    time.sleep(1.0)
+        assert time.perf_counter() - start < 0.9
@@ -0,0 +1,85 @@
+"""Unit tests for client-side parametric animations."""
+
+from pathlib import Path
+
+import io
+import json
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+from plotly.io.json import to_json_plotly
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization.client import PARAMETRIC_SCRIPT
+from math_explorations.visualization.animations import animate_power_rule
+from math_explorations.visualization.streaming import iter_json, write_html
+
+
+def _run_script(figure: dict, frame_name: str) -> list:
+    """Run PARAMETRIC_SCRIPT in node against a stub graph div and return the restyled y values."""
+    harness = f"""
+    var figure = {json.dumps(figure)};
+    var handlers = {{}};
+    var gd = {{layout: figure.layout, data: figure.data, on: function (e, h) {{ handlers[e] = h; }}}};
+    var document = {{getElementById: function () {{ return gd; }}}};
+    var Plotly = {{restyle: function (g, update, traces) {{ console.log(JSON.stringify(update.y)); }}}};
+    {PARAMETRIC_SCRIPT.replace("{plot_id}", "plot")}
+    handlers['plotly_animatingframe']({{name: {json.dumps(frame_name)}}});
+    """
+    result = subprocess.run(["node", "-e", harness], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+class TestClientSidePowerRule:
+    """Verify frames carry only n and the browser recomputes the curves."""
+
+    def test_frames_carry_no_data(self):
+        """Verify every frame is just a name and a title."""
+        spec = animate_power_rule(n_values=np.linspace(0.5, 3, 6), client_side=True, output="spec").to_dict()
+        assert all(frame["data"] == [] and frame["traces"] == [] for frame in spec["frames"])
+        assert [frame["name"] for frame in spec["frames"]] == ["0.5", "1", "1.5", "2", "2.5", "3"]
+        assert spec["layout"]["meta"]["parametric"]["traces"] == [0, 1]
+
+    def test_size_is_additive(self):
+        """Verify output grows with num_points + frames, not their product."""
+        def size(num_points, num_frames):
+            spec = animate_power_rule(
+                num_points=num_points, n_values=np.linspace(1, 5, num_frames), client_side=True, output="spec",
+            )
+            return len("".join(iter_json(spec)))
+
+        base = size(200, 100)
+        assert size(200, 400) - base < 4 * (base - size(200, 10))
+        full = len("".join(iter_json(animate_power_rule(n_values=np.linspace(1, 5, 400), output="spec"))))
+        assert size(200, 400) < full / 20
+
+    def test_html_includes_script(self):
+        """Verify streaming.write_html adds the evaluator."""
+        buffer = io.StringIO()
+        write_html(animate_power_rule(client_side=True, output="spec"), buffer, include_plotlyjs=False)
+        assert "plotly_animatingframe" in buffer.getvalue()
+
+    @pytest.mark.parametrize("output", ["figure", "dict"])
+    def test_rejected_without_streaming(self, output):
+        """Verify outputs shown without the script cannot enable client_side."""
+        with pytest.raises(ValueError, match="output='spec'"):
+            animate_power_rule(client_side=True, output=output)
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+    def test_script_matches_python(self):
+        """Verify the JS curves equal the precomputed frames, NaN gaps included."""
+        n_values = [0.5, 3]
+        # plotly.js hands the script decoded arrays, so serialize x as plain lists
+        client = json.loads(to_json_plotly(
+            animate_power_rule(n_values=n_values, client_side=True, output="spec").to_dict()
+        ))
+        precomputed = animate_power_rule(n_values=n_values, output="dict")
+        for frame in precomputed["frames"]:
+            y_f, y_fp = _run_script(client, frame["name"])
+            expected = [np.asarray(trace["y"], dtype=float) for trace in frame["data"]]
+            np.testing.assert_allclose(np.array(y_f, dtype=float), expected[0], rtol=1e-12)
+            np.testing.assert_allclose(np.array(y_fp, dtype=float), expected[1], rtol=1e-12)
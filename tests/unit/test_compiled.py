@@ -0,0 +1,75 @@
+"""Unit tests for the compiled-callable registry."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus.compiled import CompiledFunctionRegistry, function_registry
+from math_explorations.calculus.derivatives import create_function, create_derivative_function
+
+x, y = sp.symbols("x y")
+
+
+class TestCompiledFunctionRegistry:
+    """Test reuse and persistence of lambdified callables."""
+
+    def test_same_key_returns_same_callable(self):
+        """Verify create_function does not re-lambdify identical input."""
+        assert create_function("x**2 + sin(x)") is create_function("sin(x) + x**2")
+        assert create_derivative_function("x**3") is create_derivative_function("x**3")
+
+    def test_modules_are_part_of_key(self):
+        """Verify different lambdify modules produce different callables."""
+        registry = CompiledFunctionRegistry()
+        numpy_f = registry.compile(sp.sin(x), x, ["numpy"])
+        math_f = registry.compile(sp.sin(x), x, ["math"])
+        assert numpy_f is not math_f
+        assert registry.info().currsize == 2
+
+    def test_compile_time_reported(self):
+        """Verify each entry records its compile time."""
+        registry = CompiledFunctionRegistry()
+        entry = registry.get(sp.exp(x) * sp.cos(x), x)
+        assert entry.compile_time >= 0
+        assert registry.compile_times() == {
+            (sp.exp(x) * sp.cos(x), (x,), ("numpy",)): entry.compile_time
+        }
+
+    def test_compile_times_keep_every_entry(self):
+        """Verify entries differing only in args or modules are all reported."""
+        registry = CompiledFunctionRegistry()
+        registry.compile(x * y, x)
+        registry.compile(x * y, (x, y))
+        registry.compile(x * y, x, ["math"])
+        assert len(registry.compile_times()) == 3
+
+    def test_matrix_input(self):
+        """Verify a mutable Matrix is compiled and cached like an expression."""
+        registry = CompiledFunctionRegistry()
+        matrix = sp.Matrix([[x**2, sp.sin(x)]])
+        f = registry.compile(matrix, x)
+        np.testing.assert_allclose(f(0.0), [[0.0, 0.0]])
+        assert registry.compile(sp.Matrix([[x**2, sp.sin(x)]]), x) is f
+        assert registry.info().currsize == 1
+
+    def test_multiple_arguments(self):
+        """Verify callables can take several symbols in order."""
+        f = function_registry.compile(x**2 * y, (x, y))
+        assert f(2.0, 3.0) == pytest.approx(12.0)
+
+    def test_source_persisted_and_reloaded(self, tmp_path: Path):
+        """Verify a cold registry rebuilds the callable from disk."""
+        expr = sp.sin(x) * sp.exp(x) + sp.pi
+        warm = CompiledFunctionRegistry(cache_dir=tmp_path)
+        expected = warm.compile(expr, x)(np.array([0.0, 1.0]))
+        assert len(list(tmp_path.glob("*.py"))) == 1
+
+        cold = CompiledFunctionRegistry(cache_dir=tmp_path)
+        entry = cold.get(expr, x)
+        assert entry.from_disk
+        np.testing.assert_allclose(entry(np.array([0.0, 1.0])), expected)
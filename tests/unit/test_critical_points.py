@@ -0,0 +1,80 @@
+"""Unit tests for the critical-point finder."""
+
+from pathlib import Path
+
+import math
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus.critical_points import find_critical_points
+from math_explorations.visualization.animations import create_optimization_plot
+
+
+class TestFindCriticalPoints:
+    """Verify roots of f' are located, deduplicated and classified."""
+
+    def test_simple_extrema(self):
+        """Verify a cubic's maximum and minimum are found precisely."""
+        points = find_critical_points(lambda x: x**3 - 3 * x, lambda x: 3 * x**2 - 3, lambda x: 6 * x)
+        assert [p.kind for p in points] == ["maximum", "minimum"]
+        np.testing.assert_allclose([p.x for p in points], [-1, 1], atol=1e-12)
+        np.testing.assert_allclose([p.y for p in points], [2, -2], atol=1e-12)
+
+    def test_coarse_grid_is_still_accurate(self):
+        """Verify Brent refinement does not depend on the grid spacing."""
+        points = find_critical_points(np.sin, np.cos, lambda x: -np.sin(x), (-10, 10), num_points=20)
+        expected = np.pi / 2 + np.pi * np.arange(-3, 3)
+        np.testing.assert_allclose([p.x for p in points], expected, atol=1e-12)
+
+    def test_double_root_is_found(self):
+        """Verify a stationary inflection (f' touching zero) is reported."""
+        points = find_critical_points(lambda x: x**3, lambda x: 3 * x**2, lambda x: 6 * x)
+        assert len(points) == 1
+        assert points[0].x == pytest.approx(0, abs=1e-6)
+        assert points[0].kind == "inflection"
+
+    def test_flat_extremum_uses_first_derivative_test(self):
+        """Verify f'' = 0 at a minimum of x**4 still classifies it as a minimum."""
+        points = find_critical_points(lambda x: x**4, lambda x: 4 * x**3, lambda x: 12 * x**2)
+        assert [p.kind for p in points] == ["minimum"]
+
+    def test_mixed_roots(self):
+        """Verify simple and double roots of f' are both found and sorted."""
+        points = find_critical_points(
+            lambda x: (x - 0.3) ** 3 * (x + 1),
+            lambda x: (x - 0.3) ** 2 * (4 * x + 2.7),
+        )
+        np.testing.assert_allclose([p.x for p in points], [-0.675, 0.3], atol=1e-6)
+        assert [p.kind for p in points] == ["minimum", "inflection"]
+
+    def test_grid_root_is_not_duplicated(self):
+        """Verify a root lying exactly on the grid is reported once."""
+        points = find_critical_points(lambda x: x**2, lambda x: 2 * x, x_range=(-1, 1), num_points=11)
+        assert len(points) == 1
+
+    def test_poles_and_near_misses_are_rejected(self):
+        """Verify sign changes through a pole and near-zero minima are ignored."""
+        assert find_critical_points(lambda x: np.log(np.abs(x)), lambda x: 1 / x) == []
+        assert find_critical_points(lambda x: x**3 + 0.01 * x, lambda x: 3 * x**2 + 0.01) == []
+
+    def test_constant_function(self):
+        """Verify a constant function has no isolated critical points."""
+        assert find_critical_points(lambda x: 0 * x + 1, lambda x: 0 * x) == []
+
+
+class TestOptimizationPlot:
+    """Verify the plot marks the points returned by the finder."""
+
+    def test_markers(self):
+        """Verify scalar callables are supported and every point is drawn."""
+        fig = create_optimization_plot(math.sin, math.cos, lambda x: -math.sin(x))
+        assert [trace.name for trace in fig.data[3:]] == ["Minimum at x=-1.57", "Maximum at x=1.57"]
+
+    def test_double_root_marker(self):
+        """Verify the stationary inflection of x**3 is now marked."""
+        fig = create_optimization_plot(lambda x: x**3, lambda x: 3 * x**2, lambda x: 6 * x)
+        assert fig.data[3].text == ("Inflection",)
@@ -0,0 +1,118 @@
+"""Unit tests for shape-preserving trace decimation."""
+
+from pathlib import Path
+
+import gc
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization import decimation
+from math_explorations.visualization.decimation import (
+    decimate,
+    lttb,
+    minmax_decimate,
+    full_resolution,
+    resample,
+)
+from math_explorations.visualization.function_plots import plot_function
+
+
+@pytest.fixture
+def noisy_signal():
+    """A large oscillating signal with a NaN gap in the middle."""
+    rng = np.random.default_rng(0)
+    x = np.linspace(-5, 5, 200_000)
+    y = np.sin(20 * x) + 0.05 * rng.standard_normal(x.size)
+    y[100_000:100_010] = np.nan
+    return x, y
+
+
+class TestDecimate:
+    """Verify both methods shrink traces while keeping their shape."""
+
+    @pytest.mark.parametrize("method", ["minmax", "lttb"])
+    def test_budget_and_order(self, noisy_signal, method):
+        """Verify the output fits the pixel budget and stays sorted."""
+        x, y = decimate(*noisy_signal, pixel_width=400, method=method)
+        assert len(x) <= 2 * 400 + 5  # plus run endpoints and the gap marker
+        assert np.all(np.diff(x) > 0)
+
+    @pytest.mark.parametrize("method", ["minmax", "lttb"])
+    def test_gap_is_preserved(self, noisy_signal, method):
+        """Verify a NaN gap still breaks the decimated line."""
+        x, y = decimate(*noisy_signal, pixel_width=400, method=method)
+        assert np.isnan(y).sum() == 1
+        assert abs(x[np.isnan(y)][0]) < 1e-3
+
+    def test_minmax_keeps_extremes(self, noisy_signal):
+        """Verify the global min and max survive min/max decimation."""
+        _, y_full = noisy_signal
+        _, y = decimate(*noisy_signal, pixel_width=100)
+        assert np.nanmax(y) == np.nanmax(y_full)
+        assert np.nanmin(y) == np.nanmin(y_full)
+
+    def test_small_traces_are_untouched(self):
+        """Verify traces already under budget are returned as is."""
+        x = np.linspace(0, 1, 50)
+        out_x, out_y = decimate(x, x**2, pixel_width=100)
+        np.testing.assert_array_equal(out_x, x)
+
+    def test_lttb_keeps_endpoints_and_spike(self):
+        """Verify LTTB keeps the first, last and a lone spike point."""
+        x = np.arange(10_000, dtype=float)
+        y = np.zeros_like(x)
+        y[5_000] = 10.0
+        out_x, out_y = lttb(x, y, 100)
+        assert len(out_x) == 100
+        assert out_x[0] == 0 and out_x[-1] == 9_999
+        assert 10.0 in out_y
+
+    def test_minmax_bucket_count(self):
+        """Verify at most two interior points are kept per bucket."""
+        x = np.linspace(0, 1, 10_000)
+        out_x, _ = minmax_decimate(x, np.sin(40 * x), 50)
+        assert len(out_x) <= 2 * 50 + 2
+
+    def test_minmax_buckets_follow_x_not_index(self):
+        """Verify unevenly spaced samples get equal-width buckets, not equal-count ones."""
+        x = np.concatenate((np.linspace(0, 0.01, 9_000, endpoint=False), np.linspace(0.01, 1, 1_000)))
+        y = np.sin(40 * x)
+        out_x, _ = minmax_decimate(x, y, 50)
+        per_bucket, _ = np.histogram(out_x[1:-1], bins=np.linspace(0, 1, 51))
+        assert per_bucket.max() <= 2
+        assert per_bucket.sum() > 60
+
+    def test_unknown_method(self):
+        """Verify an unknown method is rejected."""
+        with pytest.raises(ValueError):
+            decimate(np.arange(10.0), np.arange(10.0), 2, method="median")
+
+
+class TestFullResolutionBuffer:
+    """Verify the side buffer used for zoom re-sampling."""
+
+    def test_plot_function_decimates_and_buffers(self):
+        """Verify the emitted trace is small while the buffer keeps every sample."""
+        fig = plot_function(np.sin, num_points=100_000, pixel_width=300, keep_full_resolution=True)
+        assert len(fig.data[0].x) <= 2 * 300 + 2
+        assert full_resolution(fig)[0][0].size == 100_000
+
+    def test_resample_zoomed_window(self):
+        """Verify resampling rebuilds the visible window from the buffer."""
+        fig = plot_function(np.sin, num_points=100_000, pixel_width=300, keep_full_resolution=True)
+        resample(fig, (0.0, 0.5), pixel_width=300)
+        x = np.asarray(fig.data[0].x)
+        assert x[0] <= 0.0 and x[-1] >= 0.5 and x[-1] < 0.51
+        assert len(x) <= 2 * 300 + 2
+
+    def test_buffer_released_with_figure(self):
+        """Verify the buffer is dropped when the figure is collected."""
+        fig = plot_function(np.sin, num_points=1_000, keep_full_resolution=True)
+        key = id(fig)
+        del fig
+        gc.collect()
+        assert key not in decimation._full_resolution
@@ -0,0 +1,229 @@
+"""Unit tests for symbolic derivative helpers."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus import derivatives
+from math_explorations.calculus.derivatives import (
+    differentiate,
+    derivative,
+    derivative_tower,
+    nth_derivative,
+    partial_derivative,
+    derivative_at_point,
+    derivative_at_points,
+    derivative_cache_info,
+    clear_derivative_cache,
+)
+
+x, y = sp.symbols("x y")
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test with an empty derivative cache."""
+    clear_derivative_cache()
+    yield
+    clear_derivative_cache()
+
+
+class TestDerivativeCache:
+    """Test memoization of simplified derivatives."""
+
+    def test_repeated_calls_hit_cache(self):
+        """Verify the second identical call is served from the cache."""
+        assert derivative("sin(x)**2") == derivative("sin(x)**2")
+        info = derivative_cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_equivalent_inputs_share_entry(self):
+        """Verify canonical forms of the same expression share a key."""
+        derivative("x**2 + 1")
+        derivative(1 + x**2, x)
+        assert derivative_cache_info().currsize == 1
+
+    def test_variable_is_part_of_key(self):
+        """Verify orders share one tower while variables get separate entries."""
+        assert nth_derivative("x**3", "x", 2) == 6 * x
+        assert nth_derivative("x**3", "x", 3) == 6
+        assert partial_derivative("x**2 * y", "y") == x**2
+        assert partial_derivative("x**2 * y", "x", "y") == 2 * x
+        assert derivative_cache_info().currsize == 3
+
+    def test_repeated_partial_matches_nth_derivative(self):
+        """Verify d/dx d/dx collapses onto the same key as the 2nd derivative."""
+        assert partial_derivative("x**4", "x", "x") == nth_derivative("x**4", "x", 2)
+        assert derivative_cache_info().currsize == 1
+
+    def test_lru_eviction(self, monkeypatch):
+        """Verify the least recently used entry is evicted at the size bound."""
+        monkeypatch.setattr(derivatives, "_derivative_cache", derivatives.LRUCache(2))
+        derivative("x**2")
+        derivative("x**3")
+        derivative("x**2")
+        derivative("x**4")
+        derivative("x**2")
+        info = derivative_cache_info()
+        assert info.currsize == 2
+        assert info.hits == 2
+
+    def test_derivative_at_point_uses_cache(self):
+        """Verify point evaluation reuses the cached derivative."""
+        assert derivative_at_point("x**2", "x", 3.0) == pytest.approx(6.0)
+        assert derivative_at_point("x**2", "x", 4.0) == pytest.approx(8.0)
+        assert derivative_cache_info().hits == 1
+
+
+class TestDerivativeAtPoints:
+    """Test vectorized derivative evaluation."""
+
+    def test_matches_per_point_path(self):
+        """Verify batched values agree with derivative_at_point."""
+        points = np.linspace(-3, 3, 7)
+        expected = [derivative_at_point("sin(x) * x**2", "x", p) for p in points]
+        np.testing.assert_allclose(derivative_at_points("sin(x) * x**2", "x", points), expected)
+
+    def test_constant_derivative_broadcasts(self):
+        """Verify a constant derivative still returns one value per point."""
+        result = derivative_at_points("3*x", "x", np.zeros((2, 3)))
+        assert result.shape == (2, 3)
+        assert np.all(result == 3.0)
+
+    def test_mpmath_fallback_for_overflow(self):
+        """Verify non-finite float results are recomputed with mpmath."""
+        result = derivative_at_points("log(exp(x) + 1)", "x", [0.0, 1000.0])
+        np.testing.assert_allclose(result, [0.5, 1.0])
+
+    def test_undefined_points_stay_nan(self):
+        """Verify points outside the real domain are reported as NaN."""
+        result = derivative_at_points("sqrt(x)", "x", [-1.0, 4.0])
+        assert np.isnan(result[0])
+        assert result[1] == pytest.approx(0.25)
+
+
+class TestSimplifyStrategies:
+    """Test configurable simplification of derivatives."""
+
+    LARGE = "(" + " + ".join(f"{i + 1}*x**{i}" for i in range(31)) + ")*sin(x)"
+
+    def test_none_skips_simplify(self):
+        """Verify the raw diff result is returned unchanged."""
+        result = differentiate("x**2 * sin(x)", "x", strategy="none")
+        assert result.method == "none"
+        assert result.expr == sp.diff(x**2 * sp.sin(x), x)
+
+    def test_cheap_chooses_rewrite_by_shape(self):
+        """Verify rational functions are cancelled and trig uses trigsimp."""
+        assert differentiate("(x**2 - 1)/(x - 1)", "x", strategy="cheap").method == "cancel"
+        assert differentiate("sin(x)**2 * x", "x", strategy="cheap").method == "trigsimp"
+
+    def test_results_are_equivalent(self):
+        """Verify every strategy yields the same mathematical derivative."""
+        full = derivative("exp(x)*cos(x)**2")
+        for strategy in ("none", "cheap"):
+            other = derivative("exp(x)*cos(x)**2", "x", strategy=strategy)
+            assert sp.simplify(full - other) == 0
+
+    def test_metadata_reports_elapsed_time(self):
+        """Verify elapsed time and requested strategy are exposed."""
+        result = differentiate("x**3", "x", strategy="cheap")
+        assert result.strategy == "cheap"
+        assert result.elapsed >= 0
+
+    def test_timed_falls_back_to_cheap(self):
+        """Verify an exhausted budget returns the cheap result."""
+        result = differentiate(self.LARGE, "x", strategy="timed", timeout=0.01)
+        assert result.timed_out
+        assert result.method != "simplify"
+        assert sp.expand(result.expr - sp.diff(sp.sympify(self.LARGE), x)) == 0
+
+    def test_partial_derivative_accepts_strategy(self):
+        """Verify partial_derivative forwards the strategy."""
+        assert partial_derivative("x**2 * y", "x", "y", strategy="none") == 2 * x
+
+    def test_unknown_strategy_rejected(self):
+        """Verify an invalid strategy name raises ValueError."""
+        with pytest.raises(ValueError):
+            derivative("x**2", "x", strategy="fastest")
+
+
+class TestDerivativeTower:
+    """Test incremental computation of successive derivatives."""
+
+    def test_orders_match_nth_derivative(self):
+        """Verify each order equals a from-scratch nth derivative."""
+        tower = derivative_tower("x**5 * exp(x)")
+        for n in range(1, 5):
+            expected = sp.diff(x**5 * sp.exp(x), x, n)
+            assert sp.simplify(tower[n] - expected) == 0
+
+    def test_next_order_costs_one_diff(self, monkeypatch):
+        """Verify asking for order n+1 differentiates only once."""
+        tower = derivative_tower("sin(x) * x**2")
+        tower[3]
+        calls = []
+        original = derivatives.diff
+        monkeypatch.setattr(
+            derivatives, "diff", lambda *args: calls.append(args) or original(*args)
+        )
+        tower[4]
+        assert len(calls) == 1
+
+    def test_only_requested_order_is_simplified(self, monkeypatch):
+        """Verify nth_derivative runs the chosen strategy once, not once per order."""
+        calls = []
+        original = derivatives.simplify_with_strategy
+        monkeypatch.setattr(
+            derivatives, "simplify_with_strategy",
+            lambda expr, *args: calls.append(args) or original(expr, *args),
+        )
+        result = nth_derivative("x**3 * sin(x)", "x", 5)
+        assert sp.simplify(result - sp.diff(x**3 * sp.sin(x), x, 5)) == 0
+        assert calls == [("full", derivatives.SIMPLIFY_TIMEOUT)]
+
+    @pytest.mark.parametrize("expr, n", [
+        ("1/(1 + exp(-x))", 1),
+        ("log(x**2 + 1)", 2),
+        ("tan(x)**2", 2),
+        ("exp(x)*(x + 1)**3", 2),
+    ])
+    def test_matches_simplified_diff(self, expr, n):
+        """Verify the tower returns the same form as simplify(diff(expr, x, n))."""
+        expected = sp.simplify(sp.diff(sp.sympify(expr), x, n))
+        assert nth_derivative(expr, "x", n) == expected
+
+    def test_elapsed_accumulates_over_steps(self):
+        """Verify elapsed covers every step from order 0, not just the last."""
+        tower = derivative_tower("exp(x) * cos(x)**3", strategy="cheap")
+        assert tower.result(4).elapsed >= tower.result(3).elapsed > 0
+
+    def test_generator_is_lazy(self):
+        """Verify orders are only computed as the generator advances."""
+        tower = derivative_tower("cos(x)**2", strategy="cheap")
+        orders = tower.iter_orders()
+        assert len(tower) == 1
+        next(orders)
+        next(orders)
+        assert len(tower) == 2
+
+    def test_nth_derivative_reuses_tower(self):
+        """Verify nth_derivative calls extend the shared tower."""
+        nth_derivative("x**6", "x", 2)
+        nth_derivative("x**6", "x", 3)
+        assert len(derivative_tower("x**6")) == 4
+
+    def test_evaluate_batches_all_orders(self):
+        """Verify the tower evaluates every order over an array at once."""
+        points = np.linspace(-1, 1, 5)
+        values = derivative_tower("x**3").evaluate(points, 4)
+        assert values.shape == (5, 5)
+        np.testing.assert_allclose(values[1], 3 * points**2)
+        np.testing.assert_allclose(values[3], 6.0)
+        np.testing.assert_allclose(values[4], 0.0)
@@ -0,0 +1,105 @@
+"""Unit tests for base64 typed-array encoding of trace data."""
+
+from pathlib import Path
+
+import base64
+import math
+
+import numpy as np
+import plotly.io as pio
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization.encoding import encode_array, encode_figure
+from math_explorations.visualization.figure_spec import set_figure_validation
+from math_explorations.visualization.function_plots import plot_function
+from math_explorations.visualization.animations import (
+    animate_limit_process,
+    animate_area_accumulation,
+)
+
+
+def _decode(spec: dict) -> np.ndarray:
+    """Decode a typed-array spec back into a NumPy array."""
+    return np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<" + spec["dtype"])
+
+
+class TestEncodeArray:
+    """Verify dtype selection and round trips of encode_array."""
+
+    def test_plot_grid_downcasts_to_float32(self):
+        """Verify ordinary plot data is sent as float32."""
+        x = np.linspace(-5, 5, 500)
+        spec = encode_array(x)
+        assert spec["dtype"] == "f4"
+        np.testing.assert_allclose(_decode(spec), x, rtol=1e-6, atol=1e-6)
+
+    def test_large_offset_keeps_float64(self):
+        """Verify data whose span float32 cannot resolve stays float64."""
+        x = 1e6 + np.linspace(0, 1e-3, 100)
+        spec = encode_array(x)
+        assert spec["dtype"] == "f8"
+        np.testing.assert_array_equal(_decode(spec), x)
+
+    def test_nan_gaps_survive(self):
+        """Verify NaN separators are preserved in float32."""
+        y = np.sin(np.linspace(0, 3, 20))
+        y[5] = np.nan
+        decoded = _decode(encode_array(y))
+        assert np.isnan(decoded[5]) and np.isfinite(np.delete(decoded, 5)).all()
+
+    def test_integers_use_smallest_type(self):
+        """Verify integer arrays are narrowed to the smallest plotly.js type."""
+        assert encode_array(np.arange(10))["dtype"] == "i1"
+        assert encode_array(np.arange(200, 210))["dtype"] == "u1"
+        assert encode_array(np.arange(0, 70_000, 7_000))["dtype"] == "u2"
+        assert encode_array(np.arange(-10, 100_000, 10_000))["dtype"] == "i4"
+
+    def test_two_dimensional_shape(self):
+        """Verify 2-D arrays carry their shape."""
+        spec = encode_array(np.ones((3, 4)))
+        assert spec["shape"] == "3, 4"
+
+    def test_short_and_non_numeric_values_unchanged(self):
+        """Verify small arrays and strings are left as is."""
+        assert encode_array([1.0, 2.0]) == [1.0, 2.0]
+        labels = ["a"] * 10
+        assert encode_array(labels) is labels
+
+
+class TestBinaryBuilders:
+    """Verify builders can emit binary-encoded traces and frames."""
+
+    def test_plot_function_binary(self):
+        """Verify curve coordinates are encoded and the JSON shrinks."""
+        plain = pio.to_json(plot_function(np.sin, num_points=2_000, output="dict"))
+        spec = plot_function(np.sin, num_points=2_000, output="dict", encoding="binary")
+        assert spec["data"][0]["x"]["dtype"] == "f4"
+        assert len(pio.to_json(spec)) < 0.6 * len(plain)
+
+    def test_frames_are_encoded(self):
+        """Verify frame traces are encoded as well as the base traces."""
+        spec = animate_limit_process(math.sin, math.cos, 1.0, num_frames=3, delta_frames=False, output="dict", encoding="binary")
+        assert "bdata" in spec["frames"][0]["data"][0]["y"]
+
+    def test_binary_figure_is_valid(self):
+        """Verify Plotly's validators accept the typed-array specs."""
+        set_figure_validation(True)
+        try:
+            fig = animate_area_accumulation(math.exp, encoding="binary")
+        finally:
+            set_figure_validation(False)
+        assert fig.data[0].x["dtype"] == "f4"
+
+    def test_encode_figure_does_not_mutate(self):
+        """Verify encode_figure returns a new spec."""
+        spec = plot_function(np.sin, output="dict")
+        encode_figure(spec)
+        assert isinstance(spec["data"][0]["x"], np.ndarray)
+
+    def test_unknown_encoding(self):
+        """Verify an unknown encoding is rejected."""
+        with pytest.raises(ValueError):
+            plot_function(np.sin, encoding="msgpack")
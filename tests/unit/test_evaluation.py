@@ -0,0 +1,114 @@
+"""Unit tests for the array evaluation layer used by the plot builders."""
+
+from pathlib import Path
+
+import math
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization import evaluation
+from math_explorations.visualization.evaluation import (
+    evaluate,
+    supports_broadcasting,
+    clear_evaluation_cache,
+)
+from math_explorations.visualization.animations import (
+    create_secant_to_tangent,
+    animate_limit_process,
+    create_tangent_line_plot,
+    animate_chain_rule,
+    create_optimization_plot,
+    animate_area_accumulation,
+)
+
+
+class CountingFunction:
+    """Vectorized x**2 that records how many times it was called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return np.asarray(x) ** 2
+
+
+class TestSupportsBroadcasting:
+    """Verify the broadcasting probe and its per-callable cache."""
+
+    def test_numpy_function_broadcasts(self):
+        """Verify ufuncs and numpy lambdas are detected as vectorized."""
+        assert supports_broadcasting(np.sin)
+        assert supports_broadcasting(lambda x: x**2 + 1)
+
+    def test_scalar_function_does_not_broadcast(self):
+        """Verify math-module functions fall back to per-point calls."""
+        assert not supports_broadcasting(math.sin)
+        assert not supports_broadcasting(lambda x: math.exp(x))
+
+    def test_reducing_function_does_not_broadcast(self):
+        """Verify a callable that reduces its input is not trusted."""
+        assert not supports_broadcasting(lambda x: max(x, 1.0) if np.ndim(x) == 0 else np.max(x))
+
+    def test_array_only_reduction_does_not_broadcast(self):
+        """Verify built-in max, which fails on floats, is not trusted."""
+        assert not supports_broadcasting(max)
+        assert not supports_broadcasting(lambda x: np.sum(np.asarray(x)[:, None]))
+
+    def test_array_only_elementwise_broadcasts(self):
+        """Verify a callable that only accepts arrays but maps element-wise is trusted."""
+        assert supports_broadcasting(lambda x: np.asarray(x)[:] * 2)
+
+    def test_probe_result_is_cached(self):
+        """Verify the probe runs once per callable."""
+        clear_evaluation_cache()
+        f = CountingFunction()
+        supports_broadcasting(f)
+        probed = f.calls
+        supports_broadcasting(f)
+        assert f.calls == probed
+        assert f in evaluation._probe_cache
+
+
+class TestEvaluate:
+    """Verify evaluate matches per-point calls with a single array call."""
+
+    def test_vectorized_callable_is_called_once(self):
+        """Verify a broadcasting callable gets one call per evaluation."""
+        f = CountingFunction()
+        supports_broadcasting(f)
+        before = f.calls
+        y = evaluate(f, np.linspace(0, 1, 500))
+        assert f.calls == before + 1
+        np.testing.assert_allclose(y, np.linspace(0, 1, 500) ** 2)
+
+    def test_scalar_callable(self):
+        """Verify scalar callables are mapped and keep the input shape."""
+        x = np.linspace(0, 3, 12).reshape(3, 4)
+        np.testing.assert_allclose(evaluate(math.sin, x), np.sin(x))
+
+    def test_constant_callable_is_broadcast(self):
+        """Verify a constant function returns one value per point."""
+        np.testing.assert_allclose(evaluate(lambda x: 2.0, np.arange(4)), [2.0] * 4)
+
+    def test_domain_errors_become_nan(self):
+        """Verify math domain errors in scalar callables give NaN."""
+        y = evaluate(math.log, np.array([-1.0, 0.0, 1.0]))
+        assert np.isnan(y[0]) and np.isnan(y[1]) and y[2] == 0.0
+
+
+class TestAnimationsUseEvaluation:
+    """Verify the animation builders accept scalar-only callables."""
+
+    def test_builders_with_math_functions(self):
+        """Verify every builder runs with functions from the math module."""
+        create_secant_to_tangent(math.sin, math.cos, 1.0)
+        animate_limit_process(math.sin, math.cos, 1.0, num_frames=5)
+        create_tangent_line_plot(math.sin, math.cos)
+        animate_chain_rule(math.sin, math.exp, math.cos, math.exp)
+        create_optimization_plot(math.sin, math.cos, lambda x: -math.sin(x))
+        fig = animate_area_accumulation(math.exp)
+        assert len(fig.frames) == 7
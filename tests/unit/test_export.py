@@ -0,0 +1,129 @@
+"""Unit tests for the parallel notebook export scheduler."""
+
+from pathlib import Path
+
+import json
+import threading
+import time
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations import export
+from math_explorations.export import (
+    NotebookExportError,
+    export_all,
+    export_notebooks,
+    get_all_notebooks,
+    load_export_timings,
+    schedule_exports,
+)
+
+# Simulated runtime of each fake export
+EXPORT_DELAY = 0.1
+
+
+@pytest.fixture
+def fake_export(monkeypatch):
+    """Replace the marimo subprocess with a short sleep; records call order and concurrency."""
+    calls: list[str] = []
+    running = {"now": 0, "max": 0}
+    lock = threading.Lock()
+    failing: set[str] = set()
+
+    def export_notebook(notebook_path, output_dir, include_code=False):
+        with lock:
+            calls.append(notebook_path.stem)
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        try:
+            time.sleep(EXPORT_DELAY)
+            if notebook_path.stem in failing:
+                raise RuntimeError("cell raised")
+            output_path = output_dir / f"{notebook_path.stem}.html"
+            output_path.write_text("<html></html>")
+            return output_path
+        finally:
+            with lock:
+                running["now"] -= 1
+
+    monkeypatch.setattr(export, "export_notebook", export_notebook)
+    return calls, running, failing
+
+
+class TestScheduleExports:
+    """Verify longest-job-first ordering."""
+
+    def test_order(self):
+        """Verify unknown notebooks go first, then by decreasing runtime."""
+        notebooks = [Path(f"{name}.py") for name in ("a", "b", "c", "d")]
+        ordered = schedule_exports(notebooks, {"a": 1.0, "b": 30.0, "d": 5.0})
+        assert [nb.stem for nb in ordered] == ["c", "b", "d", "a"]
+
+
+class TestExportNotebooks:
+    """Verify concurrent exports and failure isolation."""
+
+    def test_runs_concurrently(self, fake_export, tmp_path):
+        """Verify wall time is close to one export, not the sum."""
+        _, running, _ = fake_export
+        notebooks = get_all_notebooks()
+        start = time.perf_counter()
+        results = list(export_notebooks(notebooks, tmp_path, max_workers=len(notebooks)))
+        assert time.perf_counter() - start < EXPORT_DELAY * len(notebooks) / 2
+        assert running["max"] == len(notebooks)
+        assert all(result.ok for result in results)
+
+    def test_worker_limit(self, fake_export, tmp_path):
+        """Verify no more than max_workers exports run at once."""
+        _, running, _ = fake_export
+        list(export_notebooks(get_all_notebooks(), tmp_path, max_workers=2))
+        assert running["max"] == 2
+
+    def test_failure_is_isolated(self, fake_export, tmp_path):
+        """Verify one failing notebook does not stop the others."""
+        _, _, failing = fake_export
+        notebooks = get_all_notebooks()
+        failing.add(notebooks[0].stem)
+        results = {r.notebook.stem: r for r in export_notebooks(notebooks, tmp_path, max_workers=3)}
+        assert not results[notebooks[0].stem].ok
+        assert isinstance(results[notebooks[0].stem].error, RuntimeError)
+        assert all(results[nb.stem].ok for nb in notebooks[1:])
+
+
+class TestExportAll:
+    """Verify the site build uses and records timings and reports failures at the end."""
+
+    def test_longest_job_first(self, fake_export, tmp_path):
+        """Verify the recorded slowest notebook starts first."""
+        calls, _, _ = fake_export
+        notebooks = get_all_notebooks()
+        timings_path = tmp_path / "timings.json"
+        timings_path.write_text(json.dumps({nb.stem: float(i) for i, nb in enumerate(notebooks)}))
+        export_all(tmp_path / "site", max_workers=1, timings_path=timings_path)
+        assert calls == [nb.stem for nb in reversed(notebooks)]
+
+    def test_generated_files_and_timings(self, fake_export, tmp_path):
+        """Verify every page plus the index is returned and runtimes are saved."""
+        timings_path = tmp_path / "timings.json"
+        generated = export_all(tmp_path / "site", timings_path=timings_path)
+        notebooks = get_all_notebooks()
+        assert [path.name for path in generated] == [f"{nb.stem}.html" for nb in notebooks] + ["index.html"]
+        timings = load_export_timings(timings_path)
+        assert set(timings) == {nb.stem for nb in notebooks}
+        assert all(seconds >= EXPORT_DELAY for seconds in timings.values())
+
+    def test_failure_raises_after_index(self, fake_export, tmp_path):
+        """Verify the index is written without the broken notebook before raising."""
+        _, _, failing = fake_export
+        broken = get_all_notebooks()[1]
+        failing.add(broken.stem)
+        site = tmp_path / "site"
+        with pytest.raises(NotebookExportError) as info:
+            export_all(site, timings_path=tmp_path / "timings.json")
+        assert [result.notebook for result in info.value.failures] == [broken]
+        index = (site / "index.html").read_text()
+        assert f"{broken.stem}.html" not in index
+        assert len(list(site.glob("*.html"))) == len(get_all_notebooks())
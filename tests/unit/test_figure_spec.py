@@ -0,0 +1,142 @@
+"""Unit tests for validation-free figure construction."""
+
+from pathlib import Path
+
+import math
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization import figure_spec
+from math_explorations.visualization.figure_spec import (
+    FigureSpec,
+    expand_properties,
+    scatter_spec,
+    set_figure_validation,
+)
+from math_explorations.visualization.styles import TEMPLATE_NAME
+from math_explorations.visualization.function_plots import (
+    plot_function,
+    plot_derivative_comparison,
+    plot_tangent_line,
+    plot_secant_line,
+    plot_multiple_functions,
+)
+from math_explorations.visualization.animations import (
+    create_secant_to_tangent,
+    animate_limit_process,
+    create_tangent_line_plot,
+    animate_power_rule,
+    animate_chain_rule,
+    animate_projectile_motion,
+    create_optimization_plot,
+    animate_area_accumulation,
+)
+
+BUILDERS = {
+    "plot_function": lambda **kw: plot_function(np.sin, **kw),
+    "plot_derivative_comparison": lambda **kw: plot_derivative_comparison(np.sin, np.cos, **kw),
+    "plot_tangent_line": lambda **kw: plot_tangent_line(np.sin, np.cos, 1.0, **kw),
+    "plot_secant_line": lambda **kw: plot_secant_line(np.sin, 0.0, 1.0, **kw),
+    "plot_multiple_functions": lambda **kw: plot_multiple_functions([(np.sin, "sin")], **kw),
+    "create_secant_to_tangent": lambda **kw: create_secant_to_tangent(np.sin, np.cos, 1.0, **kw),
+    "animate_limit_process": lambda **kw: animate_limit_process(np.sin, np.cos, 1.0, num_frames=5, **kw),
+    "create_tangent_line_plot": lambda **kw: create_tangent_line_plot(np.sin, np.cos, **kw),
+    "animate_power_rule": lambda **kw: animate_power_rule(max_n=3, **kw),
+    "animate_chain_rule": lambda **kw: animate_chain_rule(np.sin, np.exp, np.cos, np.exp, **kw),
+    "animate_projectile_motion": lambda **kw: animate_projectile_motion(num_frames=5, **kw),
+    "create_optimization_plot": lambda **kw: create_optimization_plot(
+        lambda x: x**3 - 3 * x, lambda x: 3 * x**2 - 3, lambda x: 6 * x, **kw
+    ),
+    "animate_area_accumulation": lambda **kw: animate_area_accumulation(math.exp, **kw),
+}
+
+
+@pytest.fixture
+def validated():
+    """Enable graph-object validation for the duration of a test."""
+    set_figure_validation(True)
+    yield
+    set_figure_validation(False)
+
+
+class TestExpandProperties:
+    """Verify magic-underscore expansion matches Plotly's conventions."""
+
+    def test_nested_paths(self):
+        """Verify underscores become nested dicts and siblings merge."""
+        props = expand_properties({"xaxis_title_text": "x", "xaxis_range": [0, 1], "name": "f"})
+        assert props == {"xaxis": {"title": {"text": "x"}, "range": [0, 1]}, "name": "f"}
+
+    def test_underscore_property_names(self):
+        """Verify properties such as error_y and paper_bgcolor are not split."""
+        props = expand_properties({"error_y_array": [1], "error_y_visible": True, "paper_bgcolor": "red"})
+        assert props == {"error_y": {"array": [1], "visible": True}, "paper_bgcolor": "red"}
+        assert go.Scatter(scatter_spec(x=[0], y=[0], error_y_array=[1])).error_y.array == (1,)
+
+    def test_layout_merge(self):
+        """Verify update_layout merges into existing nested dicts."""
+        fig = FigureSpec().update_layout(title_text="a", xaxis={"range": [0, 1]})
+        fig.update_layout(title_font_size=20, xaxis_title_text="x")
+        assert fig.layout == {
+            "title": {"text": "a", "font": {"size": 20}},
+            "xaxis": {"range": [0, 1], "title": {"text": "x"}},
+        }
+
+    def test_add_hline_matches_plotly(self):
+        """Verify the hline shape equals the one go.Figure.add_hline creates."""
+        spec = FigureSpec().add_hline(y=0, line_dash="dot", line_color="red", opacity=0.5)
+        expected = go.Figure().add_hline(y=0, line_dash="dot", line_color="red", opacity=0.5)
+        assert spec.layout["shapes"][0] == expected.layout.shapes[0].to_plotly_json()
+
+
+class TestBuildOutputs:
+    """Verify every builder can return a go.Figure or a raw dict spec."""
+
+    @pytest.mark.parametrize("name", BUILDERS)
+    def test_dict_output(self, name):
+        """Verify dict output references the template by name and serializes to JSON."""
+        spec = BUILDERS[name](output="dict")
+        assert isinstance(spec, dict)
+        assert spec["data"] and all("type" in trace for trace in spec["data"])
+        assert spec["layout"]["template"] == TEMPLATE_NAME
+        assert pio.to_json(spec)
+
+    @pytest.mark.parametrize("name", BUILDERS)
+    def test_specs_pass_validation(self, name, validated):
+        """Verify builders produce only valid properties when validation is on."""
+        fig = BUILDERS[name]()
+        assert isinstance(fig, go.Figure)
+        BUILDERS[name](output="dict")
+
+    def test_dict_and_figure_agree(self):
+        """Verify both outputs describe the same figure."""
+        spec = animate_limit_process(np.sin, np.cos, 1.0, num_frames=5, output="dict")
+        fig = animate_limit_process(np.sin, np.cos, 1.0, num_frames=5)
+        assert go.Figure(spec).to_dict() == fig.to_dict()
+
+    def test_invalid_property_is_caught_when_validating(self):
+        """Verify the validation switch surfaces bad properties."""
+        spec = FigureSpec().add_trace(scatter_spec(x=[0], y=[0], bogus=1))
+        assert spec.build("dict", validate=False)["data"][0]["bogus"] == 1
+        with pytest.raises(ValueError):
+            spec.build("figure", validate=True)
+
+    def test_unknown_output(self):
+        """Verify an unknown output format is rejected."""
+        with pytest.raises(ValueError):
+            plot_function(np.sin, output="html")
+
+    def test_full_resolution_requires_figure(self):
+        """Verify the zoom buffer cannot be attached to a dict spec."""
+        with pytest.raises(ValueError):
+            plot_function(np.sin, keep_full_resolution=True, output="dict")
+
+    def test_validation_defaults_off(self):
+        """Verify figures are built without validation by default."""
+        assert figure_spec.VALIDATE_FIGURES is False
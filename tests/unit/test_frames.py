@@ -0,0 +1,170 @@
+"""Unit tests for the frame and slider-step delta compiler."""
+
+from pathlib import Path
+
+import copy
+import math
+
+import numpy as np
+import plotly.io as pio
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization.frames import compile_frames, compile_steps
+from math_explorations.visualization.animations import (
+    animate_limit_process,
+    animate_projectile_motion,
+    create_secant_to_tangent,
+    create_tangent_line_plot,
+)
+
+
+def _apply(state, data, traces=None):
+    """Merge trace updates into a state the way Plotly.animate does."""
+    state = copy.deepcopy(state)
+    for index, update in zip(traces if traces is not None else range(len(data)), data):
+        state[index].update(update)
+    return state
+
+
+def _assert_states_equal(left, right):
+    for a, b in zip(left, right):
+        for key in ("x", "y"):
+            np.testing.assert_array_equal(np.asarray(a.get(key)), np.asarray(b.get(key)))
+
+
+BASE = [
+    {"type": "scatter", "x": np.arange(5.0), "y": np.arange(5.0) ** 2, "name": "curve"},
+    {"type": "scatter", "x": [0.0, 1.0], "y": [0.0, 1.0], "name": "line"},
+    {"type": "scatter", "x": [0.0], "y": [0.0], "name": "point"},
+]
+FRAMES = [
+    {"name": str(k), "data": [
+        {"type": "scatter", "x": BASE[0]["x"], "y": BASE[0]["y"]},
+        {"type": "scatter", "x": [0.0, 1.0], "y": [0.0, float(k)]},
+        {"type": "scatter", "x": [float(k)], "y": [float(k)]},
+    ]}
+    for k in range(4)
+]
+
+
+class TestCompileFrames:
+    """Verify frames keep only animated traces and properties."""
+
+    def test_static_trace_is_dropped(self):
+        """Verify the unchanged curve is not resent in any frame."""
+        compiled = compile_frames(BASE, FRAMES)
+        assert all(frame["traces"] == [1, 2] for frame in compiled)
+        assert all(frame["name"] == str(k) for k, frame in enumerate(compiled))
+
+    def test_constant_properties_are_dropped(self):
+        """Verify properties equal to the base trace are omitted."""
+        compiled = compile_frames(BASE, FRAMES)
+        assert set(compiled[2]["data"][0]) == {"type", "y"}
+        assert set(compiled[2]["data"][1]) == {"type", "x", "y"}
+
+    def test_random_access_matches_full_frames(self):
+        """Verify jumping between any two frames gives the full-frame state."""
+        compiled = compile_frames(BASE, FRAMES)
+        for j in range(len(FRAMES)):
+            for k in range(len(FRAMES)):
+                full = _apply(BASE, FRAMES[k]["data"])
+                state = _apply(BASE, compiled[j]["data"], compiled[j]["traces"])
+                state = _apply(state, compiled[k]["data"], compiled[k]["traces"])
+                _assert_states_equal(state, full)
+
+
+class TestCompileSteps:
+    """Verify update steps are restricted to the traces that change."""
+
+    def _steps(self):
+        return [
+            {
+                "method": "update",
+                "args": [
+                    {
+                        "x": [frame["data"][i]["x"] for i in range(3)],
+                        "y": [frame["data"][i]["y"] for i in range(3)],
+                    },
+                    {"title": frame["name"]},
+                ],
+                "label": frame["name"],
+            }
+            for frame in FRAMES
+        ]
+
+    def test_trace_indices_are_added(self):
+        """Verify steps carry only the dynamic traces and their indices."""
+        compiled = compile_steps(BASE, self._steps())
+        args = compiled[1]["args"]
+        assert args[2] == [1, 2]
+        assert len(args[0]["y"]) == 2
+        assert args[1] == {"title": "1"}
+
+    def test_random_access_matches_full_steps(self):
+        """Verify any step applied after another reproduces the full update."""
+        steps = self._steps()
+        compiled = compile_steps(BASE, steps)
+
+        def restyle(state, update, traces):
+            data = [{key: values[n] for key, values in update.items()} for n in range(len(traces))]
+            return _apply(state, data, traces)
+
+        for j in range(len(steps)):
+            for k in range(len(steps)):
+                full = restyle(BASE, steps[k]["args"][0], range(3))
+                state = restyle(BASE, compiled[j]["args"][0], compiled[j]["args"][2])
+                state = restyle(state, compiled[k]["args"][0], compiled[k]["args"][2])
+                _assert_states_equal(state, full)
+
+    def test_steps_with_indices_are_left_alone(self):
+        """Verify steps that already name their traces are not rewritten."""
+        steps = [{"method": "restyle", "args": [{"y": [[1, 2]]}, [1]]}]
+        assert compile_steps(BASE, steps) == steps
+
+
+class TestBuildersUseDeltas:
+    """Verify the animation builders shrink with delta frames."""
+
+    def test_limit_process_frames(self):
+        """Verify the static curve is only sent once."""
+        spec = animate_limit_process(math.sin, math.cos, 1.0, num_frames=10, output="dict")
+        assert all(0 not in frame["traces"] for frame in spec["frames"])
+        full = animate_limit_process(math.sin, math.cos, 1.0, num_frames=10, delta_frames=False, output="dict")
+        assert len(pio.to_json(spec)) < len(pio.to_json(full)) / 3
+
+    def test_slider_builders(self):
+        """Verify slider steps no longer resend the function curve."""
+        for build in (
+            lambda **kw: create_secant_to_tangent(math.sin, math.cos, 1.0, **kw),
+            lambda **kw: create_tangent_line_plot(math.sin, math.cos, **kw),
+        ):
+            spec = build(output="dict")
+            steps = spec["layout"]["sliders"][0]["steps"]
+            assert all(0 not in step["args"][-1] for step in steps)
+            full = build(delta_frames=False, output="dict")
+            assert len(pio.to_json(spec)) < len(pio.to_json(full)) / 3
+
+
+class TestSharedTrajectory:
+    """Verify the projectile animation can send its trajectory once."""
+
+    def test_frames_only_move_marker_and_vector(self):
+        """Verify frames target the position and velocity traces only."""
+        spec = animate_projectile_motion(num_frames=20, shared_trajectory=True, output="dict")
+        assert len(spec["data"][0]["x"]) == 20
+        assert all(frame["traces"] == [1, 2] for frame in spec["frames"])
+        assert all(len(frame["data"]) == 2 for frame in spec["frames"])
+
+    def test_size_is_linear_in_frames(self):
+        """Verify doubling the frame count roughly doubles the output."""
+        small = len(pio.to_json(animate_projectile_motion(num_frames=500, shared_trajectory=True, output="dict")))
+        large = len(pio.to_json(animate_projectile_motion(num_frames=1000, shared_trajectory=True, output="dict")))
+        assert large < 2.2 * small
+
+    def test_growing_trail_is_default(self):
+        """Verify the default frames still redraw the travelled path."""
+        spec = animate_projectile_motion(num_frames=5, output="dict")
+        assert "traces" not in spec["frames"][0]
+        assert len(spec["frames"][3]["data"][0]["x"]) == 4
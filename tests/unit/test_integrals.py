@@ -0,0 +1,99 @@
+"""Unit tests for the batched Riemann-sum engine."""
+
+from pathlib import Path
+
+import math
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus.integrals import RIEMANN_RULES, riemann_sum, riemann_sums
+from math_explorations.visualization.animations import animate_area_accumulation
+
+
+def _reference(f, a, b, n, rule):
+    """Textbook composite rule with an explicit loop."""
+    dx = (b - a) / n
+    total = 0.0
+    for i in range(n):
+        left, right = a + i * dx, a + (i + 1) * dx
+        mid = (left + right) / 2
+        total += {
+            "left": f(left),
+            "right": f(right),
+            "midpoint": f(mid),
+            "trapezoid": (f(left) + f(right)) / 2,
+            "simpson": (f(left) + 4 * f(mid) + f(right)) / 6,
+        }[rule]
+    return total * dx
+
+
+class TestRiemannSums:
+    """Verify the batched rules match the textbook definitions."""
+
+    @pytest.mark.parametrize("rule", RIEMANN_RULES)
+    def test_matches_reference(self, rule):
+        """Verify every rule agrees with an explicit loop for several n."""
+        counts = [1, 3, 7, 12]
+        result = riemann_sums(np.sin, 0.5, 2.5, counts, rule)
+        expected = [_reference(math.sin, 0.5, 2.5, n, rule) for n in counts]
+        np.testing.assert_allclose(result.sums, expected, rtol=1e-12)
+
+    def test_heights_give_the_sum(self):
+        """Verify each panel height times the width adds up to the estimate."""
+        result = riemann_sums(np.exp, 0, 3, [4, 9], "trapezoid")
+        for n, heights, total in zip(result.counts, result.heights, result.sums):
+            assert len(heights) == n
+            assert heights.sum() * 3 / n == pytest.approx(total)
+
+    def test_nested_counts_share_samples(self):
+        """Verify refinements by doubling reuse the coarser samples."""
+        result = riemann_sums(np.exp, 0, 1, [8, 16, 32, 64], "trapezoid")
+        assert result.evaluations == 65
+
+    def test_midpoints_are_nodes_of_doubled_count(self):
+        """Verify Simpson on n reuses no more points than the trapezoid on 2n."""
+        result = riemann_sums(np.exp, 0, 1, [10, 20], "simpson")
+        assert result.evaluations == 41
+
+    def test_convergence_order(self):
+        """Verify Simpson converges much faster than the midpoint rule."""
+        exact = math.e - 1
+        mid = riemann_sum(np.exp, 0, 1, 16, "midpoint")
+        simpson = riemann_sum(np.exp, 0, 1, 16, "simpson")
+        assert abs(simpson - exact) < abs(mid - exact) / 1000
+
+    def test_undefined_points_give_nan(self):
+        """Verify a pole at a sample point yields NaN instead of raising."""
+        assert math.isnan(riemann_sum(lambda x: 1 / x, 0, 1, 4, "left"))
+
+    def test_invalid_arguments(self):
+        """Verify unknown rules and non-positive counts are rejected."""
+        with pytest.raises(ValueError):
+            riemann_sums(np.sin, 0, 1, [4], "gauss")
+        with pytest.raises(ValueError):
+            riemann_sums(np.sin, 0, 1, [0])
+
+
+class TestAreaAccumulation:
+    """Verify the animation draws from the engine."""
+
+    def test_max_rectangles_is_reached(self):
+        """Verify the last frame uses max_rectangles bars."""
+        spec = animate_area_accumulation(np.exp, max_rectangles=10000, output="dict")
+        assert spec["frames"][-1]["name"] == "10000"
+        assert len(spec["frames"][-1]["data"][0]["y"]) == 10000
+        assert spec["frames"][-1]["traces"] == [1]
+
+    def test_default_frames_unchanged(self):
+        """Verify the default refinement keeps the original 5 to 50 rectangle steps."""
+        spec = animate_area_accumulation(math.exp, output="dict")
+        assert [frame["name"] for frame in spec["frames"]] == ["5", "8", "12", "18", "25", "35", "50"]
+
+    def test_title_reports_rule_estimate(self):
+        """Verify the frame titles show the engine's estimate."""
+        spec = animate_area_accumulation(math.exp, rule="simpson", output="dict")
+        assert spec["frames"][-1]["layout"]["title"].endswith(f"{math.e ** 3 - 1:.4f}")
@@ -0,0 +1,257 @@
+"""Unit tests for limit and numerical slope helpers."""
+
+from pathlib import Path
+
+import signal
+import time
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus import limits
+from math_explorations.calculus.limits import (
+    compute_limit,
+    clear_limit_cache,
+    limit,
+    limit_definition_derivative,
+    difference_quotient_expression,
+    richardson_slope,
+    tangent_slope,
+    secant_slopes_sequence,
+    secant_slopes_frame,
+    numerical_limit_table,
+    numerical_limit_frame,
+)
+
+
+class TestRichardsonSlope:
+    """Test the Richardson-extrapolated numerical derivative."""
+
+    def test_scalar_input_returns_floats(self):
+        """Verify a scalar point gives scalar slope and error."""
+        result = richardson_slope(np.sin, 1.0)
+        assert isinstance(result.slope, float)
+        assert result.slope == pytest.approx(np.cos(1.0), abs=1e-12)
+
+    def test_vectorized_over_array(self):
+        """Verify thousands of points are handled in one call."""
+        x = np.linspace(0.1, 10, 5000)
+        result = richardson_slope(lambda t: np.sin(t) / t, x)
+        expected = np.cos(x) / x - np.sin(x) / x**2
+        assert result.slope.shape == x.shape
+        np.testing.assert_allclose(result.slope, expected, atol=1e-10)
+
+    def test_error_estimate_bounds_actual_error(self):
+        """Verify the returned error estimate is meaningful."""
+        x = np.linspace(-3, 3, 7)
+        result = richardson_slope(np.exp, x)
+        assert np.all(np.abs(result.slope - np.exp(x)) <= 10 * result.error + 1e-15)
+
+    def test_more_accurate_than_fixed_step(self):
+        """Verify extrapolation beats the fixed-h central difference."""
+        exact = np.exp(20.0)
+        assert abs(richardson_slope(np.exp, 20.0).slope - exact) < abs(tangent_slope(np.exp, 20.0) - exact)
+
+    def test_step_adapts_near_singularity(self):
+        """Verify points close to a pole still converge."""
+        result = richardson_slope(lambda t: 1 / t, np.array([0.05, 1.0]))
+        np.testing.assert_allclose(result.slope, [-400.0, -1.0], rtol=1e-9)
+
+    def test_pole_closer_than_default_step(self):
+        """Verify a point next to a pole is resolved rather than differenced across it."""
+        x = np.array([1e-6, -1e-6, 1e-4])
+        result = richardson_slope(lambda t: 1 / t, x)
+        np.testing.assert_allclose(result.slope, -1 / x**2, rtol=1e-9)
+        assert np.all(result.error <= 1e-9 * np.abs(result.slope))
+
+    def test_unresolved_point_is_nan(self):
+        """Verify a pole closer than every step tried gives NaN, not a finite wrong slope."""
+        result = richardson_slope(lambda t: 1 / t, 1e-14)
+        assert np.isnan(result.slope)
+        assert np.isinf(result.error)
+
+    def test_large_x_stays_accurate(self):
+        """Verify the default step is capped and the error estimate stays honest far from 0."""
+        x = np.array([1e8, -1e10, 1e12])
+        result = richardson_slope(np.sin, x)
+        np.testing.assert_allclose(result.slope, np.cos(x), atol=1e-12)
+        assert np.all(np.abs(result.slope - np.cos(x)) <= 10 * result.error)
+
+    def test_outside_domain_is_nan(self):
+        """Verify points where f is undefined report NaN with infinite error."""
+        result = richardson_slope(np.sqrt, np.array([-1.0, 4.0]))
+        assert np.isnan(result.slope[0])
+        assert np.isinf(result.error[0])
+        assert result.slope[1] == pytest.approx(0.25)
+
+
+class TestColumnarTables:
+    """Test the array-native secant and limit tables."""
+
+    def test_secant_frame_matches_sequence(self):
+        """Verify the DataFrame agrees with the list-of-dicts version."""
+        f = lambda t: t**3
+        frame = secant_slopes_frame(f, 1.0)
+        rows = secant_slopes_sequence(f, 1.0)
+        np.testing.assert_allclose(frame["slope"].to_numpy(), [r["slope"] for r in rows])
+        assert frame.columns == ["h", "slope", "x1", "x2", "y1", "y2"]
+
+    def test_secant_frame_single_call(self):
+        """Verify f is evaluated once for the whole h grid."""
+        calls = []
+        def f(t):
+            calls.append(np.shape(t))
+            return np.sin(t)
+        frame = secant_slopes_frame(f, 1.0, np.logspace(-8, 0, 20_000))
+        assert frame.height == 20_000
+        assert calls == [(20_001,)]
+
+    def test_limit_frame_matches_table(self):
+        """Verify x values and directions match numerical_limit_table."""
+        f = lambda t: np.sin(t) / t
+        frame = numerical_limit_frame(f, 0.0)
+        rows = numerical_limit_table(f, 0.0)
+        np.testing.assert_allclose(frame["x"].to_numpy(), [r["x"] for r in rows])
+        assert frame["direction"].to_list() == [r["direction"] for r in rows]
+
+    def test_undefined_points_are_null(self):
+        """Verify undefined values are masked as nulls."""
+        frame = numerical_limit_frame(np.log, 0.0, offsets=[1.0, 0.1])
+        assert frame["f(x)"].null_count() == 2
+        assert frame.filter(frame["direction"] == "left")["f(x)"].is_null().all()
+
+
+def _hanging_limit(*args):
+    """Stand-in for a sympy.limit call that never finishes."""
+    time.sleep(60)
+
+
+class TestLimitService:
+    """Test the time-boxed, cached limit computation."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        """Start every test with an empty limit cache."""
+        clear_limit_cache()
+        yield
+        clear_limit_cache()
+
+    def test_symbolic_path(self):
+        """Verify ordinary limits are solved symbolically."""
+        result = compute_limit("sin(x)/x", "x", 0)
+        assert result.value == 1
+        assert result.method == "symbolic"
+        assert not result.cached
+
+    def test_results_are_cached(self):
+        """Verify a repeated query is served from the cache."""
+        compute_limit("(1 + 1/x)**x", "x", sp.oo)
+        result = compute_limit("(1 + 1/x)**x", "x", sp.oo)
+        assert result.cached
+        assert result.value == sp.E
+
+    def test_numeric_fallback_on_timeout(self, monkeypatch):
+        """Verify an exhausted budget falls back to numeric extrapolation."""
+        monkeypatch.setattr(limits, "sp_limit", _hanging_limit)
+        result = compute_limit("sin(x)/x", "x", 0, timeout=0.5)
+        assert result.method == "numeric"
+        assert float(result.value) == pytest.approx(1.0, abs=1e-12)
+        assert result.elapsed < 30
+
+    def test_numeric_fallback_detects_divergence(self, monkeypatch):
+        """Verify one-sided limits that disagree give NaN."""
+        monkeypatch.setattr(limits, "sp_limit", _hanging_limit)
+        assert compute_limit("Abs(x)/x", "x", 0, timeout=0.5).value is sp.nan
+
+    def test_timeout_without_fallback_raises(self, monkeypatch):
+        """Verify expressions with extra free symbols re-raise TimeoutError."""
+        monkeypatch.setattr(limits, "sp_limit", _hanging_limit)
+        with pytest.raises(TimeoutError):
+            compute_limit("sin(a*x)/x", "x", 0, timeout=0.5)
+
+    def test_runs_in_process_by_default(self, monkeypatch):
+        """Verify a budgeted limit does not start a worker process on the main thread."""
+        def no_worker(*args):
+            raise AssertionError("worker process started")
+        monkeypatch.setattr(limits, "run_with_timeout", no_worker)
+        assert compute_limit("(1 - cos(x))/x**2", "x", 0).value == sp.Rational(1, 2)
+
+    def test_enclosing_timer_preserved(self):
+        """Verify an in-process limit leaves an already armed itimer running."""
+        fired = []
+        previous = signal.signal(signal.SIGALRM, lambda signum, frame: fired.append(signum))
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0.5)
+            assert compute_limit("sin(x)/x", "x", 0).value == 1
+            remaining, _ = signal.getitimer(signal.ITIMER_REAL)
+            assert 0 < remaining <= 0.5
+            time.sleep(1.0)
+            assert fired == [signal.SIGALRM]
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    def test_isolate_uses_worker_process(self, monkeypatch):
+        """Verify isolate=True routes sympy.limit through run_with_timeout."""
+        calls = []
+        def worker(func, args, timeout):
+            calls.append(timeout)
+            return func(*args)
+        monkeypatch.setattr(limits, "run_with_timeout", worker)
+        assert compute_limit("sin(x)/x", "x", 0, timeout=2.0, isolate=True).value == 1
+        assert calls == [2.0]
+
+    def test_undetermined_numeric_result_not_cached(self, monkeypatch):
+        """Verify a NaN fallback is returned but not stored as a result."""
+        monkeypatch.setattr(limits, "sp_limit", _hanging_limit)
+        assert compute_limit("sin(1/x)", "x", 0, timeout=0.2).value is sp.nan
+        assert limits.limit_cache_info().currsize == 0
+
+    def test_definition_derivative_at_point_falls_back(self, monkeypatch):
+        """Verify a point is substituted so the numeric fallback can apply."""
+        monkeypatch.setattr(limits, "sp_limit", _hanging_limit)
+        value = limit_definition_derivative("x**2", "x", 3, timeout=0.0001)
+        assert float(value) == pytest.approx(6.0, abs=1e-10)
+
+    def test_public_functions_route_through_service(self):
+        """Verify limit and limit_definition_derivative use the service."""
+        assert limit("sin(x)/x", "x", 0) == 1
+        assert limit_definition_derivative("x**3") == 3 * sp.Symbol("x")**2
+        assert limits.limit_cache_info().currsize == 2
+
+
+class TestDifferenceQuotient:
+    """Test the lazy difference quotient result."""
+
+    def test_fields_computed_on_first_access(self):
+        """Verify reading latex_full does not run simplify."""
+        quotient = difference_quotient_expression("x**3 + 1")
+        quotient["latex_full"]
+        assert "simplified" not in vars(quotient)
+
+    def test_simplify_runs_once(self, monkeypatch):
+        """Verify simplified and latex_simplified share one simplify call."""
+        calls = []
+        original = sp.simplify
+        monkeypatch.setattr(sp, "simplify", lambda e: calls.append(e) or original(e))
+        quotient = difference_quotient_expression("x**4 - x")
+        assert quotient["latex_simplified"]
+        expected = sp.sympify("4*x**3 + 6*x**2*h + 4*x*h**2 + h**3 - 1")
+        assert sp.cancel(quotient["simplified"] - expected) == 0
+        assert len(calls) == 1
+
+    def test_dict_style_access(self):
+        """Verify the result still behaves like the original dict."""
+        quotient = difference_quotient_expression("x**2")
+        assert set(dict(quotient)) == {
+            "numerator", "denominator", "full", "simplified", "latex_full", "latex_simplified",
+        }
+        assert quotient["simplified"] == sp.sympify("h + 2*x")
+
+    def test_shared_across_calls(self):
+        """Verify the same expression returns the same cached object."""
+        assert difference_quotient_expression("sin(x)") is difference_quotient_expression("sin(x)")
@@ -0,0 +1,96 @@
+"""Unit tests for gradient, Jacobian and Hessian kernels."""
+
+from pathlib import Path
+
+import numpy as np
+import sympy as sp
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus import multivariable
+from math_explorations.calculus.derivatives import clear_derivative_cache, derivative_cache_info
+from math_explorations.calculus.multivariable import (
+    gradient,
+    hessian,
+    jacobian,
+    gradient_kernel,
+    hessian_kernel,
+    jacobian_kernel,
+)
+
+x, y, z = sp.symbols("x y z")
+F = sp.sin(x * y) * sp.exp(x**2 + y**2)
+
+
+class TestSymbolicMatrices:
+    """Test symbolic gradient, Jacobian and Hessian construction."""
+
+    def test_gradient_components(self):
+        """Verify each gradient component is the matching partial."""
+        grad = gradient("x**2 * y + z", ["x", "y", "z"])
+        assert list(grad) == [2 * x * y, x**2, 1]
+
+    def test_jacobian_shape_and_entries(self):
+        """Verify the Jacobian has one row per expression."""
+        jac = jacobian(["x*y", "x + z**2"], [x, y, z])
+        assert jac.shape == (2, 3)
+        assert jac[1, 2] == 2 * z
+
+    def test_hessian_matches_sympy(self):
+        """Verify the Hessian agrees with sympy.hessian."""
+        expected = sp.hessian(F, (x, y))
+        assert sp.simplify(hessian(F, [x, y]) - expected) == sp.zeros(2, 2)
+
+    def test_derivative_cache_untouched(self):
+        """Verify matrix entries are not stored in the single-derivative cache."""
+        clear_derivative_cache()
+        hessian(F, [x, y, z])
+        jacobian(["x*y", "sin(x + z)"], [x, y, z])
+        assert derivative_cache_info().currsize == 0
+
+    def test_timed_strategy_uses_one_worker(self, monkeypatch):
+        """Verify the whole matrix is simplified in a single worker call."""
+        calls = []
+        def worker(func, args, timeout):
+            calls.append(len(args[0]))
+            return func(*args)
+        monkeypatch.setattr(multivariable, "run_with_timeout", worker)
+        result = hessian(F, [x, y], strategy="timed")
+        assert len(calls) == 1
+        assert sp.simplify(result - sp.hessian(F, (x, y))) == sp.zeros(2, 2)
+
+    def test_strategy_none_keeps_raw_derivatives(self):
+        """Verify 'none' returns the unsimplified partials."""
+        assert list(gradient("x**2 * y", [x, y], strategy="none")) == [2 * x * y, x**2]
+
+
+class TestDerivativeKernels:
+    """Test fused NumPy kernels built with common-subexpression elimination."""
+
+    def test_hessian_kernel_shape(self):
+        """Verify all components come back from one call over a grid."""
+        X, Y = np.meshgrid(np.linspace(-1, 1, 3), np.linspace(-1, 1, 4))
+        values = hessian_kernel(F, [x, y])(X, Y)
+        assert values.shape == (2, 2, 4, 3)
+        np.testing.assert_allclose(values[0, 1], values[1, 0])
+
+    def test_kernel_matches_individual_lambdify(self):
+        """Verify the fused kernel agrees with per-component callables."""
+        kernel = hessian_kernel(F, [x, y])
+        expected = sp.lambdify((x, y), sp.hessian(F, (x, y)), "numpy")(0.5, -0.3)
+        np.testing.assert_allclose(kernel(0.5, -0.3), expected)
+
+    def test_shared_subexpressions_extracted(self):
+        """Verify cse finds subexpressions shared across components."""
+        assert hessian_kernel(F, [x, y]).num_subexpressions > 0
+
+    def test_constant_components_broadcast(self):
+        """Verify constant partials are broadcast to the grid shape."""
+        values = gradient_kernel("x**2 + y", [x, y])(np.arange(3.0), 1.0)
+        np.testing.assert_allclose(values, [[0, 2, 4], [1, 1, 1]])
+
+    def test_jacobian_kernel(self):
+        """Verify Jacobian kernels evaluate a vector field's derivatives."""
+        values = jacobian_kernel(["x*y", "x + y**2"], [x, y])(2.0, 3.0)
+        np.testing.assert_allclose(values, [[3, 2], [1, 6]])
@@ -0,0 +1,60 @@
+"""Unit tests for the shared string parsing layer."""
+
+from pathlib import Path
+
+import pytest
+import sympy as sp
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.calculus import parsing
+from math_explorations.calculus.parsing import (
+    as_expr,
+    as_symbol,
+    parse_cache_info,
+    clear_parse_cache,
+)
+from math_explorations.calculus.limits import limit
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test with empty interning tables."""
+    clear_parse_cache()
+    yield
+    clear_parse_cache()
+
+
+class TestParsing:
+    """Test interning of parsed strings and symbols."""
+
+    def test_same_string_returns_same_object(self):
+        """Verify repeated parses return the interned expression."""
+        assert as_expr("sin(x)**2 + 1") is as_expr("sin(x)**2 + 1")
+        info = parse_cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_non_strings_pass_through(self):
+        """Verify SymPy inputs are returned unchanged."""
+        expr = sp.cos(sp.Symbol("x"))
+        assert as_expr(expr) is expr
+        assert parse_cache_info().misses == 0
+
+    def test_symbols_are_interned(self):
+        """Verify symbol names map to a single Symbol instance."""
+        assert as_symbol("t") is as_symbol("t")
+        assert as_symbol("t") == sp.Symbol("t")
+
+    def test_size_cap(self, monkeypatch):
+        """Verify the interning table is bounded."""
+        monkeypatch.setattr(parsing, "_expr_cache", parsing.LRUCache(2))
+        for text in ("x", "x + 1", "x + 2"):
+            as_expr(text)
+        assert parse_cache_info().currsize == 2
+
+    def test_limits_module_uses_parse_layer(self):
+        """Verify string inputs to limits.py go through the interning table."""
+        limit("sin(x)/x", "x", 0)
+        limit("sin(x)/x", "x", 0)
+        assert parse_cache_info().hits >= 1
@@ -0,0 +1,99 @@
+"""Unit tests for adaptive sampling and the function plot builders."""
+
+from pathlib import Path
+
+import math
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization.sampling import adaptive_sample
+from math_explorations.visualization.function_plots import (
+    plot_function,
+    plot_derivative_comparison,
+    plot_tangent_line,
+    plot_secant_line,
+    plot_multiple_functions,
+)
+
+
+class TestAdaptiveSample:
+    """Verify curvature refinement, budgets and discontinuity breaks."""
+
+    def test_straight_line_needs_few_points(self):
+        """Verify a linear function is not refined past the first pass."""
+        x, y = adaptive_sample(lambda x: 2 * x + 1, (-5, 5), max_points=500)
+        assert len(x) < 100
+        np.testing.assert_allclose(y, 2 * x + 1)
+
+    def test_points_cluster_where_curvature_is_high(self):
+        """Verify a narrow peak receives more points than the flat tails."""
+        x, _ = adaptive_sample(lambda x: np.exp(-100 * x**2), (-5, 5), max_points=500)
+        assert np.sum(np.abs(x) < 0.5) > np.sum(np.abs(x) > 2.5)
+
+    def test_budget_is_respected(self):
+        """Verify the sampler never returns more than max_points."""
+        x, y = adaptive_sample(np.tan, (-10, 10), max_points=120)
+        assert len(x) <= 120
+        assert np.all(np.diff(x) > 0)
+
+    def test_jump_discontinuity_is_broken(self):
+        """Verify a NaN separator is inserted at each jump of floor."""
+        x, y = adaptive_sample(np.floor, (-2.5, 2.5), max_points=500)
+        breaks = x[np.isnan(y)]
+        np.testing.assert_allclose(breaks, [-2, -1, 0, 1, 2], atol=1e-3)
+
+    def test_pole_is_broken(self):
+        """Verify the line is broken at the asymptotes of tan."""
+        x, y = adaptive_sample(np.tan, (-3, 3), max_points=500)
+        breaks = x[np.isnan(y)]
+        np.testing.assert_allclose(breaks, [-np.pi / 2, np.pi / 2], atol=1e-3)
+
+    def test_poles_broken_when_budget_runs_out(self):
+        """Verify every pole is broken with the default budget, before max_depth is reached."""
+        x, y = adaptive_sample(np.tan, (-5, 5))
+        assert len(x) <= 500
+        breaks = x[np.isnan(y)]
+        np.testing.assert_allclose(breaks, np.pi * np.array([-1.5, -0.5, 0.5, 1.5]), atol=1e-3)
+
+    def test_steep_continuous_curve_not_broken(self):
+        """Verify unresolved but continuous oscillations keep their line and budget."""
+        x, y = adaptive_sample(lambda x: np.sin(50 * x), (-5, 5))
+        assert not np.isnan(y).any()
+        assert len(x) == 500
+
+    def test_scalar_function(self):
+        """Verify functions that only accept floats are evaluated per point."""
+        x, y = adaptive_sample(math.sin, (0, 6), max_points=200)
+        np.testing.assert_allclose(y, np.sin(x))
+
+
+class TestFunctionPlots:
+    """Verify every builder accepts adaptive sampling."""
+
+    def test_plot_function_uses_fewer_points(self):
+        """Verify adaptive sampling emits fewer points than the uniform grid."""
+        uniform = plot_function(np.sin, num_points=500)
+        adaptive = plot_function(np.sin, num_points=500, adaptive=True)
+        assert len(adaptive.data[0].x) < len(uniform.data[0].x) == 500
+
+    def test_title_and_theme_are_applied(self):
+        """Verify the title is set alongside the dark template."""
+        fig = plot_function(np.sin, title="Sine")
+        assert fig.layout.title.text == "Sine"
+        assert fig.layout.template.layout.title.x == 0.5
+
+    @pytest.mark.parametrize("build", [
+        lambda: plot_derivative_comparison(np.sin, np.cos, adaptive=True),
+        lambda: plot_tangent_line(math.sin, math.cos, 1.0, adaptive=True),
+        lambda: plot_secant_line(math.sin, 0.0, 1.0, adaptive=True),
+        lambda: plot_multiple_functions([(np.sin, "sin"), (np.cos, "cos")], adaptive=True),
+    ])
+    def test_builders_accept_adaptive(self, build):
+        """Verify each builder produces a sorted curve with adaptive sampling."""
+        fig = build()
+        assert np.all(np.diff(fig.data[0].x) > 0)
+        assert len(fig.data[0].x) <= 500
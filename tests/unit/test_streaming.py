@@ -0,0 +1,114 @@
+"""Unit tests for lazy frames and streaming figure serialization."""
+
+from pathlib import Path
+
+import io
+import json
+import math
+import tracemalloc
+
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization.figure_spec import FigureSpec, resolve_template
+from math_explorations.visualization.frames import FrameSource, compile_frames
+from math_explorations.visualization.streaming import iter_json, write_html, write_json
+from math_explorations.visualization.animations import (
+    animate_limit_process,
+    animate_power_rule,
+    animate_projectile_motion,
+    animate_area_accumulation,
+)
+
+
+class _CountingSink:
+    """Writable that only counts characters."""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, text):
+        self.size += len(text)
+
+
+class TestFrameSource:
+    """Verify frame sources are lazy and re-iterable."""
+
+    def test_reiterable(self):
+        """Verify every iteration calls the factory again."""
+        calls = []
+
+        def frames():
+            calls.append(1)
+            yield {"name": "0", "data": []}
+
+        source = FrameSource(frames, 1)
+        assert list(source) == list(source)
+        assert len(calls) == 2
+        assert len(source) == 1
+
+    def test_compile_frames_stays_lazy(self):
+        """Verify compiling a source returns a source with the same deltas."""
+        base = [{"type": "scatter", "x": [0, 1], "y": [0, 0]}]
+        frames = [{"name": str(k), "data": [{"type": "scatter", "x": [0, 1], "y": [0, k]}]} for k in range(3)]
+        compiled = compile_frames(base, FrameSource(lambda: iter(frames), 3))
+        assert isinstance(compiled, FrameSource)
+        assert list(compiled) == compile_frames(base, frames)
+
+
+class TestStreaming:
+    """Verify streamed output matches the materialized figure."""
+
+    BUILDERS = {
+        "limit": lambda **kw: animate_limit_process(math.sin, math.cos, 1.0, num_frames=10, **kw),
+        "power": lambda **kw: animate_power_rule(**kw),
+        "projectile": lambda **kw: animate_projectile_motion(num_frames=10, **kw),
+        "area": lambda **kw: animate_area_accumulation(math.exp, **kw),
+    }
+
+    def test_json_matches_dict_output(self):
+        """Verify iter_json concatenates to output='dict' with the template embedded."""
+        for build in self.BUILDERS.values():
+            streamed = json.loads("".join(iter_json(build(output="spec"))))
+            spec = build(output="dict")
+            spec["layout"] = resolve_template(spec["layout"])
+            expected = json.loads(to_json_plotly(spec))
+            assert streamed == expected
+
+    def test_binary_encoding(self):
+        """Verify the builder's encoding is applied to streamed frames."""
+        spec = animate_projectile_motion(num_frames=10, output="spec", encoding="binary")
+        buffer = io.StringIO()
+        write_json(spec, buffer)
+        figure = json.loads(buffer.getvalue())
+        assert "bdata" in figure["frames"][9]["data"][0]["x"]
+        go.Figure(figure)
+
+    def test_html_contains_frames(self, tmp_path):
+        """Verify the HTML page holds every frame and loads them once."""
+        path = tmp_path / "limit.html"
+        write_html(self.BUILDERS["limit"](output="spec"), path, include_plotlyjs="cdn")
+        html = path.read_text()
+        assert html.count("Plotly.addFrames") == 1
+        assert '"name":"9"' in html
+        assert "streamed-frames" not in html
+
+    def test_peak_memory_is_flat(self):
+        """Verify frames are not held together: peak memory stays far below the output size."""
+        spec = animate_projectile_motion(num_frames=2000, output="spec")
+        sink = _CountingSink()
+        tracemalloc.start()
+        write_json(spec, sink)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert sink.size > 50_000_000
+        assert peak < sink.size / 100
+
+    def test_spec_output_is_unbuilt(self):
+        """Verify output='spec' returns the FigureSpec without running frames."""
+        spec = animate_power_rule(output="spec")
+        assert isinstance(spec, FigureSpec)
+        assert isinstance(spec.frames, FrameSource)
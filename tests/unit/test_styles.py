@@ -0,0 +1,61 @@
+"""Unit tests for the shared dark theme template."""
+
+from pathlib import Path
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from math_explorations.visualization.styles import (
+    DARK_THEME,
+    TEMPLATE_NAME,
+    apply_dark_theme,
+    register_dark_template,
+)
+from math_explorations.visualization.function_plots import plot_function
+from math_explorations.visualization.animations import animate_power_rule
+
+
+class TestDarkTemplate:
+    """Verify DARK_THEME is registered once and referenced by the builders."""
+
+    def test_template_is_registered(self):
+        """Verify the template exists and carries the theme colors."""
+        assert TEMPLATE_NAME in pio.templates
+        template = pio.templates[TEMPLATE_NAME]
+        assert template.layout.paper_bgcolor == DARK_THEME["paper_bgcolor"]
+
+    def test_registration_is_idempotent(self):
+        """Verify registering again keeps the same template object."""
+        template = pio.templates[TEMPLATE_NAME]
+        assert register_dark_template() == TEMPLATE_NAME
+        assert pio.templates[TEMPLATE_NAME] is template
+
+    def test_builders_use_template(self):
+        """Verify builders style through the template, not inline layout."""
+        for fig in (plot_function(np.sin), animate_power_rule(max_n=2)):
+            assert fig.layout.template.layout.plot_bgcolor == DARK_THEME["plot_bgcolor"]
+            assert fig.layout.paper_bgcolor is None
+
+    def test_apply_dark_theme(self):
+        """Verify apply_dark_theme sets the template on an existing figure."""
+        fig = apply_dark_theme(go.Figure())
+        assert fig.layout.template.layout.paper_bgcolor == DARK_THEME["paper_bgcolor"]
+
+    def test_inherits_plotly_defaults(self):
+        """Verify the theme is layered on Plotly's default template."""
+        template = pio.templates[TEMPLATE_NAME]
+        default = pio.templates["plotly"]
+        assert template.layout.xaxis.automargin is True
+        assert template.layout.colorway == default.layout.colorway
+        assert template.data.scatter == default.data.scatter
+        assert template.layout.margin.l == DARK_THEME["margin"]["l"]
+
+    def test_builders_keep_inherited_properties(self):
+        """Verify built figures see inherited defaults such as axis automargin."""
+        fig = plot_function(np.sin)
+        assert fig.layout.template.layout.xaxis.automargin is True
+        assert fig.layout.template.layout.hovermode == pio.templates["plotly"].layout.hovermode